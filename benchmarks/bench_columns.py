@@ -0,0 +1,51 @@
+"""
+Compare list-backed and columnar ``MealList`` instances on large filter results.
+
+Usage::
+
+    python benchmarks/bench_columns.py [--meals 200000] [--repeat 5]
+"""
+import argparse
+import json
+import time
+
+from bench_memory import retained_bytes
+from fixtures import make_summary_payload
+from py_mealdb.models import MealList
+
+
+def best_of(repeat, func):
+    """Return the fastest of ``repeat`` timings of ``func()`` in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--meals', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    payload = make_summary_payload(args.meals)
+    list_bytes, lists = retained_bytes(lambda: MealList.from_response(json.loads(payload)))
+    column_bytes, columns = retained_bytes(lambda: MealList.from_response(json.loads(payload)).columnar())
+    half = [MealList(items=lists.items[::2]), MealList(items=lists.items[::3])]
+    half_columns = [other.columnar() for other in half]
+
+    print(f'{args.meals} meal summaries')
+    print(f'  memory     : list {list_bytes / 2**20:7.1f} MiB  columnar {column_bytes / 2**20:7.1f} MiB')
+    for label, run in (
+        ('ids', lambda meals, parts: (meals.ids, meals.names)),
+        ('intersect', lambda meals, parts: MealList.intersect([meals, *parts]).ids),
+        ('union', lambda meals, parts: MealList.union(parts).ids),
+    ):
+        list_ms = best_of(args.repeat, lambda: run(lists, half))
+        column_ms = best_of(args.repeat, lambda: run(columns, half_columns))
+        print(f'  {label:10} : list {list_ms:7.1f} ms  columnar {column_ms:7.1f} ms')
+
+if __name__ == '__main__':
+    main()
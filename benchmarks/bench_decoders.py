@@ -0,0 +1,55 @@
+"""
+Compare the installed JSON decoder backends on large synthetic responses.
+
+Each run decodes a ``search.php``-shaped and a ``filter.php``-shaped body and builds
+the model, reading ``.ids`` and ``.names`` so every item is touched.
+
+Usage::
+
+    python benchmarks/bench_decoders.py [--meals 5000] [--repeat 5]
+"""
+import argparse
+import time
+
+from fixtures import make_details_payload, make_summary_payload
+from py_mealdb.decoders import available_decoders, get_decoder
+from py_mealdb.models import MealDetails, MealList
+
+
+def best_of(repeat, func):
+    """Return the fastest of ``repeat`` timings of ``func()`` in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--meals', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = {
+        'details': (MealDetails, make_details_payload(args.meals)),
+        'summary': (MealList, make_summary_payload(args.meals * 4)),
+    }
+    for label, (model, content) in payloads.items():
+        print(f'{label}: {len(content) / 2**20:.1f} MiB')
+        baseline = None
+        for name in available_decoders():
+            decoder = get_decoder(name)
+
+            def run():
+                result = model.from_response(decoder.decode(content, model))
+                return result.ids, result.names
+
+            elapsed = best_of(args.repeat, run)
+            baseline = baseline or elapsed
+            print(f'  {name:8}: {elapsed:8.1f} ms  ({baseline / elapsed:4.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
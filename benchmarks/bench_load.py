@@ -0,0 +1,265 @@
+"""
+Load test: lookups per second one worker sustains with each client configuration.
+
+N virtual users call a weighted mix of ``search.php``, ``lookup.php`` and
+``filter.php`` for ``--duration`` seconds against a local ``StandInServer``
+(see ``py_mealdb.testing``), once per client configuration. The server runs in
+a child process so it does not compete with the clients for the GIL.
+
+- ``percall``: a new client per call, the cost of the old per-call ``httpx.get`` path
+- ``pooled``: one shared ``MealDB`` with a keep-alive pool sized to the users
+- ``async``: one ``AsyncMealDB`` with a task per user
+- ``cached``: the pooled client with a ``MemoryCache``
+
+Each run reports throughput, error count and p50/p95/p99 latency per call, plus
+the requests that reached the server. Results are written as JSON so runs can be
+tracked over time.
+
+Usage::
+
+    python benchmarks/bench_load.py [--users 16] [--duration 5] [--mix search=1,lookup=4,filter=2]
+    python benchmarks/bench_load.py --latency 0.02 --error-rate 0.01 --clients pooled,async
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+
+import httpx
+
+from fixtures import make_meal
+from py_mealdb import AsyncMealDB, MealDB
+from py_mealdb.cache import MemoryCache
+from py_mealdb.offline import OfflineMealDB
+from py_mealdb.testing import RedirectTransport, StandInServer
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+API_KEY = '1'
+CLIENTS = ('percall', 'pooled', 'async', 'cached')
+
+
+def package_version():
+    """Return the installed py-mealdb version, or 'unknown'."""
+    try:
+        return version('py-mealdb')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def parse_mix(text):
+    """Parse ``'search=1,lookup=4'`` into ``{'search': 1.0, 'lookup': 4.0}``."""
+    mix = {}
+    for part in text.split(','):
+        kind, _, weight = part.partition('=')
+        if kind not in ('search', 'lookup', 'filter'):
+            raise argparse.ArgumentTypeError(f'unknown call type: {kind!r}')
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+class Workload:
+    """Draws ``(method name, argument)`` calls from a catalog according to a mix."""
+
+    def __init__(self, catalog, mix):
+        self.kinds = list(mix)
+        self.weights = list(mix.values())
+        self.ids = list(catalog.meals)
+        self.names = [meal['strMeal'] for meal in catalog.meals.values()]
+        self.filters = [
+            ('filter_by_ingredient', catalog.list_all_ingredients().ingredients),
+            ('filter_by_category', catalog.list_all_categories().categories),
+            ('filter_by_area', catalog.list_all_areas().areas),
+        ]
+
+    def next(self, rng):
+        kind = rng.choices(self.kinds, self.weights)[0]
+        if kind == 'search':
+            return 'get_meal_by_name', rng.choice(self.names)
+        if kind == 'lookup':
+            return 'meal_details_by_id', rng.choice(self.ids)
+        method, values = rng.choice(self.filters)
+        return method, rng.choice(values)
+
+
+def summarize(latencies, errors, elapsed):
+    """Return throughput and latency percentiles (nearest rank) for one run."""
+    latencies.sort()
+
+    def percentile(p):
+        if not latencies:
+            return None
+        return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000, 3)
+
+    return {
+        'calls': len(latencies),
+        'errors': errors,
+        'elapsed_s': round(elapsed, 3),
+        'calls_per_s': round(len(latencies) / elapsed, 1),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else None,
+        'p50_ms': percentile(50),
+        'p95_ms': percentile(95),
+        'p99_ms': percentile(99),
+    }
+
+
+def run_threads(call, workload, users, duration, seed):
+    """Run ``users`` threads calling ``call(method, arg)`` until ``duration`` elapses."""
+    deadline = time.perf_counter() + duration
+
+    def user(index):
+        rng = random.Random(seed + index)
+        latencies, errors = [], 0
+        while time.perf_counter() < deadline:
+            method, arg = workload.next(rng)
+            start = time.perf_counter()
+            try:
+                call(method, arg)
+            except httpx.HTTPError:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+        return latencies, errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(users) as pool:
+        results = list(pool.map(user, range(users)))
+    elapsed = time.perf_counter() - started
+    return [x for latencies, _ in results for x in latencies], sum(errors for _, errors in results), elapsed
+
+
+async def run_tasks(meal_db, workload, users, duration, seed):
+    """Async counterpart of ``run_threads`` with one task per user."""
+    deadline = time.perf_counter() + duration
+
+    async def user(index):
+        rng = random.Random(seed + index)
+        latencies, errors = [], 0
+        while time.perf_counter() < deadline:
+            method, arg = workload.next(rng)
+            start = time.perf_counter()
+            try:
+                await getattr(meal_db, method)(arg)
+            except httpx.HTTPError:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+        return latencies, errors
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(user(i) for i in range(users)))
+    elapsed = time.perf_counter() - started
+    return [x for latencies, _ in results for x in latencies], sum(errors for _, errors in results), elapsed
+
+
+def run_client(name, url, workload, users, duration, seed):
+    """Run the load test for one client configuration against the server at ``url``."""
+    if name == 'percall':
+        def call(method, arg):
+            # A fresh client and transport per call, as ``httpx.get`` builds internally.
+            with MealDB(API_KEY, transport=RedirectTransport(url, httpx.HTTPTransport())) as meal_db:
+                return getattr(meal_db, method)(arg)
+        return run_threads(call, workload, users, duration, seed)
+
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    if name == 'async':
+        async def main():
+            transport = RedirectTransport(url, httpx.AsyncHTTPTransport(limits=limits))
+            async with AsyncMealDB(API_KEY, transport=transport) as meal_db:
+                return await run_tasks(meal_db, workload, users, duration, seed)
+        return asyncio.run(main())
+
+    cache = MemoryCache() if name == 'cached' else None
+    with MealDB(API_KEY, transport=RedirectTransport(url, httpx.HTTPTransport(limits=limits)), cache=cache) as meal_db:
+        return run_threads(lambda method, arg: getattr(meal_db, method)(arg), workload, users, duration, seed)
+
+
+def serve(meals, latency, error_rate, seed, conn):
+    """Child process: run a ``StandInServer`` and report (then reset) its request count on demand."""
+    with StandInServer(meals, latency=latency, error_rate=error_rate, seed=seed) as server:
+        conn.send(server.url)
+        while conn.recv() != 'stop':
+            conn.send(server.requests)
+            server.requests = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, default=16, help='Concurrent virtual users.')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds to run each client.')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('search=1,lookup=4,filter=2'),
+                        help='Weighted call mix, e.g. search=1,lookup=4,filter=2.')
+    parser.add_argument('--clients', default=','.join(CLIENTS), help=f'Comma-separated subset of {", ".join(CLIENTS)}.')
+    parser.add_argument('--meals', type=int, default=500, help='Generated meals in the catalog.')
+    parser.add_argument('--snapshot', help='Serve a crawled JSONL snapshot instead of generated meals.')
+    parser.add_argument('--latency', type=float, default=0.005, help='Server latency per request in seconds.')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Where to write the JSON results '
+                                         '(default: results/load-<version>-<timestamp>.json).')
+    args = parser.parse_args()
+
+    clients = args.clients.split(',')
+    unknown = set(clients) - set(CLIENTS)
+    if unknown:
+        parser.error(f'unknown clients: {", ".join(sorted(unknown))}')
+
+    if args.snapshot:
+        catalog = OfflineMealDB.from_snapshot(args.snapshot)
+    else:
+        rng = random.Random(args.seed)
+        catalog = OfflineMealDB(make_meal(i, rng) for i in range(args.meals))
+    workload = Workload(catalog, args.mix)
+
+    results = {}
+    print(f'{len(catalog)} meals, {args.users} users, {args.duration:g}s per client, '
+          f'{args.latency * 1000:g} ms server latency')
+    conn, child_conn = multiprocessing.Pipe()
+    server = multiprocessing.Process(
+        target=serve,
+        args=(list(catalog.meals.values()), args.latency, args.error_rate, args.seed, child_conn),
+        daemon=True,
+    )
+    server.start()
+    try:
+        url = conn.recv()
+        for name in clients:
+            latencies, errors, elapsed = run_client(name, url, workload, args.users, args.duration, args.seed)
+            conn.send('requests')
+            results[name] = {**summarize(latencies, errors, elapsed), 'server_requests': conn.recv()}
+            r = results[name]
+            print(f"  {name:8} {r['calls_per_s']:9.1f} calls/s  p50 {r['p50_ms']} ms  p95 {r['p95_ms']} ms  "
+                  f"p99 {r['p99_ms']} ms  errors {r['errors']}  server requests {r['server_requests']}")
+    finally:
+        conn.send('stop')
+        server.join()
+
+    report = {
+        'version': package_version(),
+        'python': platform.python_version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'params': {
+            'users': args.users, 'duration': args.duration, 'mix': args.mix, 'meals': len(catalog),
+            'latency': args.latency, 'error_rate': args.error_rate, 'seed': args.seed,
+        },
+        'results': results,
+    }
+    # Timestamped by default so a run never replaces a stored result such as load-1.0.0.json.
+    stamp = time.strftime('%Y%m%dT%H%M%S')
+    output = args.output or os.path.join(RESULTS_DIR, f"load-{report['version']}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f'\nWrote {output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
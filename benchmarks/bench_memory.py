@@ -0,0 +1,46 @@
+"""
+Compare the memory footprint of raw meal dictionaries and ``Meal`` records.
+
+Usage::
+
+    python benchmarks/bench_memory.py [--meals 20000]
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from fixtures import make_details_payload
+from py_mealdb.models import MealDetails
+
+
+def retained_bytes(build):
+    """Return the memory still allocated by ``build()``'s result after it returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--meals', type=int, default=20000)
+    args = parser.parse_args()
+
+    payload = make_details_payload(args.meals)
+    dict_bytes, dicts = retained_bytes(lambda: MealDetails.from_response(json.loads(payload)))
+    del dicts
+    meal_bytes, meals = retained_bytes(lambda: MealDetails.from_response(json.loads(payload)).to_meals())
+    del meals
+
+    print(f'{args.meals} meals')
+    print(f'  raw dicts    : {dict_bytes / 2**20:8.1f} MiB  ({dict_bytes / args.meals:7.0f} B/meal)')
+    print(f'  Meal records : {meal_bytes / 2**20:8.1f} MiB  ({meal_bytes / args.meals:7.0f} B/meal)')
+    print(f'  ratio        : {dict_bytes / meal_bytes:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Micro-benchmarks for the model hot paths in ``py_mealdb.models``.
+
+Every case runs on generated payloads (see ``fixtures.py``) with no network. Each
+result records the best and mean wall time over ``--repeat`` runs and the peak
+memory allocated by one run. Results are written as JSON so two runs (e.g. the
+last release and a branch) can be compared; ``--compare`` exits with status 1
+if any case got slower than ``--threshold``.
+
+Usage::
+
+    python benchmarks/bench_models.py [--meals 2000] [--summaries 20000] [--repeat 7]
+    python benchmarks/bench_models.py --compare results/models-1.0.0.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from importlib.metadata import PackageNotFoundError, version
+
+from fixtures import make_details_payload, make_summary_payload
+from py_mealdb.models import MealDetails, MealList
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def package_version():
+    """Return the installed py-mealdb version, or 'unknown'."""
+    try:
+        return version('py-mealdb')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def measure(func, repeat):
+    """Time ``func()`` ``repeat`` times and trace the peak memory of one extra run."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'best_ms': round(min(timings), 3),
+        'mean_ms': round(sum(timings) / len(timings), 3),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def build_cases(meals, summaries):
+    """Return ``{name: callable}`` for every benchmarked hot path."""
+    details_raw = make_details_payload(meals)
+    summary_raw = make_summary_payload(summaries)
+    details_data = json.loads(details_raw)
+    summary_data = json.loads(summary_raw)
+    details = MealDetails.from_response(details_data)
+    summary = MealList.from_response(summary_data)
+    columnar = summary.columnar()
+    indexes = range(len(details))
+
+    return {
+        'details.loads+from_response': lambda: MealDetails.from_response(json.loads(details_raw)),
+        'details.from_bytes.ids': lambda: MealDetails.from_bytes(details_raw).ids,
+        'details.get_ingredients(all)': lambda: [details.get_ingredients(i) for i in indexes],
+        'details.get_tags(all)': lambda: [details.get_tags(i) for i in indexes],
+        'details.to_meals': details.to_meals,
+        'details.iterate': lambda: sum(1 for _ in details),
+        'summary.ids+names': lambda: (summary.ids, summary.names),
+        'summary.from_bytes.ids+names': lambda: (lambda lazy: (lazy.ids, lazy.names))(MealList.from_bytes(summary_raw)),
+        'summary.columnar()': summary.columnar,
+        'summary.columnar.ids+names': lambda: (columnar.ids, columnar.names),
+        'summary.iterate': lambda: sum(1 for _ in summary),
+        'summary.intersect': lambda: MealList.intersect([summary, MealList(items=summary.items[::3])]),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print the change against ``baseline`` and return the names of regressed cases."""
+    regressed = []
+    print(f"\nvs {baseline['version']} ({baseline['timestamp']}):")
+    for name, result in results.items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        ratio = result['best_ms'] / before['best_ms'] if before['best_ms'] else 1.0
+        flag = '  REGRESSION' if ratio > threshold else ''
+        print(f'  {name:32} {ratio:6.2f}x{flag}')
+        if flag:
+            regressed.append(name)
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--meals', type=int, default=2000, help='Full meals in the details payload.')
+    parser.add_argument('--summaries', type=int, default=20000, help='Items in the filter payload.')
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--output', help='Where to write the JSON results '
+                                         '(default: results/models-<version>-<timestamp>.json).')
+    parser.add_argument('--compare', help='Earlier results file to compare against.')
+    parser.add_argument('--threshold', type=float, default=1.2, help='Slowdown ratio reported as a regression.')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        if args.output and os.path.abspath(args.output) == os.path.abspath(args.compare):
+            parser.error('--output must not overwrite the --compare baseline')
+        # Read the baseline up front, before anything is written.
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+
+    results = {}
+    print(f'{args.meals} meals, {args.summaries} summaries, best of {args.repeat}')
+    for name, func in build_cases(args.meals, args.summaries).items():
+        results[name] = measure(func, args.repeat)
+        print(f"  {name:32} {results[name]['best_ms']:9.2f} ms  {results[name]['peak_kib']:10.1f} KiB peak")
+
+    report = {
+        'version': package_version(),
+        'python': platform.python_version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'params': {'meals': args.meals, 'summaries': args.summaries, 'repeat': args.repeat},
+        'results': results,
+    }
+    # Timestamped by default so a run never replaces a stored baseline such as models-1.0.0.json.
+    stamp = time.strftime('%Y%m%dT%H%M%S')
+    output = args.output or os.path.join(RESULTS_DIR, f"models-{report['version']}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f'\nWrote {output}')
+
+    if baseline is not None:
+        if baseline['params'] != report['params']:
+            print('warning: baseline was run with different parameters', file=sys.stderr)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
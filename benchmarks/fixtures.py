@@ -0,0 +1,60 @@
+"""
+Synthetic TheMealDB payloads for benchmarks.
+
+The generated meals have the same shape as ``search.php``/``lookup.php`` results:
+about 50 keys per meal with 20 ingredient and 20 measure slots, most of them empty.
+"""
+import json
+import random
+
+CATEGORIES = ['Beef', 'Chicken', 'Dessert', 'Lamb', 'Miscellaneous', 'Pasta', 'Pork',
+              'Seafood', 'Side', 'Starter', 'Vegan', 'Vegetarian', 'Breakfast', 'Goat']
+AREAS = ['American', 'British', 'Canadian', 'Chinese', 'Croatian', 'Dutch', 'Egyptian',
+         'French', 'Greek', 'Indian', 'Irish', 'Italian', 'Jamaican', 'Japanese', 'Mexican']
+INGREDIENTS = ['Chicken', 'Salmon', 'Beef', 'Pork', 'Garlic', 'Onion', 'Olive Oil', 'Butter',
+               'Salt', 'Pepper', 'Tomatoes', 'Basil', 'Parmesan', 'Eggs', 'Flour', 'Sugar',
+               'Milk', 'Rice', 'Lemon', 'Ginger', 'Soy Sauce', 'Carrots', 'Potatoes', 'Cumin']
+MEASURES = ['1 tsp', '2 tbs', '100g', '1 cup', 'pinch', '2 cloves', '1/2 cup', 'to taste', '250ml']
+TAGS = ['Meat', 'Casserole', 'Pasta', 'Curry', 'Baking', 'Spicy', 'Summer', 'Vegan']
+
+
+def make_meal(index: int, rng: random.Random) -> dict:
+    """Return one synthetic full meal dictionary."""
+    meal = {
+        'idMeal': str(50000 + index),
+        'strMeal': f'Meal number {index}',
+        'strMealAlternate': None,
+        'strDrinkAlternate': None,
+        'strCategory': rng.choice(CATEGORIES),
+        'strArea': rng.choice(AREAS),
+        'strInstructions': ' '.join(f'Step {i}: stir well and cook for {rng.randint(1, 30)} minutes.' for i in range(8)),
+        'strMealThumb': f'https://www.themealdb.com/images/media/meals/{index}.jpg',
+        'strTags': ','.join(rng.sample(TAGS, rng.randint(0, 3))) or None,
+        'strYoutube': f'https://www.youtube.com/watch?v={index}',
+        'strSource': None,
+        'strImageSource': None,
+        'strCreativeCommonsConfirmed': None,
+        'dateModified': None,
+    }
+    used = rng.randint(5, 14)
+    for i in range(1, 21):
+        meal[f'strIngredient{i}'] = rng.choice(INGREDIENTS) if i <= used else ''
+    for i in range(1, 21):
+        meal[f'strMeasure{i}'] = rng.choice(MEASURES) if i <= used else ' '
+    return meal
+
+
+def make_details_payload(count: int, seed: int = 0) -> bytes:
+    """Return a ``{"meals": [...]}`` JSON body with ``count`` full meals."""
+    rng = random.Random(seed)
+    return json.dumps({'meals': [make_meal(i, rng) for i in range(count)]}).encode()
+
+
+def make_summary_payload(count: int, seed: int = 0) -> bytes:
+    """Return a ``filter.php``-style JSON body with ``count`` meal summaries."""
+    return json.dumps({'meals': [
+        {'strMeal': f'Meal number {i}',
+         'strMealThumb': f'https://www.themealdb.com/images/media/meals/{i}.jpg',
+         'idMeal': str(50000 + i)}
+        for i in range(count)
+    ]}).encode()
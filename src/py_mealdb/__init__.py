@@ -15,9 +15,13 @@ Python client for TheMealDB API.
 This module provides a simple interface to interact with TheMealDB API endpoints.
 
 """
+import time
 import httpx
 
-from typing import List, Dict, Any, Generic, Union, Optional, Iterator
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from functools import partial
+from typing import List, Dict, Any, Callable, Generic, Union, Optional, Iterable, Iterator
 from .models import (
     BaseList,
     MealList,
@@ -26,25 +30,202 @@ from .models import (
     CategoryList,
     IngredientList
 )
-
-class MealDB:
+from .constants import API_URL, DEFAULT_TIMEOUT, DEFAULT_LIMITS, LETTERS
+from .cache import BaseCache, MemoryCache, SQLiteCache, CacheStats
+from .base import BaseClient
+from .aio import AsyncMealDB
+from .query import filter_calls
+from .decoders import Decoder
+from .coalesce import SingleFlight, should_coalesce
+from .retry import RateLimiter, RetryPolicy
+from .metrics import Metrics
+from .images import Destination
+
+
+class MealDB(BaseClient):
     """
     Client for interacting with TheMealDB API.
-    
+
+    All requests go through a single long-lived ``httpx.Client`` so connections
+    to TheMealDB are pooled and kept alive between calls instead of paying a
+    fresh TCP/TLS handshake on every request.
+
     Attributes:
         api_key: The API key for authentication.
         base_url: The base URL for API requests.
+        cache: The response cache in use, or None.
+        lazy: Whether models are built lazily from raw response bytes.
+        columnar: Whether meal summary lists are built as ``MealColumns``.
+        decoder: The JSON decoder backend in use, or None for ``response.json()``.
+        single_flight: The ``SingleFlight`` coalescing concurrent identical requests, or None.
+        rate_limiter: The ``RateLimiter`` in use, or None.
+        retry: The ``RetryPolicy`` in use, or None; ``retry.stats()`` reports retry counts.
+        metrics: The ``Metrics`` registry in use, or None.
     """
 
-    def __init__(self, api_key):
-      """
-      Initialize the MealDB client.
-    
-      Args:
-        api_key: API key for TheMealDB. Use '1' for testing.
-      """
-      self.api_key = api_key
-      self.base_url = f'https://www.themealdb.com/api/json/v1/{api_key}'
+    def __init__(
+        self,
+        api_key,
+        *,
+        timeout: Union[float, httpx.Timeout] = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        compression: bool = True,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache: Optional[BaseCache] = None,
+        lazy: bool = False,
+        columnar: bool = False,
+        decoder: Union[str, Decoder, None] = None,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        """
+        Initialize the MealDB client.
+
+        Args:
+            api_key: API key for TheMealDB. Use '1' for testing.
+            timeout: Request timeout in seconds, or an ``httpx.Timeout``.
+            limits: Connection pool limits for the underlying client.
+            http2: Enable HTTP/2. Requires the ``http2`` extra (``pip install py-mealdb[http2]``).
+            compression: Advertise gzip/deflate (and brotli/zstd when installed) response
+                compression. Set to False to request uncompressed bodies.
+            transport: Optional custom ``httpx`` transport, e.g. ``httpx.MockTransport`` in tests.
+            cache: Optional response cache, e.g. ``MemoryCache()`` or ``SQLiteCache(path)``.
+                Disabled by default.
+            lazy: Build models from the raw response bytes (``from_bytes``) and decode
+                items only on first access. Defaults to False.
+            columnar: Build ``MealList`` results (the ``filter_by_*`` methods and
+                ``find_meals``) as ``MealColumns`` read straight from the response body,
+                so no per-meal dictionaries are created and ``find_meals`` intersects
+                integer ID arrays. Defaults to False.
+            decoder: JSON decoder backend: 'json', 'orjson', 'msgspec', 'auto' or a
+                ``Decoder`` instance. Defaults to None, which uses ``response.json()``.
+            coalesce: Share one in-flight request between concurrent calls for the same
+                URL (single-flight). ``random.php`` is never coalesced. Defaults to True.
+            rate_limiter: Optional ``RateLimiter`` token bucket applied to every request,
+                including retries. Share one instance to limit several clients together.
+            retry: Optional ``RetryPolicy`` for transport errors, 429 and 5xx responses.
+                Disabled by default.
+            metrics: Optional ``Metrics`` registry recording per-endpoint latency, status codes,
+                bytes, decode/build time and cache hits, and running request hooks.
+                Disabled by default.
+        """
+        super().__init__(api_key, cache, lazy, decoder, rate_limiter, retry, metrics, columnar)
+        self.single_flight = SingleFlight() if coalesce else None
+        self._client = httpx.Client(
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            headers=self._default_headers(compression),
+        )
+
+    def __enter__(self) -> "MealDB":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        self._client.close()
+
+    def _get(self, url: str) -> httpx.Response:
+        """
+        Issue a GET request on the pooled client and raise on non-2xx status.
+
+        Responses are served from and stored in ``self.cache`` when one is configured.
+        Stale entries with validators are revalidated with a conditional request.
+        Concurrent requests for the same URL share one in-flight request unless
+        coalescing is disabled.
+
+        Args:
+            url: The absolute URL to fetch.
+
+        Returns:
+            The successful ``httpx.Response``.
+        """
+        cached = self._cached(url)
+        if cached is not None:
+            return cached
+        if self.single_flight is not None and should_coalesce(url):
+            return self.single_flight.do(url, partial(self._fetch, url))
+        return self._fetch(url)
+
+    def _send(self, url: str, send: Callable[[], httpx.Response], stream: bool = False) -> httpx.Response:
+        """
+        Send a request through the rate limiter, retrying it according to ``self.retry``.
+
+        Args:
+            url: The request URL, for metrics and hooks.
+            send: Issues one attempt of the request.
+            stream: Whether ``send`` returns an unread streaming response.
+
+        Returns:
+            The final response, which may still have an error status.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            sent = self._attempt_started(url)
+            try:
+                r = send()
+            except httpx.TransportError as exc:
+                delay = self._attempt_failed(url, exc, sent, started, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._attempt_finished(url, r, sent, started, attempt, stream)
+                if delay is None:
+                    return r
+                r.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _fetch(self, url: str) -> httpx.Response:
+        """Fetch ``url`` from the network, revalidating and filling the cache."""
+        r = self._send(url, partial(self._client.get, url, headers=self._validators(url)))
+        return self._fetched(url, r)
+
+    def _gather(
+        self,
+        calls: Dict[str, Callable[[], Any]],
+        return_exceptions: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run independent calls concurrently on a thread pool sharing this client.
+
+        Args:
+            calls: Mapping of result key to a zero-argument callable.
+            return_exceptions: If False, raise the first exception as soon as it occurs and
+                cancel calls that have not started. If True, store exceptions as results.
+            max_workers: Maximum number of calls in flight. Defaults to one per call.
+
+        Returns:
+            Mapping of the same keys to each call's result, in the order of ``calls``.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers or max(len(calls), 1))
+        try:
+            futures = {key: executor.submit(call) for key, call in calls.items()}
+            if not return_exceptions:
+                done, _ = wait(futures.values(), return_when=FIRST_EXCEPTION)
+                for future in done:
+                    if future.exception() is not None:
+                        raise future.exception()
+            results = {}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as exc:
+                    results[key] = exc
+            return results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get_meal_by_name(self,name:str) -> MealDetails:  
         """
@@ -60,9 +241,8 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/search.php?s={name}')
-        r.raise_for_status()
-        return MealDetails.from_response(r.json())
+        r = self._get(f'{self.base_url}/search.php?s={name}')
+        return self._parse(MealDetails, r)
     
     def get_latest_meal(self) -> Union[str, list]:
         """
@@ -78,8 +258,7 @@ class MealDB:
             This endpoint requires a subscription to The MealDB API. Without a subscription,
             a message is returned instead of meal data.
         """
-        r = httpx.get(f'{self.base_url}/latest.php')
-        r.raise_for_status()
+        r = self._get(f'{self.base_url}/latest.php')
         data = r.json()
         meal = data['meals']
         if len(meal) == 3:
@@ -101,9 +280,32 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/lookup.php?i={id}')
-        r.raise_for_status()
-        return MealDetails.from_response(r.json())
+        r = self._get(f'{self.base_url}/lookup.php?i={id}')
+        return self._parse(MealDetails, r)
+
+    def meal_details_by_ids(self, ids: Iterable[str], max_concurrency: int = 8) -> MealDetails:
+        """
+        Retrieves detailed meal information for many meal IDs concurrently.
+
+        Duplicate IDs are fetched once. Lookups run on a thread pool sharing the pooled
+        client, with at most ``max_concurrency`` requests in flight.
+
+        Args:
+            ids: The meal IDs to retrieve (e.g., ``MealList.ids``).
+            max_concurrency: Maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            MealDetails object with the meals in input order. IDs whose request failed
+            are reported in ``MealDetails.errors`` instead of aborting the batch, and
+            unknown IDs as a ``LookupError``.
+        """
+        unique_ids = list(dict.fromkeys(str(id) for id in ids))
+        results = self._gather(
+            {id: partial(self.meal_details_by_id, id) for id in unique_ids},
+            return_exceptions=True,
+            max_workers=max_concurrency,
+        )
+        return MealDetails.merge(results)
 
     def single_random_meal(self) -> MealDetails:
         """
@@ -116,9 +318,8 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/random.php')
-        r.raise_for_status()
-        return MealDetails.from_response(r.json())
+        r = self._get(f'{self.base_url}/random.php')
+        return self._parse(MealDetails, r)
 
     def list_all_meals(self,letter:str) -> MealDetails:
         """
@@ -134,9 +335,52 @@ class MealDB:
             httpx.HTTPError:Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/search.php?f={letter}')
-        r.raise_for_status()
-        return MealDetails.from_response(r.json())
+        r = self._get(f'{self.base_url}/search.php?f={letter}')
+        return self._parse(MealDetails, r)
+
+    def iter_all_meals(self, letters: Iterable[str] = LETTERS, prefetch: int = 2) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over the whole catalog, one ``search.php?f=`` page at a time.
+
+        The first meals are yielded as soon as the first letter arrives. While the caller
+        consumes a page, the next ``prefetch`` letters are fetched on background threads,
+        so at most ``prefetch + 1`` pages are held in memory.
+
+        Args:
+            letters: First letters to walk, in order. Defaults to ``a``-``z``.
+            prefetch: Letters fetched ahead of the one being consumed. Defaults to 2.
+
+        Yields:
+            Meal dictionaries (or decoder items) in letter order, each ``idMeal`` once.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code for a letter;
+                raised when iteration reaches that letter.
+        """
+        pending = iter(dict.fromkeys(letters))
+        seen = set()
+        executor = ThreadPoolExecutor(max_workers=prefetch + 1)
+        inflight = deque()
+        try:
+            # The current letter plus ``prefetch`` letters ahead of it.
+            for letter in pending:
+                inflight.append(executor.submit(self.list_all_meals, letter))
+                if len(inflight) > prefetch:
+                    break
+            while inflight:
+                page = inflight.popleft().result()
+                for meal in page:
+                    if meal['idMeal'] not in seen:
+                        seen.add(meal['idMeal'])
+                        yield meal
+                # Only once the page is consumed, so at most ``prefetch`` letters run ahead of it.
+                for letter in pending:
+                    inflight.append(executor.submit(self.list_all_meals, letter))
+                    break
+        finally:
+            # Stop prefetching when the caller breaks out early or a letter fails.
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def list_meal_categories(self) -> CategoryList:
         """
@@ -149,9 +393,8 @@ class MealDB:
             httpx.HTTPError:Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/categories.php')
-        r.raise_for_status()
-        return CategoryList.from_response(r.json(), key = "categories")
+        r = self._get(f'{self.base_url}/categories.php')
+        return self._parse(CategoryList, r, key='categories')
 
     def list_all_categories(self) -> CategoryList:
         """
@@ -164,9 +407,8 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/categories.php')
-        r.raise_for_status()
-        return CategoryList.from_response(r.json(), key='categories')
+        r = self._get(f'{self.base_url}/categories.php')
+        return self._parse(CategoryList, r, key='categories')
 
     def list_all_areas(self) -> AreaList:
         """
@@ -179,9 +421,8 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/list.php?a=list')
-        r.raise_for_status()
-        return AreaList.from_response(r.json())
+        r = self._get(f'{self.base_url}/list.php?a=list')
+        return self._parse(AreaList, r)
 
     def list_all_ingredients(self) -> IngredientList:
         """
@@ -194,14 +435,21 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/list.php?i=list')
-        r.raise_for_status()
-        return IngredientList.from_response(r.json())
+        r = self._get(f'{self.base_url}/list.php?i=list')
+        return self._parse(IngredientList, r)
 
-    def list_all(self) -> Dict[str, Union[CategoryList, AreaList, IngredientList]]:
+    def list_all(self, return_exceptions: bool = False) -> Dict[str, Union[CategoryList, AreaList, IngredientList, Exception]]:
         """
         Retrieves all categories, areas, and ingredients in a single call.
 
+        The three ``list.php`` requests run concurrently on the shared client, so the
+        call takes as long as the slowest request rather than the sum of all three.
+
+        Args:
+            return_exceptions: If False (default), the first failing request is raised
+                immediately. If True, failed lists are returned as the exception instance
+                in place of the list, alongside the lists that succeeded.
+
         Returns:
             Dictionary with keys 'categories', 'areas', and 'ingredients' containing their respective list objects.
 
@@ -209,20 +457,11 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r1 = httpx.get(f'{self.base_url}/list.php?c=list')
-        r1.raise_for_status()
-        
-        r2 = httpx.get(f'{self.base_url}/list.php?a=list')
-        r2.raise_for_status()
-
-        r3 = httpx.get(f'{self.base_url}/list.php?i=list')
-        r3.raise_for_status()
-
-        return {
-        'categories': CategoryList.from_response(r1.json(), key='categories'),
-        'areas': AreaList.from_response(r2.json()),
-        'ingredients': IngredientList.from_response(r3.json())
-        }
+        return self._gather({
+            'categories': lambda: self._parse(CategoryList, self._get(f'{self.base_url}/list.php?c=list'), key='meals'),
+            'areas': lambda: self._parse(AreaList, self._get(f'{self.base_url}/list.php?a=list')),
+            'ingredients': lambda: self._parse(IngredientList, self._get(f'{self.base_url}/list.php?i=list')),
+        }, return_exceptions=return_exceptions)
 
     def filter_by_ingredient(self,ingredient:str) -> MealList:
         """
@@ -238,9 +477,8 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/filter.php?i={ingredient}')
-        r.raise_for_status()
-        return MealList.from_response(r.json())
+        r = self._get(f'{self.base_url}/filter.php?i={ingredient}')
+        return self._parse(MealList, r)
     
     def filter_by_category(self,category:str) -> MealList:
         """
@@ -256,9 +494,8 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/filter.php?c={category}')
-        r.raise_for_status()
-        return MealList.from_response(r.json())
+        r = self._get(f'{self.base_url}/filter.php?c={category}')
+        return self._parse(MealList, r)
 
     def filter_by_area(self,area:str) -> MealList:
         """
@@ -274,53 +511,125 @@ class MealDB:
             httpx.HTTPError: Check httpx's documentation for all possible exceptions.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r = httpx.get(f'{self.base_url}/filter.php?a={area}')
-        r.raise_for_status()
-        return MealList.from_response(r.json())
+        r = self._get(f'{self.base_url}/filter.php?a={area}')
+        return self._parse(MealList, r)
     
-    def get_ingredient_image(self,ingredient:str) -> bool:
+    def find_meals(
+        self,
+        ingredients: Iterable[str] = (),
+        category: Optional[str] = None,
+        area: Optional[str] = None,
+    ) -> MealList:
         """
-        Fetches and saves a full-size ingredient image locally.
+        Retrieves meals matching every given ingredient, category and area.
+
+        The required ``filter.php`` lists are fetched concurrently (and served from the
+        cache when one is configured), then intersected on ``idMeal`` starting from the
+        smallest list.
+
+        Args:
+            ingredients: Ingredients the meals must all contain (e.g., ['Garlic', 'Salmon']).
+            category: Optional category the meals must belong to (e.g., 'Seafood').
+            area: Optional area/cuisine the meals must come from (e.g., 'Italian').
+
+        Returns:
+            MealList object containing the meal summaries that match all criteria.
+
+        Raises:
+            ValueError: If no criteria are given.
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        calls = filter_calls(self, ingredients, category, area)
+        return MealList.intersect(self._gather(calls).values())
+
+    def download_image(
+        self,
+        ingredient: str,
+        dest: Destination = '.',
+        small: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[httpx.Response]:
+        """
+        Streams an ingredient image to a directory or file-like object and returns the response.
+
+        This is the building block of ``get_ingredient_image`` and
+        ``get_ingredient_image_small`` for callers that need the response
+        headers, such as the ``ETag`` recorded by ``py_mealdb.mirror``. In a
+        directory the image is written atomically and an existing copy is only
+        replaced if the server reports it has changed.
 
         Args:
             ingredient: The ingredient name (e.g., 'tomato', 'chicken').
+            dest: The target directory, or a writable binary file-like object such as
+                ``io.BytesIO``. Defaults to the current working directory.
+            small: Fetch the small variant. Defaults to False.
+            headers: Extra request headers, e.g. ``If-None-Match`` with a known ETag.
 
         Returns:
-            True if the image was successfully fetched and saved, False otherwise.
+            The streamed (closed) response, or None if the server answered ``304 Not Modified``
+            to a conditional request.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        url, path, headers = self._image_request(ingredient, dest, small, headers)
+        request = self._client.build_request('GET', url, headers=headers)
+        r = self._send(url, partial(self._client.send, request, stream=True), stream=True)
+        try:
+            if r.status_code == 304 and headers:
+                return None
+            r.raise_for_status()
+            received = 0
+            with self._image_sink(path, dest) as file:
+                for chunk in r.iter_bytes():
+                    file.write(chunk)
+                    received += len(chunk)
+        finally:
+            r.close()
+        self._image_saved(url, path, r, received)
+        return r
+
+    def get_ingredient_image(self, ingredient: str, dest: Destination = '.') -> bool:
+        """
+        Streams a full-size ingredient image to a directory or file-like object.
+
+        In a directory the image is saved as ``<ingredient>.png`` via a temporary file
+        that is renamed into place once complete. An existing copy is only replaced
+        if the server reports it has changed (``If-Modified-Since``).
+
+        Args:
+            ingredient: The ingredient name (e.g., 'tomato', 'chicken').
+            dest: The target directory, or a writable binary file-like object such as
+                ``io.BytesIO``. Defaults to the current working directory.
+
+        Returns:
+            True if the image was fetched and saved, False if the saved copy is up to date.
 
         Raises:
             httpx.HTTPError: If the HTTP request fails.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r =  httpx.get(f'https://www.themealdb.com/images/ingredients/{ingredient}.png')
-        r.raise_for_status()
-        image_data = r.content
-        with open(f'{ingredient}.png', 'wb') as file:
-            file.write(image_data)
-            return True
-    
-        return False
-        
-    def get_ingredient_image_small(self,ingredient:str) -> bool:
+        return self.download_image(ingredient, dest, small=False) is not None
+
+    def get_ingredient_image_small(self, ingredient: str, dest: Destination = '.') -> bool:
         """
-        Fetches and saves a small-size ingredient image locally.
+        Streams a small-size ingredient image to a directory or file-like object.
+
+        In a directory the image is saved as ``<ingredient>-small.png``; see
+        ``get_ingredient_image`` for the atomic and conditional behaviour.
 
         Args:
             ingredient: The ingredient name (e.g., 'tomato', 'chicken').
+            dest: The target directory, or a writable binary file-like object such as
+                ``io.BytesIO``. Defaults to the current working directory.
 
         Returns:
-            True if the image was successfully fetched and saved, False otherwise.
+            True if the image was fetched and saved, False if the saved copy is up to date.
 
         Raises:
             httpx.HTTPError: If the HTTP request fails.
             httpx.HTTPStatusError: If the API returns a non-2xx status code.
         """
-        r =  httpx.get( f'https://www.themealdb.com/images/ingredients/{ingredient}-Small.png')
-        r.raise_for_status()
-        image_data = r.content
-        with open(f'{ingredient}-small.png', 'wb') as file:
-            file.write(image_data)
-            return True
-    
-        return False
-    
\ No newline at end of file
+        return self.download_image(ingredient, dest, small=True) is not None
@@ -0,0 +1,653 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Asyncio client for TheMealDB API.
+
+This module mirrors every endpoint of ``MealDB`` on top of ``httpx.AsyncClient``
+so many lookups can run concurrently on a single event loop. All methods return
+the same models as the synchronous client.
+
+"""
+import asyncio
+import time
+import httpx
+
+from functools import partial
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, TypeVar, Union, Optional
+from .models import (
+    MealList,
+    MealDetails,
+    AreaList,
+    CategoryList,
+    IngredientList
+)
+from .constants import DEFAULT_TIMEOUT, DEFAULT_LIMITS, LETTERS
+from .cache import BaseCache
+from .base import BaseClient
+from .query import filter_calls
+from .decoders import Decoder
+from .coalesce import AsyncSingleFlight, should_coalesce
+from .retry import RateLimiter, RetryPolicy
+from .metrics import Metrics
+from .images import Destination
+
+T = TypeVar('T')
+
+
+class AsyncMealDB(BaseClient):
+    """
+    Asyncio client for interacting with TheMealDB API.
+
+    Usage::
+
+        async with AsyncMealDB('1') as mb:
+            meals = await mb.get_meal_by_name('Arrabiata')
+
+    Attributes:
+        api_key: The API key for authentication.
+        base_url: The base URL for API requests.
+        cache: The response cache in use, or None.
+        lazy: Whether models are built lazily from raw response bytes.
+        columnar: Whether meal summary lists are built as ``MealColumns``.
+        decoder: The JSON decoder backend in use, or None for ``response.json()``.
+        single_flight: The ``AsyncSingleFlight`` coalescing concurrent identical requests, or None.
+        rate_limiter: The ``RateLimiter`` in use, or None.
+        retry: The ``RetryPolicy`` in use, or None; ``retry.stats()`` reports retry counts.
+        metrics: The ``Metrics`` registry in use, or None.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        *,
+        timeout: Union[float, httpx.Timeout] = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        compression: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[BaseCache] = None,
+        lazy: bool = False,
+        columnar: bool = False,
+        decoder: Union[str, Decoder, None] = None,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        """
+        Initialize the AsyncMealDB client.
+
+        Args:
+            api_key: API key for TheMealDB. Use '1' for testing.
+            timeout: Request timeout in seconds, or an ``httpx.Timeout``.
+            limits: Connection pool limits for the underlying client.
+            http2: Enable HTTP/2. Requires the ``http2`` extra (``pip install py-mealdb[http2]``).
+            compression: Advertise compressed response encodings. Set to False to
+                request uncompressed bodies.
+            transport: Optional custom async ``httpx`` transport, e.g. ``httpx.MockTransport`` in tests.
+            cache: Optional response cache, e.g. ``MemoryCache()`` or ``SQLiteCache(path)``.
+                Disabled by default.
+            lazy: Build models from the raw response bytes (``from_bytes``) and decode
+                items only on first access. Defaults to False.
+            columnar: Build ``MealList`` results (the ``filter_by_*`` methods and
+                ``find_meals``) as ``MealColumns`` read straight from the response body,
+                so no per-meal dictionaries are created and ``find_meals`` intersects
+                integer ID arrays. Defaults to False.
+            decoder: JSON decoder backend: 'json', 'orjson', 'msgspec', 'auto' or a
+                ``Decoder`` instance. Defaults to None, which uses ``response.json()``.
+            coalesce: Share one in-flight request between concurrent calls for the same
+                URL (single-flight). ``random.php`` is never coalesced. Defaults to True.
+            rate_limiter: Optional ``RateLimiter`` token bucket applied to every request,
+                including retries. Share one instance to limit several clients together.
+            retry: Optional ``RetryPolicy`` for transport errors, 429 and 5xx responses.
+                Disabled by default.
+            metrics: Optional ``Metrics`` registry recording per-endpoint latency, status codes,
+                bytes, decode/build time and cache hits, and running request hooks.
+                Disabled by default.
+        """
+        super().__init__(api_key, cache, lazy, decoder, rate_limiter, retry, metrics, columnar)
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            headers=self._default_headers(compression),
+        )
+
+    async def __aenter__(self) -> "AsyncMealDB":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        await self._client.aclose()
+
+    async def _get(self, url: str) -> httpx.Response:
+        """
+        Issue a GET request on the pooled client and raise on non-2xx status.
+
+        Responses are served from and stored in ``self.cache`` when one is configured.
+        Stale entries with validators are revalidated with a conditional request.
+        Concurrent requests for the same URL share one in-flight request unless
+        coalescing is disabled.
+
+        Args:
+            url: The absolute URL to fetch.
+
+        Returns:
+            The successful ``httpx.Response``.
+        """
+        cached = await self._offload(self._cached, url)
+        if cached is not None:
+            return cached
+        if self.single_flight is not None and should_coalesce(url):
+            return await self.single_flight.do(url, partial(self._fetch, url))
+        return await self._fetch(url)
+
+    async def _offload(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a step that uses the cache, in a worker thread if the cache may block."""
+        if self.cache is not None and self.cache.blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def _send(self, url: str, send: Callable[[], Awaitable[httpx.Response]], stream: bool = False) -> httpx.Response:
+        """
+        Send a request through the rate limiter, retrying it according to ``self.retry``.
+
+        Args:
+            url: The request URL, for metrics and hooks.
+            send: Issues one attempt of the request.
+            stream: Whether ``send`` returns an unread streaming response.
+
+        Returns:
+            The final response, which may still have an error status.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+            sent = self._attempt_started(url)
+            try:
+                r = await send()
+            except httpx.TransportError as exc:
+                delay = self._attempt_failed(url, exc, sent, started, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._attempt_finished(url, r, sent, started, attempt, stream)
+                if delay is None:
+                    return r
+                await r.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _fetch(self, url: str) -> httpx.Response:
+        """Fetch ``url`` from the network, revalidating and filling the cache."""
+        headers = await self._offload(self._validators, url)
+        r = await self._send(url, partial(self._client.get, url, headers=headers))
+        return await self._offload(self._fetched, url, r)
+
+    async def _gather(
+        self,
+        calls: Dict[str, Awaitable[Any]],
+        return_exceptions: bool = False,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Await independent coroutines concurrently.
+
+        Args:
+            calls: Mapping of result key to an awaitable.
+            return_exceptions: If False, raise the first exception as soon as it occurs and
+                cancel the remaining tasks. If True, store exceptions as results.
+            max_concurrency: Maximum number of awaitables running at once. Unbounded by default.
+
+        Returns:
+            Mapping of the same keys to each awaitable's result, in the order of ``calls``.
+        """
+        if max_concurrency is not None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def bounded(call):
+                async with semaphore:
+                    return await call
+
+            calls = {key: bounded(call) for key, call in calls.items()}
+
+        tasks = {key: asyncio.ensure_future(call) for key, call in calls.items()}
+        try:
+            results = await asyncio.gather(*tasks.values(), return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return dict(zip(tasks, results))
+
+    async def get_meal_by_name(self, name: str) -> MealDetails:
+        """
+        Retrieves detailed meal information by searching for a meal name.
+
+        Args:
+            name: The name of the meal to search for (e.g., 'Arrabiata', 'Potato Salad').
+
+        Returns:
+            MealDetails object containing detailed meal information.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/search.php?s={name}')
+        return self._parse(MealDetails, r)
+
+    async def get_latest_meal(self) -> Union[str, list]:
+        """
+        Retrieves the latest meal data from the API.
+
+        Returns:
+            String message if subscription is required, otherwise a list with the latest meal data.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+        """
+        r = await self._get(f'{self.base_url}/latest.php')
+        meal = r.json()['meals']
+        if len(meal) == 3:
+            return "You need to subscribe to The Meal DB API to access this endpoint"
+        return list(meal)
+
+    async def meal_details_by_id(self, id: str) -> MealDetails:
+        """
+        Retrieves detailed meal information by meal ID.
+
+        Args:
+            id: The meal ID to retrieve (e.g., '52772').
+
+        Returns:
+            MealDetails object containing the meal's complete information.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/lookup.php?i={id}')
+        return self._parse(MealDetails, r)
+
+    async def meal_details_by_ids(self, ids: Iterable[str], max_concurrency: int = 8) -> MealDetails:
+        """
+        Retrieves detailed meal information for many meal IDs concurrently.
+
+        Duplicate IDs are fetched once, with at most ``max_concurrency`` requests in flight.
+
+        Args:
+            ids: The meal IDs to retrieve (e.g., ``MealList.ids``).
+            max_concurrency: Maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            MealDetails object with the meals in input order. IDs whose request failed
+            are reported in ``MealDetails.errors`` instead of aborting the batch, and
+            unknown IDs as a ``LookupError``.
+        """
+        unique_ids = list(dict.fromkeys(str(id) for id in ids))
+        results = await self._gather(
+            {id: self.meal_details_by_id(id) for id in unique_ids},
+            return_exceptions=True,
+            max_concurrency=max_concurrency,
+        )
+        return MealDetails.merge(results)
+
+    async def single_random_meal(self) -> MealDetails:
+        """
+        Retrieves a single random meal from the MealDB API.
+
+        Returns:
+            MealDetails object containing a random meal's complete information.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/random.php')
+        return self._parse(MealDetails, r)
+
+    async def list_all_meals(self, letter: str) -> MealDetails:
+        """
+        Retrieves meals starting with a specific letter.
+
+        Args:
+            letter: The first letter to search for (e.g., 'a', 'b', 'c').
+
+        Returns:
+            MealDetails object containing all meals starting with the specified letter.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/search.php?f={letter}')
+        return self._parse(MealDetails, r)
+
+    async def iter_all_meals(self, letters: Iterable[str] = LETTERS, prefetch: int = 2) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily iterates over the whole catalog, one ``search.php?f=`` page at a time.
+
+        Use it with ``async for``. The first meals are yielded as soon as the first
+        letter arrives; the next ``prefetch`` letters are fetched by background tasks
+        while the caller consumes a page, so at most ``prefetch + 1`` pages are held in memory.
+
+        Args:
+            letters: First letters to walk, in order. Defaults to ``a``-``z``.
+            prefetch: Letters fetched ahead of the one being consumed. Defaults to 2.
+
+        Yields:
+            Meal dictionaries (or decoder items) in letter order, each ``idMeal`` once.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code for a letter;
+                raised when iteration reaches that letter.
+        """
+        pending = iter(dict.fromkeys(letters))
+        seen = set()
+        inflight = deque()
+        try:
+            # The current letter plus ``prefetch`` letters ahead of it.
+            for letter in pending:
+                inflight.append(asyncio.ensure_future(self.list_all_meals(letter)))
+                if len(inflight) > prefetch:
+                    break
+            while inflight:
+                page = await inflight.popleft()
+                for meal in page:
+                    if meal['idMeal'] not in seen:
+                        seen.add(meal['idMeal'])
+                        yield meal
+                # Only once the page is consumed, so at most ``prefetch`` letters run ahead of it.
+                for letter in pending:
+                    inflight.append(asyncio.ensure_future(self.list_all_meals(letter)))
+                    break
+        finally:
+            # Stop prefetching when the caller breaks out early or a letter fails.
+            for task in inflight:
+                task.cancel()
+
+    async def list_meal_categories(self) -> CategoryList:
+        """
+        Retrieves detailed information about all meal categories.
+
+        Returns:
+            CategoryList object containing detailed category information including descriptions and thumbnails.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/categories.php')
+        return self._parse(CategoryList, r, key='categories')
+
+    async def list_all_categories(self) -> CategoryList:
+        """
+        Retrieves a simple list of all category names.
+
+        Returns:
+            CategoryList object containing category names.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/categories.php')
+        return self._parse(CategoryList, r, key='categories')
+
+    async def list_all_areas(self) -> AreaList:
+        """
+        Retrieves all available geographical areas/cuisines.
+
+        Returns:
+            AreaList object containing all available area names.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/list.php?a=list')
+        return self._parse(AreaList, r)
+
+    async def list_all_ingredients(self) -> IngredientList:
+        """
+        Retrieves all available ingredients.
+
+        Returns:
+            IngredientList object containing all available ingredient names.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/list.php?i=list')
+        return self._parse(IngredientList, r)
+
+    async def list_all(self, return_exceptions: bool = False) -> Dict[str, Union[CategoryList, AreaList, IngredientList, Exception]]:
+        """
+        Retrieves all categories, areas, and ingredients in a single call.
+
+        The three ``list.php`` requests run concurrently, so the call takes as long as
+        the slowest request rather than the sum of all three.
+
+        Args:
+            return_exceptions: If False (default), the first failing request is raised
+                immediately and the others are cancelled. If True, failed lists are returned
+                as the exception instance in place of the list, alongside the lists that succeeded.
+
+        Returns:
+            Dictionary with keys 'categories', 'areas', and 'ingredients' containing their respective list objects.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        async def categories():
+            r = await self._get(f'{self.base_url}/list.php?c=list')
+            return self._parse(CategoryList, r, key='meals')
+
+        async def areas():
+            r = await self._get(f'{self.base_url}/list.php?a=list')
+            return self._parse(AreaList, r)
+
+        async def ingredients():
+            r = await self._get(f'{self.base_url}/list.php?i=list')
+            return self._parse(IngredientList, r)
+
+        return await self._gather({
+            'categories': categories(),
+            'areas': areas(),
+            'ingredients': ingredients(),
+        }, return_exceptions=return_exceptions)
+
+    async def filter_by_ingredient(self, ingredient: str) -> MealList:
+        """
+        Retrieves meals containing a specific ingredient.
+
+        Args:
+            ingredient: The ingredient to filter by (e.g., 'Chicken', 'Salmon', 'Beef').
+
+        Returns:
+            MealList object containing meal summaries that include the specified ingredient.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/filter.php?i={ingredient}')
+        return self._parse(MealList, r)
+
+    async def filter_by_category(self, category: str) -> MealList:
+        """
+        Retrieves meals belonging to a specific category.
+
+        Args:
+            category: The category to filter by (e.g., 'Seafood', 'Dessert', 'Vegetarian').
+
+        Returns:
+            MealList object containing meal summaries from the specified category.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/filter.php?c={category}')
+        return self._parse(MealList, r)
+
+    async def filter_by_area(self, area: str) -> MealList:
+        """
+        Retrieves meals from a specific geographical area/cuisine.
+
+        Args:
+            area: The area to filter by (e.g., 'Canadian', 'Mexican', 'Italian').
+
+        Returns:
+            MealList object containing meal summaries from the specified area.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        r = await self._get(f'{self.base_url}/filter.php?a={area}')
+        return self._parse(MealList, r)
+
+    async def find_meals(
+        self,
+        ingredients: Iterable[str] = (),
+        category: Optional[str] = None,
+        area: Optional[str] = None,
+    ) -> MealList:
+        """
+        Retrieves meals matching every given ingredient, category and area.
+
+        The required ``filter.php`` lists are fetched concurrently (and served from the
+        cache when one is configured), then intersected on ``idMeal`` starting from the
+        smallest list.
+
+        Args:
+            ingredients: Ingredients the meals must all contain (e.g., ['Garlic', 'Salmon']).
+            category: Optional category the meals must belong to (e.g., 'Seafood').
+            area: Optional area/cuisine the meals must come from (e.g., 'Italian').
+
+        Returns:
+            MealList object containing the meal summaries that match all criteria.
+
+        Raises:
+            ValueError: If no criteria are given.
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        calls = filter_calls(self, ingredients, category, area)
+        results = await self._gather({key: call() for key, call in calls.items()})
+        return MealList.intersect(results.values())
+
+    async def download_image(
+        self,
+        ingredient: str,
+        dest: Destination = '.',
+        small: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[httpx.Response]:
+        """
+        Streams an ingredient image to a directory or file-like object and returns the response.
+
+        This is the building block of ``get_ingredient_image`` and
+        ``get_ingredient_image_small`` for callers that need the response
+        headers, such as the ``ETag`` recorded by ``py_mealdb.mirror``. In a
+        directory the image is written atomically and an existing copy is only
+        replaced if the server reports it has changed.
+
+        Args:
+            ingredient: The ingredient name (e.g., 'tomato', 'chicken').
+            dest: The target directory, or a writable binary file-like object such as
+                ``io.BytesIO``. Defaults to the current working directory.
+            small: Fetch the small variant. Defaults to False.
+            headers: Extra request headers, e.g. ``If-None-Match`` with a known ETag.
+
+        Returns:
+            The streamed (closed) response, or None if the server answered ``304 Not Modified``
+            to a conditional request.
+
+        Raises:
+            httpx.HTTPError: Check httpx's documentation for all possible exceptions.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        url, path, headers = self._image_request(ingredient, dest, small, headers)
+        request = self._client.build_request('GET', url, headers=headers)
+        r = await self._send(url, partial(self._client.send, request, stream=True), stream=True)
+        try:
+            if r.status_code == 304 and headers:
+                return None
+            r.raise_for_status()
+            received = 0
+            with self._image_sink(path, dest) as file:
+                async for chunk in r.aiter_bytes():
+                    file.write(chunk)
+                    received += len(chunk)
+        finally:
+            await r.aclose()
+        self._image_saved(url, path, r, received)
+        return r
+
+    async def get_ingredient_image(self, ingredient: str, dest: Destination = '.') -> bool:
+        """
+        Streams a full-size ingredient image to a directory or file-like object.
+
+        In a directory the image is saved as ``<ingredient>.png`` via a temporary file
+        that is renamed into place once complete. An existing copy is only replaced
+        if the server reports it has changed (``If-Modified-Since``).
+
+        Args:
+            ingredient: The ingredient name (e.g., 'tomato', 'chicken').
+            dest: The target directory, or a writable binary file-like object such as
+                ``io.BytesIO``. Defaults to the current working directory.
+
+        Returns:
+            True if the image was fetched and saved, False if the saved copy is up to date.
+
+        Raises:
+            httpx.HTTPError: If the HTTP request fails.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        return await self.download_image(ingredient, dest, small=False) is not None
+
+    async def get_ingredient_image_small(self, ingredient: str, dest: Destination = '.') -> bool:
+        """
+        Streams a small-size ingredient image to a directory or file-like object.
+
+        In a directory the image is saved as ``<ingredient>-small.png``; see
+        ``get_ingredient_image`` for the atomic and conditional behaviour.
+
+        Args:
+            ingredient: The ingredient name (e.g., 'tomato', 'chicken').
+            dest: The target directory, or a writable binary file-like object such as
+                ``io.BytesIO``. Defaults to the current working directory.
+
+        Returns:
+            True if the image was fetched and saved, False if the saved copy is up to date.
+
+        Raises:
+            httpx.HTTPError: If the HTTP request fails.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        return await self.download_image(ingredient, dest, small=True) is not None
@@ -0,0 +1,335 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Local autocomplete over meal and ingredient names.
+
+``AutocompleteIndex`` answers search-box queries without a network round trip:
+
+- a trie over every word-suffix of each name, for prefix completion at any word
+  ("sal" finds "Baked salmon with fennel"); each node keeps its best-ranked
+  entries, so a completion costs one walk down the prefix
+- a trigram index over the distinct words of all names, for typo-tolerant
+  matching ("chiken" finds "Chicken"); each query word is matched against the
+  vocabulary, which is much smaller than the list of names
+
+Names are folded to lower case without accents or punctuation before indexing.
+Build the index from a catalog snapshot and the ingredient list::
+
+    index = AutocompleteIndex.from_catalog(OfflineMealDB.from_snapshot('catalog.jsonl'),
+                                           ingredients=meal_db.list_all_ingredients())
+    index.search('chikn')   # prefix matches first, then fuzzy ones
+
+New meals and ingredients can be added at any time with ``add_meal`` and ``add_ingredient``.
+
+"""
+from __future__ import annotations
+
+import functools
+import re
+import unicodedata
+
+from bisect import insort
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .models import IngredientList
+from .offline import OfflineMealDB
+
+MEAL = 'meal'
+INGREDIENT = 'ingredient'
+KINDS = (MEAL, INGREDIENT)
+
+_SEPARATORS = re.compile(r'[^0-9a-z]+')
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize(text: Optional[str]) -> str:
+    """
+    Fold a name for matching: lower case, accents removed, punctuation collapsed to single spaces.
+
+    Args:
+        text: The name to fold, e.g. 'Crème Fraîche'.
+
+    Returns:
+        The folded name, e.g. 'creme fraiche'.
+    """
+    decomposed = unicodedata.normalize('NFKD', (text or '').casefold())
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return _SEPARATORS.sub(' ', stripped).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Return the trigrams of a normalized name.
+
+    Each word is padded with two leading spaces and one trailing space, so short
+    words and word starts produce trigrams of their own.
+    """
+    grams = set()
+    for word in text.split():
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """
+    One autocomplete candidate.
+
+    Attributes:
+        kind: 'meal' or 'ingredient'.
+        value: The ``idMeal`` for meals, the ingredient name for ingredients.
+        label: The display name.
+        score: 1.0 for prefix matches; the trigram similarity (0 to 1) for fuzzy matches.
+    """
+    kind: str
+    value: str
+    label: str
+    score: float
+
+
+class _Node:
+    __slots__ = ('children', 'top')
+
+    def __init__(self):
+        self.children: Dict[str, _Node] = {}
+        # Best-ranked (rank, entry) pairs of the names below this node, sorted.
+        self.top: List[Tuple[Tuple[int, int, str], int]] = []
+
+
+class AutocompleteIndex:
+    """
+    Prefix and fuzzy name index over meals and ingredients.
+
+    Entries are ranked for prefix completion by where the prefix matched (start
+    of the name before later words), then by shorter names, then alphabetically.
+    Fuzzy matches are ranked by how many trigrams of each query word the closest
+    word of the name shares, so a partly typed, misspelt word still finds its target.
+
+    Attributes:
+        capacity: Ranked entries kept per trie node; prefix queries return at most this many per kind.
+        threshold: Minimum trigram similarity of a fuzzy match.
+    """
+
+    def __init__(self, capacity: int = 32, threshold: float = 0.4):
+        """
+        Create an empty index.
+
+        Args:
+            capacity: Ranked entries kept per trie node. Defaults to 32.
+            threshold: Minimum trigram similarity (0 to 1) of fuzzy matches. Defaults to 0.4.
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self._entries: List[Tuple[str, str, str, str]] = []  # (kind, value, label, normalized)
+        self._keys: Dict[Tuple[str, str], int] = {}
+        self._tries: Dict[str, _Node] = {kind: _Node() for kind in KINDS}
+        self._words: Dict[str, int] = {}
+        self._gram_words: Dict[str, List[int]] = {}
+        self._word_entries: Dict[str, Dict[int, List[int]]] = {kind: {} for kind in KINDS}
+
+    @classmethod
+    def from_catalog(
+        cls,
+        catalog: OfflineMealDB,
+        ingredients: Optional[IngredientList] = None,
+        **kwargs: Any,
+    ) -> AutocompleteIndex:
+        """
+        Build an index from a catalog snapshot.
+
+        Args:
+            catalog: The meals to index.
+            ingredients: Ingredient names to index, e.g. from ``list_all_ingredients()``.
+                Defaults to the ingredients used by the catalog's meals.
+            **kwargs: Passed to the constructor.
+
+        Returns:
+            The populated index.
+        """
+        index = cls(**kwargs)
+        for meal in catalog.meals.values():
+            index.add_meal(meal)
+        if ingredients is None:
+            ingredients = catalog.list_all_ingredients()
+        for name in ingredients.ingredients:
+            index.add_ingredient(name)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed meals and ingredients."""
+        return len(self._entries)
+
+    def add_meal(self, meal: Dict[str, Any]) -> bool:
+        """
+        Index a meal under its ``strMeal`` name.
+
+        Args:
+            meal: A meal summary or full meal dictionary with ``idMeal`` and ``strMeal``.
+
+        Returns:
+            True if the meal was added, False if its ID was already indexed or it has no name.
+        """
+        return self._add(MEAL, str(meal['idMeal']), meal.get('strMeal'))
+
+    def add_ingredient(self, name: str) -> bool:
+        """
+        Index an ingredient name.
+
+        Returns:
+            True if the ingredient was added, False if it was already indexed (ignoring case) or blank.
+        """
+        return self._add(INGREDIENT, normalize(name), name)
+
+    def _add(self, kind: str, key: str, label: Optional[str]) -> bool:
+        normalized = normalize(label)
+        if not normalized or not key or (kind, key) in self._keys:
+            return False
+        entry = len(self._entries)
+        value = label.strip() if kind == INGREDIENT else key
+        self._entries.append((kind, value, label.strip(), normalized))
+        self._keys[(kind, key)] = entry
+
+        words = normalized.split(' ')
+        position = 0
+        for i, word in enumerate(words):
+            self._insert(self._tries[kind], normalized[position:], (i, len(normalized), normalized), entry)
+            position += len(word) + 1
+
+        postings = self._word_entries[kind]
+        for word in dict.fromkeys(words):
+            id = self._words.get(word)
+            if id is None:
+                id = self._words[word] = len(self._words)
+                for gram in trigrams(word):
+                    self._gram_words.setdefault(gram, []).append(id)
+            postings.setdefault(id, []).append(entry)
+        return True
+
+    def _insert(self, node: _Node, text: str, rank: Tuple[int, int, str], entry: int) -> None:
+        for char in text:
+            node = node.children.setdefault(char, _Node())
+            top = node.top
+            if any(existing == entry for _, existing in top):
+                # Already listed through an earlier word, which ranks at least as high.
+                continue
+            if len(top) < self.capacity or rank < top[-1][0]:
+                insort(top, (rank, entry))
+                del top[self.capacity:]
+
+    def _kinds(self, kind: Optional[str]) -> Tuple[str, ...]:
+        if kind is None:
+            return KINDS
+        if kind not in KINDS:
+            raise ValueError(f'kind must be one of {KINDS}, not {kind!r}')
+        return (kind,)
+
+    def _suggestion(self, entry: int, score: float) -> Suggestion:
+        kind, value, label, _ = self._entries[entry]
+        return Suggestion(kind, value, label, score)
+
+    def complete(self, prefix: str, limit: int = 10, kind: Optional[str] = None) -> List[Suggestion]:
+        """
+        Return names with a word starting with ``prefix``.
+
+        Args:
+            prefix: What the user typed so far; may span several words ('chicken ha').
+            limit: Maximum number of suggestions. Defaults to 10.
+            kind: 'meal' or 'ingredient' to restrict the results. Defaults to both.
+
+        Returns:
+            Suggestions with score 1.0, best-ranked first.
+        """
+        query = normalize(prefix)
+        if not query:
+            return []
+        ranked = []
+        for k in self._kinds(kind):
+            node = self._tries[k]
+            for char in query:
+                node = node.children.get(char)
+                if node is None:
+                    break
+            else:
+                ranked.extend(node.top)
+        ranked.sort()
+        return [self._suggestion(entry, 1.0) for _, entry in ranked[:limit]]
+
+    def fuzzy(self, text: str, limit: int = 10, kind: Optional[str] = None) -> List[Suggestion]:
+        """
+        Return names similar to ``text``, tolerating typos.
+
+        Each query word is scored against every word of a name by the share of
+        its trigrams that the name's word contains; a name scores the mean of
+        the best score of each query word. Shorter names win ties.
+
+        Args:
+            text: The query, e.g. 'chiken tika'.
+            limit: Maximum number of suggestions. Defaults to 10.
+            kind: 'meal' or 'ingredient' to restrict the results. Defaults to both.
+
+        Returns:
+            Suggestions scoring at least ``threshold``, best first.
+        """
+        words = normalize(text).split()
+        if not words:
+            return []
+        kinds = self._kinds(kind)
+        totals: Dict[int, float] = {}
+        for word in dict.fromkeys(words):
+            grams = trigrams(word)
+            shared = Counter()
+            for gram in grams:
+                shared.update(self._gram_words.get(gram, ()))
+            best: Dict[int, float] = {}
+            for id, count in shared.items():
+                similarity = count / len(grams)
+                if similarity < self.threshold:
+                    continue
+                for k in kinds:
+                    for entry in self._word_entries[k].get(id, ()):
+                        if similarity > best.get(entry, 0.0):
+                            best[entry] = similarity
+            for entry, similarity in best.items():
+                totals[entry] = totals.get(entry, 0.0) + similarity * words.count(word)
+        scored = []
+        for entry, total in totals.items():
+            score = total / len(words)
+            if score >= self.threshold:
+                normalized = self._entries[entry][3]
+                scored.append((-score, len(normalized), normalized, entry))
+        scored.sort()
+        return [self._suggestion(entry, round(-score, 4)) for score, _, _, entry in scored[:limit]]
+
+    def search(self, text: str, limit: int = 10, kind: Optional[str] = None) -> List[Suggestion]:
+        """
+        Return prefix completions, topped up with fuzzy matches when there are fewer than ``limit``.
+
+        Args:
+            text: What the user typed so far.
+            limit: Maximum number of suggestions. Defaults to 10.
+            kind: 'meal' or 'ingredient' to restrict the results. Defaults to both.
+
+        Returns:
+            Prefix matches first, then fuzzy matches not already listed.
+        """
+        results = self.complete(text, limit, kind)
+        if len(results) < limit:
+            seen = {(s.kind, s.value) for s in results}
+            for suggestion in self.fuzzy(text, limit, kind):
+                if (suggestion.kind, suggestion.value) not in seen:
+                    results.append(suggestion)
+                    if len(results) == limit:
+                        break
+        return results
@@ -0,0 +1,211 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Request, parse and metrics logic shared by ``MealDB`` and ``AsyncMealDB``.
+
+Everything that does not depend on how a request is awaited lives here: the
+cache lookup before a request, the retry and metrics bookkeeping around each
+attempt, the handling of a finished response, model building, and the set-up
+and completion of image downloads. Each client keeps only the loops that send
+requests and sleep, in its own sync or async flavour.
+
+"""
+import os
+import time
+import httpx
+
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Optional, Tuple, Type, Union, cast
+from .models import BaseList, MealColumns, MealList, ModelT
+from .constants import API_URL
+from .cache import BaseCache, cached_response
+from .decoders import Decoder, get_decoder
+from .retry import RateLimiter, RetryPolicy
+from .metrics import Metrics, RequestEvent, endpoint_label
+from .images import (
+    Destination,
+    AtomicFile,
+    conditional_headers,
+    image_filename,
+    image_url,
+    is_directory_target,
+    set_mtime
+)
+
+
+class BaseClient:
+    """
+    Configuration and transport-independent steps of a TheMealDB client.
+
+    Attributes:
+        api_key: The API key for authentication.
+        base_url: The base URL for API requests.
+        cache: The response cache in use, or None.
+        lazy: Whether models are built lazily from raw response bytes.
+        columnar: Whether meal summary lists are built as ``MealColumns``.
+        decoder: The JSON decoder backend in use, or None for ``response.json()``.
+        rate_limiter: The ``RateLimiter`` in use, or None.
+        retry: The ``RetryPolicy`` in use, or None.
+        metrics: The ``Metrics`` registry in use, or None.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        cache: Optional[BaseCache] = None,
+        lazy: bool = False,
+        decoder: Union[str, Decoder, None] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
+        columnar: bool = False,
+    ):
+        self.api_key = api_key
+        self.base_url = f'{API_URL}/{api_key}'
+        self.cache = cache
+        self.lazy = lazy
+        self.columnar = columnar
+        self.decoder = get_decoder(decoder)
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.metrics = metrics
+
+    @staticmethod
+    def _default_headers(compression: bool) -> Dict[str, str]:
+        """Headers for the underlying ``httpx`` client."""
+        return {} if compression else {'Accept-Encoding': 'identity'}
+
+    def _cached(self, url: str) -> Optional[httpx.Response]:
+        """Return a fresh cached response for ``url``, recording the hit or miss, or None."""
+        if self.cache is None:
+            return None
+        content = self.cache.get(url)
+        if self.metrics is not None:
+            self.metrics.record_cache(url, content is not None)
+        return cached_response(url, content) if content is not None else None
+
+    def _validators(self, url: str) -> Optional[Dict[str, str]]:
+        """Conditional request headers for a stale cache entry of ``url``, if any."""
+        return self.cache.validators(url) if self.cache is not None else None
+
+    def _attempt_started(self, url: str) -> float:
+        """Run the request hooks for one attempt and return its start time."""
+        if self.metrics is not None:
+            self.metrics.request_started(url)
+        return time.perf_counter()
+
+    def _attempt_failed(self, url: str, exc: httpx.TransportError, sent: float, started: float, attempt: int) -> Optional[float]:
+        """
+        Record an attempt that raised a transport error.
+
+        Returns:
+            Seconds to wait before retrying, or None if the error must be raised.
+        """
+        if self.metrics is not None:
+            self.metrics.record_attempt(RequestEvent(
+                endpoint_label(url), url, None, time.perf_counter() - sent, attempt=attempt, error=exc
+            ))
+        return self.retry.delay(attempt, time.monotonic() - started, error=exc) if self.retry else None
+
+    def _attempt_finished(self, url: str, r: httpx.Response, sent: float, started: float, attempt: int, stream: bool) -> Optional[float]:
+        """
+        Record an attempt that returned a response.
+
+        Returns:
+            Seconds to wait before retrying, or None if ``r`` is the final response.
+        """
+        if self.metrics is not None:
+            self.metrics.record_attempt(RequestEvent(
+                endpoint_label(url), url, r.status_code, time.perf_counter() - sent,
+                bytes=0 if stream else len(r.content), attempt=attempt,
+            ))
+        return self.retry.delay(attempt, time.monotonic() - started, response=r) if self.retry else None
+
+    def _fetched(self, url: str, r: httpx.Response) -> httpx.Response:
+        """
+        Turn the final network response for ``url`` into the result of a request.
+
+        A ``304`` refreshes and returns the cached body; any other non-2xx status is
+        raised; a successful response is stored in the cache.
+        """
+        if r.status_code == 304 and self.cache is not None:
+            content = self.cache.revalidate(url)
+            if content is not None:
+                return cached_response(url, content)
+        r.raise_for_status()
+        if self.cache is not None:
+            self.cache.set(url, r.content, r.headers)
+        return r
+
+    def _parse(self, model: Type[ModelT], r: httpx.Response, key: str = 'meals') -> ModelT:
+        """
+        Build a model from a response, eagerly or lazily depending on ``self.lazy``.
+
+        With ``self.columnar``, a ``MealList`` is built as ``MealColumns`` straight from
+        the response body, whatever ``self.lazy`` is. Eager models are decoded with
+        ``self.decoder`` when one is configured. Decode and build times are recorded in
+        ``self.metrics`` when enabled.
+
+        Args:
+            model: The model class, e.g. ``MealList``.
+            r: The successful response.
+            key: The key holding the items. Defaults to 'meals'.
+
+        Returns:
+            An instance of ``model``.
+        """
+        result: BaseList
+        if self.columnar and issubclass(model, MealList):
+            started = time.perf_counter()
+            columns = MealColumns.from_bytes(r.content, key)
+            decoded = time.perf_counter()
+            result = model(items=columns)
+        elif self.lazy:
+            return cast(ModelT, model.from_bytes(r.content, key=key))
+        else:
+            started = time.perf_counter()
+            data = r.json() if self.decoder is None else self.decoder.decode(r.content, model, key)
+            decoded = time.perf_counter()
+            result = model.from_response(data, key=key)
+        if self.metrics is not None:
+            self.metrics.record_parse(str(r.url), decoded - started, time.perf_counter() - decoded)
+        return cast(ModelT, result)
+
+    @staticmethod
+    def _image_request(
+        ingredient: str, dest: Destination, small: bool, headers: Optional[Dict[str, str]]
+    ) -> Tuple[str, Optional[str], Optional[Dict[str, str]]]:
+        """
+        Plan an image download.
+
+        Returns:
+            The image URL, the target file path (None for a file-like ``dest``) and the
+            request headers, including ``If-Modified-Since`` for an existing file.
+        """
+        path = None
+        if is_directory_target(dest):
+            directory = os.fspath(cast(Union[str, os.PathLike], dest))
+            path = os.path.join(directory, image_filename(ingredient, small))
+            headers = {**conditional_headers(path), **(headers or {})}
+        return image_url(ingredient, small), path, headers
+
+    @staticmethod
+    def _image_sink(path: Optional[str], dest: Destination) -> ContextManager[Any]:
+        """The file an image is streamed into: an ``AtomicFile`` at ``path``, or ``dest`` itself."""
+        return AtomicFile(path) if path is not None else nullcontext(dest)
+
+    def _image_saved(self, url: str, path: Optional[str], r: httpx.Response, received: int) -> None:
+        """Record the bytes of a finished image download and stamp the saved file's mtime."""
+        if self.metrics is not None:
+            self.metrics.record_bytes(url, received)
+        if path is not None:
+            set_mtime(path, r.headers)
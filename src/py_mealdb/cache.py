@@ -0,0 +1,540 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Response caches for TheMealDB clients.
+
+Caches are keyed on the full request URL and store raw response bodies, so every
+hit is decoded into fresh model objects and callers never share mutable state.
+Pass an instance to ``MealDB(cache=...)`` or ``AsyncMealDB(cache=...)``:
+
+- ``MemoryCache``: process-local TTL/LRU cache.
+- ``SQLiteCache``: on-disk cache shared between processes, with conditional revalidation.
+
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import httpx
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+DEFAULT_TTLS: Dict[str, float] = {
+    'categories.php': 24 * 60 * 60,
+    'list.php': 24 * 60 * 60,
+    'lookup.php': 60 * 60,
+    'search.php': 60 * 60,
+    'filter.php': 60 * 60,
+    'random.php': 0,
+    'latest.php': 0,
+}
+
+NOT_FOUND_BODY = b'{"meals":null}'
+
+
+def endpoint_of(url: str) -> str:
+    """
+    Return the endpoint name of a TheMealDB URL, e.g. ``'filter.php'``.
+
+    Args:
+        url: The absolute request URL.
+
+    Returns:
+        The last path segment of the URL.
+    """
+    return urlsplit(url).path.rsplit('/', 1)[-1]
+
+
+def is_not_found(content: bytes) -> bool:
+    """Return True if ``content`` is TheMealDB's empty ``{"meals": null}`` response."""
+    return len(content) < 32 and content.replace(b' ', b'') == NOT_FOUND_BODY
+
+
+def cached_response(url: str, content: bytes) -> httpx.Response:
+    """
+    Build a ``200 OK`` response for a body served from a cache.
+
+    Args:
+        url: The request URL.
+        content: The cached body.
+
+    Returns:
+        An ``httpx.Response`` that endpoint methods can decode like a network response.
+    """
+    return httpx.Response(200, content=content, request=httpx.Request('GET', url))
+
+
+@dataclass
+class CacheStats:
+    """
+    Snapshot of cache counters.
+
+    Attributes:
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups not found or expired.
+        evictions: Number of entries dropped to respect the size limits.
+        entries: Number of entries currently stored.
+        bytes: Total size of the stored response bodies.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class BaseCache(ABC):
+    """
+    Base class for response caches used by ``MealDB`` and ``AsyncMealDB``.
+
+    Subclasses must implement ``get``, ``set``, ``clear`` and ``stats``; a subclass
+    missing any of them cannot be instantiated. Caches that keep stale entries with
+    their validators can also override ``validators`` and ``revalidate`` so the
+    client sends conditional requests and reuses the stored body on
+    ``304 Not Modified``.
+
+    Attributes:
+        ttls: Time-to-live in seconds per endpoint name.
+        default_ttl: Time-to-live for endpoints not listed in ``ttls``.
+        negative_ttl: Time-to-live for ``{"meals": null}`` responses.
+        blocking: Whether calls may block on disk or locks; ``AsyncMealDB`` then runs
+            them in a worker thread instead of on the event loop.
+    """
+
+    blocking = False
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0,
+        negative_ttl: float = 60,
+    ):
+        """
+        Initialize the cache policy.
+
+        Args:
+            ttls: Per-endpoint TTL overrides, merged over ``DEFAULT_TTLS``.
+            default_ttl: TTL for endpoints not listed in ``ttls``. Defaults to 0 (not cached).
+            negative_ttl: TTL for ``{"meals": null}`` responses. Defaults to 60 seconds.
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+
+    def ttl_for(self, url: str, content: bytes) -> float:
+        """
+        Return the time-to-live for a response.
+
+        Args:
+            url: The request URL.
+            content: The response body.
+
+        Returns:
+            TTL in seconds. Zero means the response must not be cached.
+        """
+        ttl = self.ttls.get(endpoint_of(url), self.default_ttl)
+        if ttl and is_not_found(content):
+            return min(ttl, self.negative_ttl)
+        return ttl
+
+    @abstractmethod
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the fresh cached body for ``url``, or None."""
+
+    @abstractmethod
+    def set(self, url: str, content: bytes, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Store the body and headers of a successful response for ``url``."""
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """
+        Return conditional request headers for a stale entry.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            ``If-None-Match``/``If-Modified-Since`` headers, or an empty dict.
+        """
+        return {}
+
+    def revalidate(self, url: str) -> Optional[bytes]:
+        """
+        Mark a stale entry fresh again after a ``304 Not Modified`` response.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            The stored body, or None if the entry is gone.
+        """
+        return None
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+
+
+class MemoryCache(BaseCache):
+    """
+    Thread-safe in-memory TTL/LRU cache of response bodies.
+
+    Each endpoint has its own time-to-live (see ``DEFAULT_TTLS``); endpoints with a
+    TTL of zero, such as ``random.php``, are never stored. Empty ``{"meals": null}``
+    responses are cached for ``negative_ttl`` seconds. Least recently used entries are
+    evicted once either ``max_entries`` or ``max_bytes`` is exceeded.
+
+    Attributes:
+        max_entries: Maximum number of cached responses.
+        max_bytes: Maximum total size of cached response bodies.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0,
+        negative_ttl: float = 60,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses. Defaults to 1024.
+            max_bytes: Maximum total size of cached bodies. Defaults to 32 MiB.
+            ttls: Per-endpoint TTL overrides, merged over ``DEFAULT_TTLS``.
+            default_ttl: TTL for endpoints not listed in ``ttls``. Defaults to 0 (not cached).
+            negative_ttl: TTL for ``{"meals": null}`` responses. Defaults to 60 seconds.
+        """
+        super().__init__(ttls=ttls, default_ttl=default_ttl, negative_ttl=negative_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Look up a cached response body.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            The cached body, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, content = entry
+            if expires_at <= time.monotonic():
+                self._remove(url)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self._hits += 1
+            return content
+
+    def set(self, url: str, content: bytes, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Store a response body if its endpoint is cacheable.
+
+        Args:
+            url: The request URL.
+            content: The response body.
+            headers: The response headers. Unused by the in-memory cache.
+        """
+        ttl = self.ttl_for(url, content)
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if url in self._entries:
+                self._remove(url)
+            self._entries[url] = (time.monotonic() + ttl, content)
+            self._bytes += len(content)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._bytes)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def _remove(self, url: str) -> None:
+        _, content = self._entries.pop(url)
+        self._bytes -= len(content)
+
+
+class SQLiteCache(BaseCache):
+    """
+    Persistent response cache stored in a SQLite database.
+
+    The database runs in WAL mode so several worker processes on one host can share
+    a single cache file. Bodies are stored together with their response headers; once
+    an entry expires it is kept and revalidated with ``If-None-Match`` or
+    ``If-Modified-Since``, so an unchanged resource costs a ``304`` instead of a full
+    download. Least recently used entries are evicted once ``max_entries`` or
+    ``max_bytes`` is exceeded.
+
+    Attributes:
+        path: Path of the SQLite database file.
+        max_entries: Maximum number of cached responses.
+        max_bytes: Maximum total size of cached response bodies.
+    """
+
+    blocking = True
+
+    _SKIPPED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection'})
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_entries: int = 100_000,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0,
+        negative_ttl: float = 60,
+    ):
+        """
+        Open or create the cache database.
+
+        Args:
+            path: Path of the SQLite database file.
+            max_entries: Maximum number of cached responses. Defaults to 100,000.
+            max_bytes: Maximum total size of cached bodies. Defaults to 512 MiB.
+            ttls: Per-endpoint TTL overrides, merged over ``DEFAULT_TTLS``.
+            default_ttl: TTL for endpoints not listed in ``ttls``. Defaults to 0 (not cached).
+            negative_ttl: TTL for ``{"meals": null}`` responses. Defaults to 60 seconds.
+        """
+        super().__init__(ttls=ttls, default_ttl=default_ttl, negative_ttl=negative_ttl)
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' url TEXT PRIMARY KEY,'
+            ' content BLOB NOT NULL,'
+            ' headers TEXT NOT NULL,'
+            ' etag TEXT,'
+            ' last_modified TEXT,'
+            ' ttl REAL NOT NULL,'
+            ' expires_at REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL,'
+            ' size INTEGER NOT NULL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+        # Running totals kept by triggers, so limits are checked without scanning the table.
+        with self._db:
+            self._db.execute('BEGIN IMMEDIATE')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS totals ('
+                ' id INTEGER PRIMARY KEY CHECK (id = 0),'
+                ' entries INTEGER NOT NULL,'
+                ' bytes INTEGER NOT NULL)'
+            )
+            self._db.execute(
+                'INSERT OR IGNORE INTO totals SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses'
+            )
+            self._db.execute(
+                'CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN'
+                ' UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size; END'
+            )
+            self._db.execute(
+                'CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN'
+                ' UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size; END'
+            )
+            self._db.execute(
+                'CREATE TRIGGER IF NOT EXISTS responses_resize AFTER UPDATE OF size ON responses BEGIN'
+                ' UPDATE totals SET bytes = bytes + NEW.size - OLD.size; END'
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Look up a fresh cached response body.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            The cached body, or None if missing or expired.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                'SELECT content, expires_at FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self._misses += 1
+                return None
+            self._db.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (now, url))
+            self._hits += 1
+            return row[0]
+
+    def get_headers(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        Return the stored response headers for ``url``, fresh or stale.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            Mapping of header names to values, or None if not cached.
+        """
+        with self._lock:
+            row = self._db.execute('SELECT headers FROM responses WHERE url = ?', (url,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, url: str, content: bytes, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Store a response body and its headers if the endpoint is cacheable.
+
+        Args:
+            url: The request URL.
+            content: The decoded response body.
+            headers: The response headers. ``ETag`` and ``Last-Modified`` are kept for revalidation.
+        """
+        ttl = self.ttl_for(url, content)
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        stored = {k.lower(): v for k, v in (headers or {}).items() if k.lower() not in self._SKIPPED_HEADERS}
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute('BEGIN IMMEDIATE')
+            self._db.execute(
+                'INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (url) DO UPDATE SET'
+                ' content = excluded.content, headers = excluded.headers, etag = excluded.etag,'
+                ' last_modified = excluded.last_modified, ttl = excluded.ttl, expires_at = excluded.expires_at,'
+                ' accessed_at = excluded.accessed_at, size = excluded.size',
+                (url, content, json.dumps(stored), stored.get('etag'), stored.get('last-modified'),
+                 ttl, now + ttl, now, len(content)),
+            )
+            self._evict()
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """
+        Return conditional request headers for a stale entry.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            ``If-None-Match``/``If-Modified-Since`` headers, or an empty dict.
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT etag, last_modified FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return {}
+        headers = {}
+        if row[0]:
+            headers['If-None-Match'] = row[0]
+        if row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def revalidate(self, url: str) -> Optional[bytes]:
+        """
+        Mark a stale entry fresh again after a ``304 Not Modified`` response.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            The stored body, or None if the entry is gone.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute('SELECT content, ttl FROM responses WHERE url = ?', (url,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                'UPDATE responses SET expires_at = ?, accessed_at = ? WHERE url = ?', (now + row[1], now, url)
+            )
+            self._hits += 1
+            return row[0]
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters for this process and the database size."""
+        with self._lock:
+            entries, size = self._totals()
+            return CacheStats(self._hits, self._misses, self._evictions, entries, size)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        with self._lock:
+            return self._totals()[0]
+
+    def _totals(self) -> Tuple[int, int]:
+        return self._db.execute('SELECT entries, bytes FROM totals').fetchone()
+
+    def _evict(self) -> None:
+        entries, size = self._totals()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return
+        # Walk the least recently used entries until enough of them are counted, then drop them at once.
+        count = 0
+        rows = self._db.execute('SELECT size FROM responses ORDER BY accessed_at')
+        for row_size, in rows:
+            if entries - count <= self.max_entries and size <= self.max_bytes:
+                break
+            count += 1
+            size -= row_size
+        rows.close()
+        self._db.execute(
+            'DELETE FROM responses WHERE url IN (SELECT url FROM responses ORDER BY accessed_at LIMIT ?)', (count,)
+        )
+        self._evictions += count
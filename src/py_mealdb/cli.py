@@ -0,0 +1,121 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Command-line interface for py-mealdb.
+
+Run ``py-mealdb --help`` (or ``python -m py_mealdb --help``) for the list of commands.
+
+"""
+import argparse
+import sys
+import time
+
+from typing import List, Optional
+
+from . import MealDB
+from .crawler import LETTERS, crawl
+from .mirror import mirror_images
+
+
+def _crawl(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+
+    def progress(letter: str, written: int) -> None:
+        print(f'{letter}: {written} new meals', file=sys.stderr)
+
+    with MealDB(args.api_key) as meal_db:
+        result = crawl(
+            meal_db,
+            args.output,
+            letters=args.letters,
+            max_concurrency=args.concurrency,
+            resume=not args.fresh,
+            progress=progress,
+        )
+
+    elapsed = time.perf_counter() - started
+    print(
+        f'Wrote {result.meals_written} meals from {len(result.letters_done)} letters '
+        f'({len(result.letters_skipped)} already done) in {elapsed:.1f}s',
+        file=sys.stderr,
+    )
+    for letter, exc in sorted(result.errors.items()):
+        print(f'{letter}: failed: {exc}', file=sys.stderr)
+    return 1 if result.errors else 0
+
+
+def _mirror_images(args: argparse.Namespace) -> int:
+
+    def progress(name: str, status: str) -> None:
+        print(f'{name}: {status}', file=sys.stderr)
+
+    with MealDB(args.api_key) as meal_db:
+        result = mirror_images(
+            meal_db,
+            args.dest,
+            ingredients=args.ingredient or None,
+            small=not args.full_only,
+            full=not args.small_only,
+            max_concurrency=args.concurrency,
+            revalidate=args.revalidate,
+            progress=progress,
+        )
+
+    print(
+        f'Downloaded {result.downloaded} images ({result.bytes / 2**20:.1f} MiB), '
+        f'{result.unchanged} unchanged, {result.skipped} already mirrored in {result.elapsed:.1f}s '
+        f'({result.files_per_second:.1f} files/s, {result.bytes_per_second / 2**20:.2f} MiB/s)',
+        file=sys.stderr,
+    )
+    for name, exc in sorted(result.errors.items()):
+        print(f'{name}: failed: {exc}', file=sys.stderr)
+    return 1 if result.errors else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the ``py-mealdb`` command."""
+    parser = argparse.ArgumentParser(prog='py-mealdb', description='Tools for TheMealDB API.')
+    parser.add_argument('--api-key', default='1', help="TheMealDB API key (default: '1').")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    crawl_parser = commands.add_parser('crawl', help='Crawl the full catalog into a JSONL snapshot.')
+    crawl_parser.add_argument('output', help='Path of the JSONL snapshot file.')
+    crawl_parser.add_argument('--letters', default=LETTERS, help='First letters to crawl (default: a-z).')
+    crawl_parser.add_argument('--concurrency', type=int, default=8, help='Letters fetched at once (default: 8).')
+    crawl_parser.add_argument('--fresh', action='store_true', help='Ignore the checkpoint and start a new snapshot.')
+    crawl_parser.set_defaults(handler=_crawl)
+
+    mirror_parser = commands.add_parser('mirror-images', help='Mirror ingredient images into a directory.')
+    mirror_parser.add_argument('dest', help='Directory for the images and manifest.json.')
+    mirror_parser.add_argument('--ingredient', action='append', help='Ingredient to mirror; repeat for several (default: all).')
+    mirror_parser.add_argument('--concurrency', type=int, default=16, help='Downloads at once (default: 16).')
+    mirror_parser.add_argument('--revalidate', action='store_true', help='Re-check mirrored images with conditional requests.')
+    sizes = mirror_parser.add_mutually_exclusive_group()
+    sizes.add_argument('--small-only', action='store_true', help='Only mirror the small images.')
+    sizes.add_argument('--full-only', action='store_true', help='Only mirror the full-size images.')
+    mirror_parser.set_defaults(handler=_mirror_images)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point for the ``py-mealdb`` command.
+
+    Args:
+        argv: Command-line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
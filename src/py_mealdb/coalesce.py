@@ -0,0 +1,128 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Single-flight request coalescing.
+
+When several callers ask for the same URL at the same time, only the first one
+(the leader) performs the request; the others wait for it and receive the same
+response or exception. Nothing is kept once the call finishes, so this only
+collapses concurrent duplicates; use a cache to reuse finished responses.
+
+Endpoints that must return a fresh answer per call, such as ``random.php``,
+are never coalesced.
+
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+from .cache import endpoint_of
+
+T = TypeVar('T')
+
+UNCOALESCED_ENDPOINTS = frozenset({'random.php', 'randomselection.php'})
+
+
+def should_coalesce(url: str) -> bool:
+    """Return True if concurrent requests for ``url`` may share one response."""
+    return endpoint_of(url) not in UNCOALESCED_ENDPOINTS
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group for the synchronous client.
+
+    Attributes:
+        coalesced: Number of calls that were served by another caller's in-flight request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Run ``func`` unless a call for ``key`` is already in flight, then share its outcome.
+
+        Args:
+            key: Identity of the call, e.g. the request URL.
+            func: Performs the call; only invoked by the leader.
+
+        Returns:
+            The leader's result. Its exception is raised in every waiting caller.
+        """
+        with self._lock:
+            waiting = self._calls.get(key)
+            if waiting is None:
+                future: Future = Future()
+                self._calls[key] = future
+            else:
+                self.coalesced += 1
+        if waiting is not None:
+            return waiting.result()
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Single-flight group for the asyncio client.
+
+    The shared request runs as its own task, so cancelling one waiting caller
+    does not cancel the request for the others.
+
+    Attributes:
+        coalesced: Number of calls that were served by another caller's in-flight request.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``func()`` unless a call for ``key`` is already in flight, then share its outcome.
+
+        Args:
+            key: Identity of the call, e.g. the request URL.
+            func: Returns the awaitable performing the call; only invoked by the leader.
+
+        Returns:
+            The shared result. The shared exception is raised in every waiting caller.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            task.exception()
@@ -0,0 +1,27 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Shared constants for the sync and async TheMealDB clients.
+
+"""
+import string
+
+import httpx
+
+API_URL = 'https://www.themealdb.com/api/json/v1'
+IMAGE_URL = 'https://www.themealdb.com/images/ingredients'
+
+# First letters walked by ``search.php?f=`` to enumerate the catalog.
+LETTERS = string.ascii_lowercase
+
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
@@ -0,0 +1,151 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Full-catalog crawler for TheMealDB.
+
+``search.php?f=<letter>`` returns complete meal details, so walking every letter
+enumerates the whole catalog. The crawler fetches letters concurrently, writes each
+meal once (de-duplicated by ``idMeal``) to a JSONL snapshot as results arrive, and
+records finished letters in a checkpoint file so an interrupted crawl can resume.
+
+"""
+from __future__ import annotations
+
+import json
+import os
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, Union
+from .constants import LETTERS
+
+if TYPE_CHECKING:
+    from . import MealDB
+
+
+@dataclass
+class CrawlResult:
+    """
+    Summary of a crawl.
+
+    Attributes:
+        meals_written: Number of new meals appended to the snapshot.
+        letters_done: Letters completed in this run, in completion order.
+        letters_skipped: Letters skipped because the checkpoint already had them.
+        errors: Exceptions for letters that failed; these are retried on the next run.
+    """
+    meals_written: int = 0
+    letters_done: List[str] = field(default_factory=list)
+    letters_skipped: List[str] = field(default_factory=list)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+
+def checkpoint_path(output: Union[str, os.PathLike]) -> str:
+    """Return the checkpoint file path used for a snapshot file."""
+    return f'{os.fspath(output)}.checkpoint'
+
+
+def _load_checkpoint(path: str) -> Set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding='utf-8') as file:
+        return set(json.load(file).get('letters', []))
+
+
+def _save_checkpoint(path: str, letters: Set[str]) -> None:
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as file:
+        json.dump({'letters': sorted(letters)}, file)
+    os.replace(tmp, path)
+
+
+def _load_seen_ids(output: str) -> Set[str]:
+    """Read meal IDs already in the snapshot, dropping a partially written last line."""
+    seen: Set[str] = set()
+    if not os.path.exists(output):
+        return seen
+    with open(output, 'rb+') as file:
+        data = file.read()
+        end = data.rfind(b'\n') + 1
+        if end != len(data):
+            file.truncate(end)
+    for line in data[:end].splitlines():
+        if line.strip():
+            seen.add(json.loads(line)['idMeal'])
+    return seen
+
+
+def crawl(
+    meal_db: MealDB,
+    output: Union[str, os.PathLike],
+    letters: Iterable[str] = LETTERS,
+    max_concurrency: int = 8,
+    resume: bool = True,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> CrawlResult:
+    """
+    Crawl the full catalog into a JSONL snapshot.
+
+    Args:
+        meal_db: Client used for the ``search.php?f=`` requests.
+        output: Path of the JSONL snapshot. Each line is one raw meal dictionary.
+        letters: First letters to crawl. Defaults to ``a``-``z``.
+        max_concurrency: Maximum number of letters fetched at once. Defaults to 8.
+        resume: If True (default), skip letters in the checkpoint and append to an existing
+            snapshot. If False, start a new snapshot.
+        progress: Optional callback called with ``(letter, new_meals)`` as each letter finishes.
+
+    Returns:
+        CrawlResult describing what was written and which letters failed.
+    """
+    output = os.fspath(output)
+    checkpoint = checkpoint_path(output)
+    if not resume:
+        for path in (output, checkpoint):
+            if os.path.exists(path):
+                os.remove(path)
+
+    done = _load_checkpoint(checkpoint)
+    seen = _load_seen_ids(output)
+    result = CrawlResult()
+    pending = []
+    for letter in dict.fromkeys(letters):
+        (result.letters_skipped if letter in done else pending).append(letter)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor, \
+            open(output, 'a', encoding='utf-8') as file:
+        futures = {executor.submit(meal_db.list_all_meals, letter): letter for letter in pending}
+        for future in as_completed(futures):
+            letter = futures[future]
+            try:
+                meals = future.result()
+            except Exception as exc:
+                result.errors[letter] = exc
+                continue
+            written = 0
+            for meal in meals:
+                if meal['idMeal'] in seen:
+                    continue
+                seen.add(meal['idMeal'])
+                record = meal if isinstance(meal, dict) else meal.to_dict()
+                file.write(json.dumps(record, ensure_ascii=False) + '\n')
+                written += 1
+            file.flush()
+            os.fsync(file.fileno())
+            done.add(letter)
+            _save_checkpoint(checkpoint, done)
+            result.meals_written += written
+            result.letters_done.append(letter)
+            if progress is not None:
+                progress(letter, written)
+
+    return result
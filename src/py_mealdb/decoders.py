@@ -0,0 +1,217 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+JSON decoder backends for TheMealDB responses.
+
+``MealDB(decoder=...)`` accepts a backend name or instance:
+
+- ``'json'``: the standard library decoder.
+- ``'orjson'``: ``orjson.loads`` (``pip install py-mealdb[orjson]``).
+- ``'msgspec'``: decodes straight into typed ``msgspec.Struct`` items
+  (``pip install py-mealdb[msgspec]``).
+- ``'auto'``: the fastest installed backend, in the order msgspec, orjson, json.
+
+Every backend returns ``{key: [items]}`` so the existing models work unchanged.
+The msgspec structs support ``item['strMeal']`` and ``item.get(...)`` like the
+dictionaries they replace.
+
+"""
+from __future__ import annotations
+
+import json
+
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from .models import BaseList, MealList, MealDetails, AreaList, CategoryList, IngredientList
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class Decoder:
+    """
+    Standard library JSON decoder and base class for other backends.
+
+    Attributes:
+        name: The backend name.
+    """
+    name = 'json'
+
+    def decode(self, content: bytes, model: Optional[Type[BaseList]] = None, key: str = 'meals') -> Dict[str, Any]:
+        """
+        Decode a response body.
+
+        Args:
+            content: The raw response body.
+            model: The model the result is built into. Used by typed backends.
+            key: The key holding the items. Defaults to 'meals'.
+
+        Returns:
+            The decoded response, with items under ``key``.
+        """
+        return json.loads(content)
+
+
+class OrjsonDecoder(Decoder):
+    """Decoder backed by ``orjson``."""
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The 'orjson' decoder requires orjson: pip install py-mealdb[orjson]")
+
+    def decode(self, content: bytes, model: Optional[Type[BaseList]] = None, key: str = 'meals') -> Dict[str, Any]:
+        return orjson.loads(content)
+
+
+if msgspec is not None:
+
+    class _Item(msgspec.Struct, gc=False):
+        """Struct base giving mapping-style access, so models can treat structs like dicts."""
+
+        def __getitem__(self, name: str) -> Any:
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                raise KeyError(name) from None
+
+        def get(self, name: str, default: Any = None) -> Any:
+            return getattr(self, name, default)
+
+        def to_dict(self) -> Dict[str, Any]:
+            return msgspec.structs.asdict(self)
+
+    _OptStr = Optional[str]
+
+    MealStruct = msgspec.defstruct(
+        'MealStruct',
+        [('idMeal', str), ('strMeal', str)]
+        + [(name, _OptStr, None) for name in (
+            'strMealAlternate', 'strDrinkAlternate', 'strCategory', 'strArea', 'strInstructions',
+            'strMealThumb', 'strTags', 'strYoutube', 'strSource', 'strImageSource',
+            'strCreativeCommonsConfirmed', 'dateModified',
+        )]
+        + [(f'strIngredient{i}', _OptStr, None) for i in range(1, 21)]
+        + [(f'strMeasure{i}', _OptStr, None) for i in range(1, 21)],
+        bases=(_Item,),
+        gc=False,
+    )
+
+    class MealSummaryStruct(_Item, gc=False):
+        """A ``filter.php`` meal summary."""
+        idMeal: str
+        strMeal: str
+        strMealThumb: _OptStr = None
+
+    class CategoryStruct(_Item, gc=False):
+        """A ``categories.php`` or ``list.php?c=list`` category."""
+        strCategory: str
+        idCategory: _OptStr = None
+        strCategoryThumb: _OptStr = None
+        strCategoryDescription: _OptStr = None
+
+    class AreaStruct(_Item, gc=False):
+        """A ``list.php?a=list`` area."""
+        strArea: str
+
+    class IngredientStruct(_Item, gc=False):
+        """A ``list.php?i=list`` ingredient."""
+        strIngredient: str
+        idIngredient: _OptStr = None
+        strDescription: _OptStr = None
+        strType: _OptStr = None
+        strThumb: _OptStr = None
+
+    _ITEM_TYPES: Dict[Type[BaseList], Any] = {
+        MealDetails: MealStruct,
+        MealList: MealSummaryStruct,
+        CategoryList: CategoryStruct,
+        AreaList: AreaStruct,
+        IngredientList: IngredientStruct,
+    }
+
+
+class MsgspecDecoder(Decoder):
+    """
+    Decoder backed by ``msgspec`` that builds typed structs instead of dictionaries.
+
+    Known models are decoded straight into ``MealStruct``, ``MealSummaryStruct``,
+    ``CategoryStruct``, ``AreaStruct`` or ``IngredientStruct`` items; anything else
+    falls back to untyped decoding.
+    """
+    name = 'msgspec'
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("The 'msgspec' decoder requires msgspec: pip install py-mealdb[msgspec]")
+        self._untyped = msgspec.json.Decoder()
+        self._typed: Dict[Tuple[Type[BaseList], str], Any] = {}
+
+    def _decoder_for(self, model: Optional[Type[BaseList]], key: str) -> Any:
+        item_type = _ITEM_TYPES.get(model)
+        if item_type is None:
+            return self._untyped
+        decoder = self._typed.get((model, key))
+        if decoder is None:
+            response = msgspec.defstruct('Response', [(key, Optional[List[item_type]], None)])
+            decoder = self._typed[(model, key)] = msgspec.json.Decoder(response)
+        return decoder
+
+    def decode(self, content: bytes, model: Optional[Type[BaseList]] = None, key: str = 'meals') -> Dict[str, Any]:
+        decoder = self._decoder_for(model, key)
+        if decoder is self._untyped:
+            return decoder.decode(content)
+        return {key: getattr(decoder.decode(content), key)}
+
+
+# Ordered from slowest to fastest; 'auto' picks the last installed one.
+DECODERS: Dict[str, Type[Decoder]] = {
+    'json': Decoder,
+    'orjson': OrjsonDecoder,
+    'msgspec': MsgspecDecoder,
+}
+
+
+def available_decoders() -> List[str]:
+    """Return the names of the decoder backends that can be used in this environment."""
+    installed = {'json': True, 'orjson': orjson is not None, 'msgspec': msgspec is not None}
+    return [name for name in DECODERS if installed[name]]
+
+
+def get_decoder(decoder: Union[str, Decoder, None] = 'auto') -> Optional[Decoder]:
+    """
+    Resolve a decoder name or instance.
+
+    Args:
+        decoder: A backend name ('json', 'orjson', 'msgspec' or 'auto'), a Decoder
+            instance, or None for the client's default ``response.json()``.
+
+    Returns:
+        A Decoder instance, or None.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if decoder is None or isinstance(decoder, Decoder):
+        return decoder
+    if decoder == 'auto':
+        decoder = available_decoders()[-1]
+    if decoder not in DECODERS:
+        raise ValueError(f"Unknown decoder {decoder!r}; expected one of {sorted(DECODERS)} or 'auto'")
+    return DECODERS[decoder]()
@@ -0,0 +1,121 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Helpers for streaming ingredient image downloads.
+
+Images are streamed in chunks rather than read into memory. When the destination
+is a directory, chunks go to a temporary file next to the target, which is renamed
+into place only once the download completes, so readers never see a partial PNG.
+An existing file's modification time is sent as ``If-Modified-Since`` and a
+``304 Not Modified`` reply leaves it untouched; the file's mtime is set from the
+response's ``Last-Modified`` so later requests can be conditional.
+
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+
+from email.utils import formatdate, parsedate_to_datetime
+from typing import IO, Dict, Mapping, Optional, Union
+from .constants import IMAGE_URL
+
+Destination = Union[str, os.PathLike, IO[bytes]]
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: changing the umask is process-wide and racy once download threads run.
+_FILE_MODE = 0o666 & ~_umask()
+
+
+def image_url(ingredient: str, small: bool = False) -> str:
+    """Return the URL of an ingredient image."""
+    return f'{IMAGE_URL}/{ingredient}-Small.png' if small else f'{IMAGE_URL}/{ingredient}.png'
+
+
+def image_filename(ingredient: str, small: bool = False) -> str:
+    """Return the file name an ingredient image is saved under."""
+    return f'{ingredient}-small.png' if small else f'{ingredient}.png'
+
+
+def is_directory_target(dest: Destination) -> bool:
+    """Whether ``dest`` names a directory rather than a writable binary sink."""
+    return isinstance(dest, (str, os.PathLike))
+
+
+def conditional_headers(path: str) -> Dict[str, str]:
+    """
+    Build the conditional request headers for an image saved at ``path``.
+
+    Args:
+        path: The target file path.
+
+    Returns:
+        ``{'If-Modified-Since': ...}`` from the file's mtime, or an empty dict if it does not exist.
+    """
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return {}
+    return {'If-Modified-Since': formatdate(mtime, usegmt=True)}
+
+
+def set_mtime(path: str, headers: Mapping[str, str]) -> None:
+    """Set a downloaded file's mtime from the response's ``Last-Modified`` header, if valid."""
+    last_modified = headers.get('last-modified')
+    if not last_modified:
+        return
+    try:
+        timestamp = parsedate_to_datetime(last_modified).timestamp()
+    except (TypeError, ValueError):
+        return
+    os.utime(path, (timestamp, timestamp))
+
+
+class AtomicFile:
+    """
+    Context manager writing to a temporary file that replaces ``path`` on success.
+
+    The temporary file is created in the target directory so the final
+    ``os.replace`` is atomic. If the block raises, it is removed and ``path``
+    is left as it was.
+
+    Attributes:
+        path: The final file path.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._tmp: Optional[str] = None
+        self._file: Optional[IO[bytes]] = None
+
+    def __enter__(self) -> IO[bytes]:
+        directory, name = os.path.split(self.path)
+        fd, self._tmp = tempfile.mkstemp(dir=directory or '.', prefix=f'.{name}.', suffix='.part')
+        self._file = os.fdopen(fd, 'wb')
+        return self._file
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        tmp, file = self._tmp, self._file
+        assert tmp is not None and file is not None, '__exit__ called before __enter__'
+        file.close()
+        if exc_type is None:
+            # mkstemp creates the file owner-only; give it the mode open() would have.
+            os.chmod(tmp, _FILE_MODE)
+            os.replace(tmp, self.path)
+        else:
+            os.remove(tmp)
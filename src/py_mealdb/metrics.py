@@ -0,0 +1,265 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Per-endpoint metrics and request hooks for the MealDB clients.
+
+Pass a ``Metrics`` instance to ``MealDB(metrics=...)`` or ``AsyncMealDB(metrics=...)``
+to record, for every endpoint:
+
+- request attempts by status code (or exception name), and retries
+- a latency histogram of each attempt
+- response bytes received
+- time spent decoding JSON and building models
+- cache hits and misses
+
+Endpoints are labelled by script and query parameter, e.g. ``filter.php?a`` for
+``filter_by_area``, so every client method has its own series. ``before_request``
+and ``after_response`` register callbacks, and ``to_prometheus()`` renders the
+Prometheus text exposition format. Without ``metrics=`` the clients skip all of this.
+
+"""
+from __future__ import annotations
+
+import threading
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def endpoint_label(url: str) -> str:
+    """
+    Return the metrics label for a request URL.
+
+    Args:
+        url: The absolute request URL.
+
+    Returns:
+        The script name plus the first query parameter name (e.g. ``'filter.php?a'``),
+        the bare script name when there is no query, or ``'images/ingredients'`` for images.
+    """
+    parts = urlsplit(url)
+    if '/images/ingredients/' in parts.path:
+        return 'images/ingredients'
+    script = parts.path.rsplit('/', 1)[-1]
+    param = parts.query.split('=', 1)[0].split('&', 1)[0]
+    return f'{script}?{param}' if param else script
+
+
+@dataclass
+class RequestEvent:
+    """
+    One request attempt, passed to ``after_response`` hooks.
+
+    Attributes:
+        endpoint: The endpoint label, e.g. ``'lookup.php?i'``.
+        url: The request URL.
+        status: The response status code, or None if the attempt raised.
+        elapsed: Seconds until the response headers (and, for API calls, the body) arrived.
+        bytes: Response bytes received (0 for streamed downloads, which report later).
+        attempt: 0 for the first attempt, 1 for the first retry, and so on.
+        error: The exception raised by the attempt, if any.
+    """
+    endpoint: str
+    url: str
+    status: Optional[int]
+    elapsed: float
+    bytes: int = 0
+    attempt: int = 0
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class EndpointStats:
+    """
+    Counters for one endpoint.
+
+    Attributes:
+        statuses: Attempts by status code, or by exception class name for failures.
+        retries: Attempts that were retries.
+        buckets: Cumulative latency histogram counts, aligned with ``Metrics.buckets``.
+        latency_count: Number of latency observations.
+        latency_sum: Sum of latencies in seconds.
+        bytes: Response bytes received.
+        decode_seconds: Time spent decoding JSON.
+        build_seconds: Time spent building models from decoded data.
+        parses: Responses decoded into models.
+        cache_hits: Lookups served from the response cache.
+        cache_misses: Lookups that went to the network.
+    """
+    statuses: Dict[str, int] = field(default_factory=dict)
+    retries: int = 0
+    buckets: List[int] = field(default_factory=list)
+    latency_count: int = 0
+    latency_sum: float = 0.0
+    bytes: int = 0
+    decode_seconds: float = 0.0
+    build_seconds: float = 0.0
+    parses: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+class Metrics:
+    """
+    Thread-safe metrics registry and hook dispatcher for one or more clients.
+
+    Usage::
+
+        metrics = Metrics()
+        metrics.after_response(lambda event: log.info('%s %s %.3fs', event.endpoint, event.status, event.elapsed))
+        mb = MealDB('1', metrics=metrics)
+        ...
+        print(metrics.to_prometheus())
+
+    Attributes:
+        buckets: Upper bounds of the latency histogram buckets, in seconds.
+        namespace: Prefix for exported metric names.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, namespace: str = 'mealdb'):
+        """
+        Initialize an empty registry.
+
+        Args:
+            buckets: Latency histogram bucket bounds in seconds. Defaults to ``DEFAULT_BUCKETS``.
+            namespace: Prefix for exported metric names. Defaults to 'mealdb'.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = defaultdict(self._new_endpoint)
+        self._before: List[Callable[[str], None]] = []
+        self._after: List[Callable[[RequestEvent], None]] = []
+
+    def _new_endpoint(self) -> EndpointStats:
+        return EndpointStats(buckets=[0] * len(self.buckets))
+
+    def before_request(self, callback: Callable[[str], None]) -> Callable[[str], None]:
+        """
+        Register a callback run with the URL before every network attempt.
+
+        Can be used as a decorator. Exceptions raised by the callback propagate to the caller.
+        """
+        self._before.append(callback)
+        return callback
+
+    def after_response(self, callback: Callable[[RequestEvent], None]) -> Callable[[RequestEvent], None]:
+        """
+        Register a callback run with a ``RequestEvent`` after every network attempt.
+
+        Can be used as a decorator. Exceptions raised by the callback propagate to the caller.
+        """
+        self._after.append(callback)
+        return callback
+
+    def request_started(self, url: str) -> None:
+        """Run the ``before_request`` hooks for a network attempt."""
+        for callback in self._before:
+            callback(url)
+
+    def record_attempt(self, event: RequestEvent) -> None:
+        """Record a network attempt and run the ``after_response`` hooks."""
+        with self._lock:
+            stats = self._endpoints[event.endpoint]
+            status = str(event.status) if event.error is None else type(event.error).__name__
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.retries += event.attempt > 0
+            stats.latency_count += 1
+            stats.latency_sum += event.elapsed
+            for i, bound in enumerate(self.buckets):
+                if event.elapsed <= bound:
+                    stats.buckets[i] += 1
+            stats.bytes += event.bytes
+        for callback in self._after:
+            callback(event)
+
+    def record_bytes(self, url: str, count: int) -> None:
+        """Add response bytes received outside ``record_attempt``, e.g. for streamed downloads."""
+        with self._lock:
+            self._endpoints[endpoint_label(url)].bytes += count
+
+    def record_parse(self, url: str, decode_seconds: float, build_seconds: float) -> None:
+        """Record the time spent decoding a response and building its model."""
+        with self._lock:
+            stats = self._endpoints[endpoint_label(url)]
+            stats.decode_seconds += decode_seconds
+            stats.build_seconds += build_seconds
+            stats.parses += 1
+
+    def record_cache(self, url: str, hit: bool) -> None:
+        """Record a response cache lookup."""
+        with self._lock:
+            stats = self._endpoints[endpoint_label(url)]
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+
+    def snapshot(self) -> Dict[str, EndpointStats]:
+        """Return a copy of the counters, keyed by endpoint label."""
+        with self._lock:
+            return {
+                endpoint: EndpointStats(**{**vars(stats), 'statuses': dict(stats.statuses), 'buckets': list(stats.buckets)})
+                for endpoint, stats in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        """Clear all counters. Registered hooks are kept."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self) -> str:
+        """
+        Render the counters in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text; serve it with ``PROMETHEUS_CONTENT_TYPE``.
+        """
+        snapshot = sorted(self.snapshot().items())
+        ns = self.namespace
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help: str) -> None:
+            lines.append(f'# HELP {ns}_{name} {help}')
+            lines.append(f'# TYPE {ns}_{name} {kind}')
+
+        family('requests_total', 'counter', 'Request attempts by endpoint and status code or error.')
+        for endpoint, stats in snapshot:
+            for status, count in sorted(stats.statuses.items()):
+                lines.append(f'{ns}_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+        family('retries_total', 'counter', 'Request attempts that were retries.')
+        for endpoint, stats in snapshot:
+            lines.append(f'{ns}_retries_total{{endpoint="{endpoint}"}} {stats.retries}')
+        family('request_duration_seconds', 'histogram', 'Latency of request attempts.')
+        for endpoint, stats in snapshot:
+            for bound, count in zip(self.buckets, stats.buckets):
+                lines.append(f'{ns}_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound:g}"}} {count}')
+            lines.append(f'{ns}_request_duration_seconds_bucket{{endpoint="{endpoint}",le="+Inf"}} {stats.latency_count}')
+            lines.append(f'{ns}_request_duration_seconds_sum{{endpoint="{endpoint}"}} {stats.latency_sum!r}')
+            lines.append(f'{ns}_request_duration_seconds_count{{endpoint="{endpoint}"}} {stats.latency_count}')
+        for name, attribute, help in (
+            ('response_bytes_total', 'bytes', 'Response bytes received.'),
+            ('decode_seconds_total', 'decode_seconds', 'Time spent decoding JSON responses.'),
+            ('build_seconds_total', 'build_seconds', 'Time spent building models from decoded responses.'),
+            ('cache_hits_total', 'cache_hits', 'Responses served from the cache.'),
+            ('cache_misses_total', 'cache_misses', 'Cache lookups that went to the network.'),
+        ):
+            family(name, 'counter', help)
+            for endpoint, stats in snapshot:
+                lines.append(f'{ns}_{name}{{endpoint="{endpoint}"}} {getattr(stats, attribute)!r}')
+        return '\n'.join(lines) + '\n'
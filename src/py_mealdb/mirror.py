@@ -0,0 +1,208 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Bulk mirror of TheMealDB ingredient images.
+
+``mirror_images`` downloads the full-size and small image of every ingredient
+concurrently into one directory. A ``manifest.json`` next to the images records
+each file's size, SHA-256 and ETag. Files already in the manifest (and present
+with the recorded size) are skipped, so an interrupted mirror resumes where it
+stopped; ``revalidate=True`` instead re-checks them with conditional requests.
+
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from .images import image_filename
+
+if TYPE_CHECKING:
+    from . import MealDB
+
+MANIFEST = 'manifest.json'
+# Completed files between manifest saves while a mirror runs.
+SAVE_EVERY = 50
+
+
+@dataclass
+class MirrorResult:
+    """
+    Summary of a mirror run.
+
+    Attributes:
+        downloaded: Files written in this run.
+        unchanged: Files the server reported as not modified.
+        skipped: Files skipped because the manifest already had them.
+        bytes: Total size of the files written in this run.
+        elapsed: Wall-clock duration of the run in seconds.
+        errors: Exceptions for files that failed, keyed by file name; these are retried on the next run.
+    """
+    downloaded: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def files_per_second(self) -> float:
+        """Downloaded files per second."""
+        return self.downloaded / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Download throughput in bytes per second."""
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+
+def manifest_path(dest: Union[str, os.PathLike]) -> str:
+    """Return the manifest path used for a mirror directory."""
+    return os.path.join(os.fspath(dest), MANIFEST)
+
+
+def load_manifest(dest: Union[str, os.PathLike]) -> Dict[str, Dict[str, Any]]:
+    """
+    Read a mirror directory's manifest.
+
+    Args:
+        dest: The mirror directory.
+
+    Returns:
+        Mapping of file name to its ``ingredient``, ``small``, ``size``, ``sha256`` and ``etag``,
+        or an empty dict if there is no manifest yet.
+    """
+    path = manifest_path(dest)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as file:
+        return json.load(file).get('files', {})
+
+
+def _save_manifest(dest: str, files: Dict[str, Dict[str, Any]]) -> None:
+    path = manifest_path(dest)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as file:
+        json.dump({'files': dict(sorted(files.items()))}, file, indent=1)
+    os.replace(tmp, path)
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_current(dest: str, name: str, entry: Optional[Dict[str, Any]]) -> bool:
+    """Whether a manifest entry exists and its file is on disk with the recorded size."""
+    if entry is None:
+        return False
+    try:
+        return os.path.getsize(os.path.join(dest, name)) == entry['size']
+    except OSError:
+        return False
+
+
+def mirror_images(
+    meal_db: MealDB,
+    dest: Union[str, os.PathLike],
+    ingredients: Optional[Iterable[str]] = None,
+    small: bool = True,
+    full: bool = True,
+    max_concurrency: int = 16,
+    revalidate: bool = False,
+    progress: Optional[Callable[[str, str], None]] = None,
+) -> MirrorResult:
+    """
+    Mirror ingredient images into a directory.
+
+    Args:
+        meal_db: Client used for the downloads (and the ingredient list).
+        dest: The mirror directory; created if missing.
+        ingredients: Ingredient names to mirror. Defaults to ``meal_db.list_all_ingredients()``.
+        small: Mirror the small images. Defaults to True.
+        full: Mirror the full-size images. Defaults to True.
+        max_concurrency: Maximum number of downloads at once. Defaults to 16.
+        revalidate: Re-check files already in the manifest with ``If-None-Match`` and
+            ``If-Modified-Since`` instead of skipping them. Defaults to False.
+        progress: Optional callback called with ``(file_name, status)`` as each file
+            finishes; status is 'downloaded', 'unchanged' or 'failed'.
+
+    Returns:
+        MirrorResult with counts, throughput and per-file errors.
+    """
+    started = time.perf_counter()
+    dest = os.fspath(dest)
+    os.makedirs(dest, exist_ok=True)
+    if ingredients is None:
+        ingredients = meal_db.list_all_ingredients().ingredients
+    variants = [flag for flag, wanted in ((False, full), (True, small)) if wanted]
+
+    files = load_manifest(dest)
+    result = MirrorResult()
+    pending: Dict[str, Tuple[str, bool]] = {}
+    for ingredient in dict.fromkeys(ingredients):
+        for is_small in variants:
+            name = image_filename(ingredient, is_small)
+            if not revalidate and _is_current(dest, name, files.get(name)):
+                result.skipped += 1
+            else:
+                pending[name] = (ingredient, is_small)
+
+    def fetch(name: str, ingredient: str, is_small: bool) -> Tuple[str, Dict[str, Any]]:
+        entry = files.get(name) if _is_current(dest, name, files.get(name)) else None
+        headers = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else None
+        r = meal_db.download_image(ingredient, dest, is_small, headers=headers)
+        if r is None and entry is not None:
+            return 'unchanged', entry
+        # Either a new download, or an untracked file on disk the server says is current.
+        path = os.path.join(dest, name)
+        return ('unchanged' if r is None else 'downloaded'), {
+            'ingredient': ingredient,
+            'small': is_small,
+            'size': os.path.getsize(path),
+            'sha256': _sha256(path),
+            'etag': None if r is None else r.headers.get('etag'),
+        }
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {executor.submit(fetch, name, *args): name for name, args in pending.items()}
+            for done, future in enumerate(as_completed(futures), 1):
+                name = futures[future]
+                try:
+                    status, files[name] = future.result()
+                except Exception as exc:
+                    result.errors[name] = exc
+                    status = 'failed'
+                else:
+                    if status == 'downloaded':
+                        result.downloaded += 1
+                        result.bytes += files[name]['size']
+                    else:
+                        result.unchanged += 1
+                if done % SAVE_EVERY == 0:
+                    _save_manifest(dest, files)
+                if progress is not None:
+                    progress(name, status)
+    finally:
+        _save_manifest(dest, files)
+        result.elapsed = time.perf_counter() - started
+
+    return result
@@ -19,8 +19,298 @@ BaseList which provides common functionality for list-based data structures.
 
 """
 from __future__ import annotations
+
+import json
+import re
+
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Generic, Union, Optional, Iterator
+from sys import intern
+from typing import List, Dict, Any, Generic, Mapping, Tuple, TypeVar, Union, Optional, Iterable, Iterator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class LazyItems(Sequence):
+    """
+    Read-only item sequence backed by a raw JSON response body.
+
+    Nothing is decoded up front. Single fields such as ``idMeal`` are extracted
+    straight from the buffer by ``column`` without building any item dictionaries;
+    the full payload is decoded once, on first indexing, iteration or ``len``.
+
+    Attributes:
+        raw: The raw response body.
+        key: The top-level key holding the item list.
+    """
+
+    def __init__(self, raw: bytes, key: str = 'meals'):
+        """
+        Wrap a response body.
+
+        Args:
+            raw: The raw JSON response body.
+            key: The top-level key holding the item list. Defaults to 'meals'.
+        """
+        self.raw = raw
+        self.key = key
+        self._items: Optional[List[Dict[str, Any]]] = None
+        self._columns: Dict[str, List[Any]] = {}
+        self._count: Optional[int] = None
+
+    @property
+    def decoded(self) -> bool:
+        """Whether the full payload has been decoded."""
+        return self._items is not None
+
+    def _decode(self) -> List[Dict[str, Any]]:
+        if self._items is None:
+            self._items = json.loads(self.raw).get(self.key) or []
+        return self._items
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Return one field of every item, without decoding the whole payload.
+
+        Items are flat objects, so each ``"name": value`` pair in the buffer belongs
+        to exactly one item; escaped quotes inside string values cannot match. Only
+        string and null values are read from the buffer. If the number of matches
+        differs from the number of items (a missing field or a value of another
+        type), the payload is decoded in full instead. Columns are cached, so the
+        same list is returned on every call; treat it as read-only.
+
+        Args:
+            name: The field name, e.g. 'idMeal'.
+
+        Returns:
+            List with the field value of each item, in order.
+
+        Raises:
+            KeyError: If an item has no ``name`` field.
+        """
+        values = self._columns.get(name)
+        if values is None:
+            if self._items is None:
+                values = self._scan(name)
+            if values is None:
+                values = [item[name] for item in self._decode()]
+            self._columns[name] = values
+        return values
+
+    def _scan(self, name: str) -> Optional[List[Any]]:
+        """Read the ``name`` field of every item from the buffer, or None if that is not possible."""
+        text = self.raw.decode()
+        if self._count is None:
+            # Flat items: every brace outside a string opens the payload or one item.
+            self._count = _STRING.sub('', text).count('{') - 1
+        pattern = _COLUMN_PATTERNS.get(name)
+        if pattern is None:
+            pattern = _COLUMN_PATTERNS[name] = re.compile(
+                '"' + re.escape(name) + r'"\s*:\s*(null|' + _STRING.pattern + ')'
+            )
+        values = pattern.findall(text)
+        if len(values) != self._count:
+            return None
+        return [_decode_scalar(value) for value in values]
+
+    def __getitem__(self, index):
+        return self._decode()[index]
+
+    def __len__(self) -> int:
+        return len(self._decode())
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._decode())
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_COLUMN_PATTERNS: Dict[str, re.Pattern] = {}
+
+
+def _decode_scalar(value: str) -> Optional[str]:
+    """Decode a JSON string or null literal matched in a raw buffer."""
+    if value == 'null':
+        return None
+    if '\\' in value:
+        return json.loads(value)
+    return value[1:-1]
+
+
+class MealColumns(Sequence):
+    """
+    Read-only, column-oriented storage for meal summaries.
+
+    Meal IDs are kept as integers in an ``array('l')``; names and thumbnails are
+    tuples of interned strings. Rows are rebuilt as ``{'strMeal', 'strMealThumb',
+    'idMeal'}`` dictionaries on access, so code written for list-backed items keeps
+    working. Column values are computed once and cached.
+
+    Attributes:
+        id_array: The meal IDs as integers, in order.
+        names: The meal names.
+        thumbnails: The thumbnail URLs (None when missing).
+    """
+
+    def __init__(self, ids: Iterable[int], names: Iterable[Optional[str]], thumbnails: Iterable[Optional[str]]):
+        """
+        Build the columns.
+
+        Args:
+            ids: Integer meal IDs.
+            names: Meal names, aligned with ``ids``.
+            thumbnails: Thumbnail URLs, aligned with ``ids``.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        self.id_array = ids if isinstance(ids, array) else array('l', ids)
+        self.names = tuple(names)
+        self.thumbnails = tuple(thumbnails)
+        if not len(self.id_array) == len(self.names) == len(self.thumbnails):
+            raise ValueError('Columns must all have the same length')
+        self._views: Dict[str, Any] = {}
+
+    @classmethod
+    def from_items(cls, items: Iterable[Mapping[str, Any]]) -> MealColumns:
+        """
+        Build columns from ``filter.php``-style meal dictionaries.
+
+        Args:
+            items: Meal summaries with ``idMeal``, ``strMeal`` and ``strMealThumb``.
+
+        Returns:
+            A MealColumns instance.
+
+        Raises:
+            ValueError: If an ``idMeal`` is not numeric.
+        """
+        ids = array('l')
+        names = []
+        thumbnails = []
+        for item in items:
+            ids.append(int(item['idMeal']))
+            names.append(_intern_or_none(item.get('strMeal')))
+            thumbnails.append(_intern_or_none(item.get('strMealThumb')))
+        return cls(ids, names, thumbnails)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes, key: str = 'meals') -> MealColumns:
+        """
+        Build columns from a raw ``filter.php``-style response body.
+
+        The three fields are read straight from the buffer with ``LazyItems.column``,
+        so no item dictionaries are built unless a field is missing from some item.
+
+        Args:
+            raw: The raw response body.
+            key: The key holding the items. Defaults to 'meals'.
+
+        Returns:
+            A MealColumns instance.
+
+        Raises:
+            ValueError: If an ``idMeal`` is not numeric.
+        """
+        items = LazyItems(raw, key)
+        try:
+            return cls(
+                array('l', [int(id) for id in items.column('idMeal')]),
+                [_intern_or_none(name) for name in items.column('strMeal')],
+                [_intern_or_none(thumbnail) for thumbnail in items.column('strMealThumb')],
+            )
+        except KeyError:
+            return cls.from_items(items)
+
+    def take(self, positions: Iterable[int]) -> MealColumns:
+        """
+        Return a new instance with the rows at ``positions``, in that order.
+
+        Args:
+            positions: Row indexes to keep.
+        """
+        positions = list(positions)
+        return MealColumns(
+            array('l', [self.id_array[i] for i in positions]),
+            [self.names[i] for i in positions],
+            [self.thumbnails[i] for i in positions],
+        )
+
+    def id_set(self) -> frozenset:
+        """Return the IDs as a cached set of integers for membership tests."""
+        ids = self._views.get('id_set')
+        if ids is None:
+            ids = self._views['id_set'] = frozenset(self.id_array)
+        return ids
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Return one field of every row as a cached list.
+
+        The same list is returned on every call; treat it as read-only.
+
+        Args:
+            name: 'idMeal', 'strMeal' or 'strMealThumb'.
+
+        Returns:
+            List with the field value of each row, in order.
+        """
+        view = self._views.get(name)
+        if view is None:
+            if name == 'idMeal':
+                view = [str(id) for id in self.id_array]
+            elif name == 'strMeal':
+                view = list(self.names)
+            elif name == 'strMealThumb':
+                view = list(self.thumbnails)
+            else:
+                raise KeyError(name)
+            self._views[name] = view
+        return view
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        return {
+            'strMeal': self.names[index],
+            'strMealThumb': self.thumbnails[index],
+            'idMeal': str(self.id_array[index]),
+        }
+
+    def __len__(self) -> int:
+        return len(self.id_array)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MealColumns):
+            return (self.id_array, self.names, self.thumbnails) == (other.id_array, other.names, other.thumbnails)
+        return list(self) == list(other)
+
+
+def _id_positions(ids: array, keep: Iterable[array]) -> List[int]:
+    """Return the positions in ``ids`` whose value appears in every ``keep`` array."""
+    if numpy is not None:
+        values = numpy.frombuffer(ids, dtype=ids.typecode)
+        mask = numpy.ones(len(values), dtype=bool)
+        for other in keep:
+            mask &= numpy.isin(values, numpy.frombuffer(other, dtype=other.typecode))
+        return numpy.flatnonzero(mask).tolist()
+    common = set(ids)
+    for other in keep:
+        common.intersection_update(other)
+    return [i for i, id in enumerate(ids) if id in common]
+
+
+ModelT = TypeVar('ModelT', bound='BaseList')
+
 
 @dataclass
 class BaseList:
@@ -31,9 +321,11 @@ class BaseList:
     including iteration, indexing, length checking, and string representation.
     
     Attributes:
-        items: List of dictionaries containing API response data.
+        items: List of dictionaries containing API response data, a
+            ``LazyItems`` sequence for instances built with ``from_bytes``, or
+            ``MealColumns`` for columnar meal lists.
     """
-    items: List[Dict[str, Any]] = field(default_factory=list)
+    items: Sequence[Mapping[str, Any]] = field(default_factory=list)
     
     @classmethod
     def from_response(cls, data: dict, key: str = 'meals') -> BaseList:
@@ -45,15 +337,39 @@ class BaseList:
             key: The key to extract from the response. Defaults to 'meals'.
         
         Returns:
-            An instance of the class with items populated from the response.
+            An instance of the class with items populated from the response,
+            or empty if the key is missing or null.
+        """
+        return cls(items=data.get(key) or [])
+    
+    @classmethod
+    def from_bytes(cls, raw: bytes, key: str = 'meals') -> BaseList:
+        """
+        Create a lazy instance from a raw JSON response body.
+        
+        The body is kept as-is. Column properties such as ``ids`` and ``names`` read
+        their field straight from the buffer; the items are decoded on first access.
+        
+        Args:
+            raw: The raw response body.
+            key: The key holding the items. Defaults to 'meals'.
+        
+        Returns:
+            An instance whose items are a ``LazyItems`` sequence.
         """
-        return cls(items=data.get(key, []))
+        return cls(items=LazyItems(raw, key))
+    
+    def _column(self, name: str) -> List[Any]:
+        """Return the ``name`` field of every item, reading lazy and columnar storage directly."""
+        if isinstance(self.items, (LazyItems, MealColumns)):
+            return self.items.column(name)
+        return [item[name] for item in self.items]
     
     def __len__(self) -> int:
         """Return the number of items in the list."""
         return len(self.items)
     
-    def __getitem__(self, index: int) -> Dict[str, Any]:
+    def __getitem__(self, index: int) -> Mapping[str, Any]:
         """
         Get an item by index.
         
@@ -65,7 +381,7 @@ class BaseList:
         """
         return self.items[index]
     
-    def __iter__(self) -> Iterator[Dict[str, Any]]:
+    def __iter__(self) -> Iterator[Mapping[str, Any]]:
         """Return an iterator over the items."""
         return iter(self.items)
     
@@ -83,6 +399,127 @@ class MealList(BaseList):
     meal ID, name, and thumbnail. Typically used for filter and list endpoints.
     """
     
+    @classmethod
+    def from_columns(cls, ids: Iterable[Union[int, str]], names: Iterable[str], thumbnails: Iterable[Optional[str]]) -> MealList:
+        """
+        Create a columnar instance from aligned ID, name and thumbnail columns.
+        
+        Args:
+            ids: Numeric meal IDs, as integers or strings.
+            names: Meal names.
+            thumbnails: Thumbnail URLs.
+        
+        Returns:
+            An instance whose items are a ``MealColumns`` store.
+        """
+        return cls(items=MealColumns(
+            (int(id) for id in ids),
+            (_intern_or_none(name) for name in names),
+            (_intern_or_none(thumbnail) for thumbnail in thumbnails),
+        ))
+    
+    def columnar(self) -> MealList:
+        """
+        Return this list backed by ``MealColumns``.
+        
+        Columnar lists use much less memory for large results, cache their
+        ``ids``/``names``/``thumbnails`` views, and intersect on integer arrays
+        (with NumPy when it is installed).
+        
+        Returns:
+            A columnar instance, or ``self`` if it already is one.
+        """
+        if isinstance(self.items, MealColumns):
+            return self
+        return type(self)(items=MealColumns.from_items(self.items))
+    
+    @classmethod
+    def intersect(cls, lists: Iterable[MealList]) -> MealList:
+        """
+        Return the meals present in every list, matched on ``idMeal``.
+        
+        Lists are intersected from the smallest up, so the work is bounded by the
+        size of the smallest list rather than the product of the list sizes. When
+        every list is columnar the ID arrays are compared directly and the result
+        is columnar too.
+        
+        Args:
+            lists: The meal lists to intersect.
+        
+        Returns:
+            MealList with the common meals, in the order of the smallest list.
+        """
+        ordered = sorted(lists, key=len)
+        if not ordered:
+            return cls()
+        smallest = ordered[0].items
+        columns = [other.items for other in ordered if isinstance(other.items, MealColumns)]
+        if len(columns) == len(ordered):
+            positions = _id_positions(columns[0].id_array, [other.id_array for other in columns[1:]])
+            return cls(items=columns[0].take(positions))
+        ids = set(ordered[0].ids)
+        for other in ordered[1:]:
+            if not ids:
+                break
+            ids.intersection_update(other.ids)
+        return cls(items=[meal for meal in smallest if meal['idMeal'] in ids])
+    
+    @classmethod
+    def union(cls, lists: Iterable[MealList]) -> MealList:
+        """
+        Return the meals present in any list, matched on ``idMeal``.
+        
+        Args:
+            lists: The meal lists to combine.
+        
+        Returns:
+            MealList with each meal once, in first-seen order. Columnar if every
+            input list is columnar.
+        """
+        lists = list(lists)
+        columns = [other.items for other in lists if isinstance(other.items, MealColumns)]
+        if lists and len(columns) == len(lists):
+            ids = array('l')
+            names: List[Optional[str]] = []
+            thumbnails: List[Optional[str]] = []
+            for store in columns:
+                ids.extend(store.id_array)
+                names.extend(store.names)
+                thumbnails.extend(store.thumbnails)
+            merged = MealColumns(ids, names, thumbnails)
+            if numpy is not None:
+                _, first = numpy.unique(numpy.frombuffer(ids, dtype=ids.typecode), return_index=True)
+                positions = numpy.sort(first).tolist()
+            else:
+                seen = set()
+                positions = []
+                for i, id in enumerate(ids):
+                    if id not in seen:
+                        seen.add(id)
+                        positions.append(i)
+            return cls(items=merged.take(positions))
+        meals: Dict[str, Mapping[str, Any]] = {}
+        for other in lists:
+            for meal in other:
+                meals.setdefault(meal['idMeal'], meal)
+        return cls(items=list(meals.values()))
+    
+    def isin(self, ids: Iterable[Union[int, str]]) -> List[bool]:
+        """
+        Test which of ``ids`` are in this list.
+        
+        Args:
+            ids: Meal IDs to look up, as strings or integers.
+        
+        Returns:
+            One boolean per given ID, in order.
+        """
+        if isinstance(self.items, MealColumns):
+            known = self.items.id_set()
+            return [int(id) in known for id in ids]
+        present = set(self.ids)
+        return [str(id) in present for id in ids]
+    
     @property
     def ids(self) -> List[str]:
         """
@@ -91,7 +528,7 @@ class MealList(BaseList):
         Returns:
             List of meal IDs.
         """
-        return [meal['idMeal'] for meal in self.items]
+        return self._column('idMeal')
     
     @property
     def names(self) -> List[str]:
@@ -101,7 +538,7 @@ class MealList(BaseList):
         Returns:
             List of meal names.
         """
-        return [meal['strMeal'] for meal in self.items]
+        return self._column('strMeal')
     
     @property
     def thumbnails(self) -> List[str]:
@@ -111,7 +548,7 @@ class MealList(BaseList):
         Returns:
             List of thumbnail URLs.
         """
-        return [meal['strMealThumb'] for meal in self.items]
+        return self._column('strMealThumb')
 
 
 @dataclass
@@ -131,7 +568,7 @@ class AreaList(BaseList):
         Returns:
             List of area names.
         """
-        return [item['strArea'] for item in self.items]
+        return self._column('strArea')
 
 
 @dataclass
@@ -150,7 +587,7 @@ class CategoryList(BaseList):
         Returns:
             List of category names.
         """
-        return [item['strCategory'] for item in self.items]
+        return self._column('strCategory')
 
 
 @dataclass
@@ -169,7 +606,94 @@ class IngredientList(BaseList):
         Returns:
             List of ingredient names.
         """
-        return [item['strIngredient'] for item in self.items]
+        return self._column('strIngredient')
+
+
+@dataclass(slots=True)
+class Meal:
+    """
+    Compact, typed record for a single meal.
+
+    The raw API dictionary has about 50 keys, most of them empty ``strIngredientN``
+    and ``strMeasureN`` slots. ``Meal`` keeps only the populated ingredients and
+    measures as aligned tuples, uses ``__slots__`` instead of a per-instance dict,
+    and interns strings that repeat across meals (category, area, ingredient names,
+    measures and tags), so large catalogs take a fraction of the memory.
+
+    Attributes:
+        id: The meal ID (``idMeal``).
+        name: The meal name (``strMeal``).
+        category: The category, or None.
+        area: The area/cuisine, or None.
+        instructions: The cooking instructions, or None.
+        thumbnail: The thumbnail URL, or None.
+        tags: Tags parsed from ``strTags``.
+        youtube: The YouTube URL, or None.
+        source: The source URL, or None.
+        ingredients: Ingredient names, in recipe order.
+        measures: Measures aligned with ``ingredients``; empty string when missing.
+    """
+    id: str
+    name: str
+    category: Optional[str] = None
+    area: Optional[str] = None
+    instructions: Optional[str] = None
+    thumbnail: Optional[str] = None
+    tags: Tuple[str, ...] = ()
+    youtube: Optional[str] = None
+    source: Optional[str] = None
+    ingredients: Tuple[str, ...] = ()
+    measures: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Meal:
+        """
+        Build a record from a raw API meal dictionary.
+
+        Args:
+            data: A meal dictionary from ``search.php``, ``lookup.php`` or ``random.php``.
+
+        Returns:
+            A Meal with empty fields dropped and repeated strings interned.
+        """
+        ingredients = []
+        measures = []
+        for i in range(1, 21):
+            ingredient_name = data.get(f'strIngredient{i}')
+            if ingredient_name and ingredient_name.strip():
+                measure = data.get(f'strMeasure{i}')
+                ingredients.append(intern(ingredient_name.strip()))
+                measures.append(intern(measure.strip()) if measure else '')
+        tags_str = data.get('strTags')
+        return cls(
+            id=data['idMeal'],
+            name=data['strMeal'],
+            category=_intern_or_none(data.get('strCategory')),
+            area=_intern_or_none(data.get('strArea')),
+            instructions=data.get('strInstructions') or None,
+            thumbnail=data.get('strMealThumb') or None,
+            tags=tuple(intern(tag.strip()) for tag in tags_str.split(',') if tag.strip()) if tags_str else (),
+            youtube=data.get('strYoutube') or None,
+            source=data.get('strSource') or None,
+            ingredients=tuple(ingredients),
+            measures=tuple(measures),
+        )
+
+    def get_ingredients(self) -> List[Dict[str, str]]:
+        """
+        Return ingredients in the same shape as ``MealDetails.get_ingredients``.
+
+        Returns:
+            List of ingredient dictionaries with 'name' and 'measure' keys.
+        """
+        return [{'name': name, 'measure': measure} for name, measure in zip(self.ingredients, self.measures)]
+
+
+def _intern_or_none(value: Optional[str]) -> Optional[str]:
+    """Intern a stripped string, mapping empty values to None."""
+    if value and value.strip():
+        return intern(value.strip())
+    return None
 
 
 @dataclass
@@ -179,7 +703,13 @@ class MealDetails(BaseList):
     
     Used for endpoints that return complete meal data including instructions,
     ingredients, measurements, tags, and other detailed information.
+
+    Attributes:
+        items: List of meal dictionaries.
+        errors: Per-ID exceptions from bulk lookups such as ``meal_details_by_ids``,
+            with a ``LookupError`` for unknown IDs. Empty for single requests.
     """
+    errors: Dict[str, Exception] = field(default_factory=dict)
     
     @classmethod
     def from_response(cls, data: dict, key: str = 'meals') -> MealDetails:
@@ -198,6 +728,29 @@ class MealDetails(BaseList):
            return cls(items=[])
         return cls(items=meals_data)
     
+    @classmethod
+    def merge(cls, results: Dict[str, Union[MealDetails, Exception]]) -> MealDetails:
+        """
+        Merge per-ID lookup results into a single instance.
+        
+        Args:
+            results: Mapping of meal ID to its MealDetails or the exception it raised.
+        
+        Returns:
+            Instance with all found meals in key order. Failed lookups are in ``errors``,
+            and IDs the API does not know (``{"meals": null}``) map to a ``LookupError``.
+        """
+        items: List[Mapping[str, Any]] = []
+        merged = cls(items=items)
+        for id, result in results.items():
+            if isinstance(result, Exception):
+                merged.errors[id] = result
+            elif not len(result):
+                merged.errors[id] = LookupError(f'No meal with idMeal {id!r}')
+            else:
+                items.extend(result.items)
+        return merged
+    
     @property
     def ids(self) -> List[str]:
         """
@@ -206,7 +759,7 @@ class MealDetails(BaseList):
         Returns:
             List of meal IDs.
         """
-        return [meal['idMeal'] for meal in self.items]
+        return self._column('idMeal')
     
     @property
     def names(self) -> List[str]:
@@ -216,7 +769,7 @@ class MealDetails(BaseList):
         Returns:
             List of meal names.
         """
-        return [meal['strMeal'] for meal in self.items]
+        return self._column('strMeal')
     
     @property
     def categories(self) -> List[str]:
@@ -226,7 +779,7 @@ class MealDetails(BaseList):
         Returns:
             List of meal categories.
         """
-        return [meal['strCategory'] for meal in self.items]
+        return self._column('strCategory')
     
     @property
     def areas(self) -> List[str]:
@@ -236,7 +789,7 @@ class MealDetails(BaseList):
         Returns:
             List of meal areas.
         """
-        return [meal['strArea'] for meal in self.items]
+        return self._column('strArea')
     
     def get_ingredients(self, meal_index: int = 0) -> List[Dict[str, str]]:
         """
@@ -285,4 +838,16 @@ class MealDetails(BaseList):
         
         if tags_str:
             return [tag.strip() for tag in tags_str.split(',')]
-        return []
\ No newline at end of file
+        return []
+    
+    def to_meals(self) -> List[Meal]:
+        """
+        Convert all meals to compact ``Meal`` records.
+        
+        The records are built on each call; keep the returned list (and drop this
+        container) to benefit from the smaller memory footprint.
+        
+        Returns:
+            List of Meal records in the same order as ``items``.
+        """
+        return [Meal.from_dict(meal) for meal in self.items]
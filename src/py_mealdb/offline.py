@@ -0,0 +1,371 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Offline backend that answers MealDB queries from a local catalog snapshot.
+
+``OfflineMealDB`` loads a JSONL snapshot written by ``py_mealdb.crawler.crawl`` and
+builds hash and inverted indexes once, so lookups and filters are dictionary reads
+with no network. It returns the same models as the live client. ``HybridMealDB``
+routes each call to the offline or live backend.
+
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import random
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from .models import (
+    MealList,
+    MealDetails,
+    AreaList,
+    CategoryList,
+    IngredientList
+)
+from .constants import LETTERS
+from .query import filter_calls
+
+if TYPE_CHECKING:
+    from . import MealDB
+
+
+def _key(value: Optional[str]) -> str:
+    """Normalize a name for case-insensitive index lookups."""
+    return (value or '').strip().lower()
+
+
+class OfflineMealDB:
+    """
+    MealDB-compatible backend serving queries from in-memory indexes.
+
+    Indexes built at load time:
+
+    - ``idMeal`` → meal
+    - ingredient, category, area and first letter → meal IDs
+
+    Returned models share the snapshot's meal dictionaries; treat them as read-only.
+
+    Attributes:
+        meals: Mapping of meal ID to the raw meal dictionary, in snapshot order.
+    """
+
+    def __init__(self, meals: Iterable[Dict[str, Any]]):
+        """
+        Build the indexes from raw meal dictionaries.
+
+        Args:
+            meals: Full meal dictionaries as returned by ``search.php`` or ``lookup.php``.
+        """
+        self.meals: Dict[str, Dict[str, Any]] = {}
+        self._summaries: Dict[str, Dict[str, str]] = {}
+        self._names: List[Tuple[str, str]] = []
+        self._by_ingredient: Dict[str, List[str]] = defaultdict(list)
+        self._by_category: Dict[str, List[str]] = defaultdict(list)
+        self._by_area: Dict[str, List[str]] = defaultdict(list)
+        self._by_letter: Dict[str, List[str]] = defaultdict(list)
+        self._ingredient_names: Dict[str, str] = {}
+        self._category_names: Dict[str, str] = {}
+        self._area_names: Dict[str, str] = {}
+
+        for meal in meals:
+            id = meal['idMeal']
+            if id in self.meals:
+                continue
+            self.meals[id] = meal
+            self._summaries[id] = {
+                'strMeal': meal.get('strMeal'),
+                'strMealThumb': meal.get('strMealThumb'),
+                'idMeal': id,
+            }
+            name = _key(meal.get('strMeal'))
+            self._names.append((name, id))
+            if name:
+                self._by_letter[name[0]].append(id)
+            for value, index, names in (
+                (meal.get('strCategory'), self._by_category, self._category_names),
+                (meal.get('strArea'), self._by_area, self._area_names),
+            ):
+                if _key(value):
+                    index[_key(value)].append(id)
+                    names.setdefault(_key(value), value.strip())
+            ingredients = set()
+            for i in range(1, 21):
+                ingredient = meal.get(f'strIngredient{i}')
+                if _key(ingredient) and _key(ingredient) not in ingredients:
+                    ingredients.add(_key(ingredient))
+                    self._by_ingredient[_key(ingredient)].append(id)
+                    self._ingredient_names.setdefault(_key(ingredient), ingredient.strip())
+
+    @classmethod
+    def from_snapshot(cls, path: Union[str, os.PathLike]) -> OfflineMealDB:
+        """
+        Load a JSONL catalog snapshot.
+
+        Args:
+            path: Path of a snapshot written by ``py_mealdb.crawler.crawl``.
+
+        Returns:
+            An OfflineMealDB with all indexes built.
+        """
+        with open(path, encoding='utf-8') as file:
+            return cls(json.loads(line) for line in file if line.strip())
+
+    def __len__(self) -> int:
+        """Return the number of meals in the snapshot."""
+        return len(self.meals)
+
+    def _details(self, ids: Iterable[str]) -> MealDetails:
+        return MealDetails(items=[self.meals[id] for id in ids])
+
+    def _summary(self, ids: Iterable[str]) -> MealList:
+        return MealList(items=[self._summaries[id] for id in ids])
+
+    def get_meal_by_name(self, name: str) -> MealDetails:
+        """
+        Retrieves meals whose name contains ``name``, case-insensitively.
+
+        Args:
+            name: The name of the meal to search for (e.g., 'Arrabiata', 'Potato Salad').
+
+        Returns:
+            MealDetails object containing the matching meals.
+        """
+        needle = _key(name)
+        return self._details(id for meal_name, id in self._names if needle in meal_name)
+
+    def meal_details_by_id(self, id: str) -> MealDetails:
+        """
+        Retrieves detailed meal information by meal ID.
+
+        Args:
+            id: The meal ID to retrieve (e.g., '52772').
+
+        Returns:
+            MealDetails object containing the meal, or empty if unknown.
+        """
+        id = str(id)
+        return self._details([id] if id in self.meals else [])
+
+    def meal_details_by_ids(self, ids: Iterable[str], max_concurrency: int = 8) -> MealDetails:
+        """
+        Retrieves detailed meal information for many meal IDs.
+
+        Args:
+            ids: The meal IDs to retrieve. Duplicates are returned once.
+            max_concurrency: Accepted for compatibility with ``MealDB``; unused.
+
+        Returns:
+            MealDetails object with the known meals in input order. Unknown IDs are
+            reported in ``MealDetails.errors`` as a ``LookupError``, as by ``MealDB``.
+        """
+        return MealDetails.merge({id: self.meal_details_by_id(id) for id in dict.fromkeys(str(id) for id in ids)})
+
+    def single_random_meal(self) -> MealDetails:
+        """
+        Retrieves a single random meal from the snapshot.
+
+        Returns:
+            MealDetails object containing one meal, or empty if the snapshot is empty.
+        """
+        return self._details([random.choice(self._names)[1]] if self._names else [])
+
+    def list_all_meals(self, letter: str) -> MealDetails:
+        """
+        Retrieves meals starting with a specific letter.
+
+        Args:
+            letter: The first letter to search for (e.g., 'a', 'b', 'c').
+
+        Returns:
+            MealDetails object containing all meals starting with the specified letter.
+        """
+        return self._details(self._by_letter.get(_key(letter), []))
+
+    def iter_all_meals(self, letters: Iterable[str] = LETTERS, prefetch: int = 2) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over the snapshot's meals in the same order as ``MealDB.iter_all_meals``.
+
+        Args:
+            letters: First letters to walk, in order. Defaults to ``a``-``z``.
+            prefetch: Accepted for compatibility with ``MealDB``; unused.
+
+        Yields:
+            Raw meal dictionaries, each ``idMeal`` once.
+        """
+        for letter in dict.fromkeys(letters):
+            for id in self._by_letter.get(_key(letter), []):
+                yield self.meals[id]
+
+    def list_meal_categories(self) -> CategoryList:
+        """
+        Retrieves all categories present in the snapshot.
+
+        Returns:
+            CategoryList object with ``strCategory`` for each category. Descriptions and
+            thumbnails are not part of a meal snapshot.
+        """
+        return self.list_all_categories()
+
+    def list_all_categories(self) -> CategoryList:
+        """
+        Retrieves all category names present in the snapshot.
+
+        Returns:
+            CategoryList object containing category names.
+        """
+        return CategoryList(items=[{'strCategory': name} for name in sorted(self._category_names.values())])
+
+    def list_all_areas(self) -> AreaList:
+        """
+        Retrieves all area names present in the snapshot.
+
+        Returns:
+            AreaList object containing area names.
+        """
+        return AreaList(items=[{'strArea': name} for name in sorted(self._area_names.values())])
+
+    def list_all_ingredients(self) -> IngredientList:
+        """
+        Retrieves all ingredient names used in the snapshot.
+
+        Returns:
+            IngredientList object containing ingredient names.
+        """
+        return IngredientList(items=[{'strIngredient': name} for name in sorted(self._ingredient_names.values())])
+
+    def list_all(self, return_exceptions: bool = False) -> Dict[str, Union[CategoryList, AreaList, IngredientList]]:
+        """
+        Retrieves all categories, areas, and ingredients.
+
+        Args:
+            return_exceptions: Accepted for compatibility with ``MealDB``; unused.
+
+        Returns:
+            Dictionary with keys 'categories', 'areas', and 'ingredients' containing their respective list objects.
+        """
+        return {
+            'categories': self.list_all_categories(),
+            'areas': self.list_all_areas(),
+            'ingredients': self.list_all_ingredients(),
+        }
+
+    def filter_by_ingredient(self, ingredient: str) -> MealList:
+        """
+        Retrieves meals containing a specific ingredient.
+
+        Args:
+            ingredient: The ingredient to filter by (e.g., 'Chicken', 'Salmon', 'Beef').
+
+        Returns:
+            MealList object containing meal summaries that include the specified ingredient.
+        """
+        return self._summary(self._by_ingredient.get(_key(ingredient), []))
+
+    def filter_by_category(self, category: str) -> MealList:
+        """
+        Retrieves meals belonging to a specific category.
+
+        Args:
+            category: The category to filter by (e.g., 'Seafood', 'Dessert', 'Vegetarian').
+
+        Returns:
+            MealList object containing meal summaries from the specified category.
+        """
+        return self._summary(self._by_category.get(_key(category), []))
+
+    def filter_by_area(self, area: str) -> MealList:
+        """
+        Retrieves meals from a specific geographical area/cuisine.
+
+        Args:
+            area: The area to filter by (e.g., 'Canadian', 'Mexican', 'Italian').
+
+        Returns:
+            MealList object containing meal summaries from the specified area.
+        """
+        return self._summary(self._by_area.get(_key(area), []))
+
+    def find_meals(
+        self,
+        ingredients: Iterable[str] = (),
+        category: Optional[str] = None,
+        area: Optional[str] = None,
+    ) -> MealList:
+        """
+        Retrieves meals matching every given ingredient, category and area.
+
+        Args:
+            ingredients: Ingredients the meals must all contain (e.g., ['Garlic', 'Salmon']).
+            category: Optional category the meals must belong to (e.g., 'Seafood').
+            area: Optional area/cuisine the meals must come from (e.g., 'Italian').
+
+        Returns:
+            MealList object containing the meal summaries that match all criteria.
+
+        Raises:
+            ValueError: If no criteria are given.
+        """
+        calls = filter_calls(self, ingredients, category, area)
+        return MealList.intersect(call() for call in calls.values())
+
+
+class HybridMealDB:
+    """
+    Routes each call to an offline snapshot or the live API.
+
+    Every ``MealDB`` method is available and accepts an extra ``offline`` keyword
+    argument to choose the backend for that call. When omitted, ``prefer_offline``
+    decides. Methods the snapshot cannot answer, such as the ingredient image
+    downloads, always go to the live client.
+
+    Usage::
+
+        mb = HybridMealDB(MealDB('1'), OfflineMealDB.from_snapshot('catalog.jsonl'))
+        mb.filter_by_area('Italian')                  # offline
+        mb.meal_details_by_id('52772', offline=False)  # live
+
+    Attributes:
+        live: The live ``MealDB`` client.
+        offline: The ``OfflineMealDB`` backend.
+        prefer_offline: Default backend choice for calls without ``offline=``.
+    """
+
+    def __init__(self, live: MealDB, offline: OfflineMealDB, prefer_offline: bool = True):
+        """
+        Initialize the router.
+
+        Args:
+            live: The live ``MealDB`` client.
+            offline: The ``OfflineMealDB`` backend.
+            prefer_offline: Use the snapshot unless a call passes ``offline=False``. Defaults to True.
+        """
+        self.live = live
+        self.offline = offline
+        self.prefer_offline = prefer_offline
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        live_method = getattr(self.live, name)
+        offline_method = getattr(self.offline, name, None)
+        if name.startswith('_') or not callable(live_method):
+            return live_method
+
+        @functools.wraps(live_method)
+        def call(*args, offline: Optional[bool] = None, **kwargs):
+            use_offline = self.prefer_offline if offline is None else offline
+            if use_offline and offline_method is not None:
+                return offline_method(*args, **kwargs)
+            return live_method(*args, **kwargs)
+
+        return call
@@ -0,0 +1,231 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+"Cook with what I have": rank every meal of a catalog against a pantry.
+
+``PantryIndex`` turns ``MealDetails.get_ingredients`` for the whole catalog into
+a meal × ingredient incidence matrix over normalized ingredient names, so one
+vectorized operation counts, for every meal at once, how many of its ingredients
+are in the pantry. This replaces one ``filter_by_ingredient`` call per pantry
+item plus manual merging::
+
+    index = PantryIndex.from_catalog(OfflineMealDB.from_snapshot('catalog.jsonl'))
+    for match in index.rank(['chicken', 'rice', 'onion', 'garlic'], k=5, staples=['salt', 'water']):
+        print(match.name, match.missing)
+
+With NumPy installed (the ``numpy`` extra) the matrix is a dense column-major
+``float32`` array and a pantry is scored by summing its few columns. Without it,
+each meal is a bitset in a Python ``int``; results are the same.
+
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .autocomplete import normalize
+from .models import MealDetails
+from .offline import OfflineMealDB
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@dataclass(frozen=True)
+class PantryMatch:
+    """
+    One ranked meal.
+
+    Attributes:
+        id: The ``idMeal``.
+        name: The ``strMeal``.
+        score: Share of the meal's ingredients (staples aside) that are in the pantry, 0 to 1.
+        have: The meal's ingredients found in the pantry.
+        missing: The meal's ingredients that are neither in the pantry nor staples.
+    """
+    id: str
+    name: str
+    score: float
+    have: Tuple[str, ...]
+    missing: Tuple[str, ...]
+
+
+class PantryIndex:
+    """
+    Meal × ingredient incidence matrix for pantry queries.
+
+    Meals are ranked by the number of missing ingredients (fewest first), then by
+    the number of pantry ingredients they use (most first), then by catalog order.
+    Meals that use none of the pantry are left out.
+
+    Attributes:
+        ids: ``idMeal`` of each matrix row.
+        names: ``strMeal`` of each matrix row.
+        ingredients: Display name of each matrix column.
+        aliases: Normalized name → canonical normalized name, applied to meals and pantries.
+    """
+
+    def __init__(
+        self,
+        meals: Iterable[Tuple[str, str, Iterable[str]]],
+        aliases: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        Build the matrix.
+
+        Args:
+            meals: ``(idMeal, strMeal, ingredient names)`` for each meal.
+            aliases: Extra spellings mapped to a canonical ingredient, e.g.
+                ``{'spring onions': 'scallions'}``. Keys and values are normalized.
+        """
+        self.aliases = {normalize(k): normalize(v) for k, v in (aliases or {}).items()}
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.ingredients: List[str] = []
+        self._columns: Dict[str, int] = {}
+        self._rows: List[Tuple[int, ...]] = []
+        for id, name, ingredients in meals:
+            columns = []
+            for ingredient in ingredients:
+                key = self._key(ingredient)
+                if not key:
+                    continue
+                column = self._columns.get(key)
+                if column is None:
+                    column = self._columns[key] = len(self.ingredients)
+                    self.ingredients.append(ingredient.strip())
+                columns.append(column)
+            self.ids.append(str(id))
+            self.names.append(name)
+            self._rows.append(tuple(dict.fromkeys(columns)))
+
+        if numpy is not None:
+            self._matrix = numpy.zeros((len(self._rows), len(self.ingredients)), dtype=numpy.float32, order='F')
+            for row, columns in enumerate(self._rows):
+                self._matrix[row, list(columns)] = 1
+            self._sizes = self._matrix.sum(axis=1).astype(numpy.int64)
+        else:
+            self._masks = [sum(1 << column for column in columns) for columns in self._rows]
+
+    @classmethod
+    def from_details(cls, details: MealDetails, aliases: Optional[Mapping[str, str]] = None) -> PantryIndex:
+        """
+        Build the matrix from full meals.
+
+        Args:
+            details: Full meals, e.g. from ``search.php`` or a crawled snapshot.
+            aliases: See the constructor.
+        """
+        return cls(
+            (
+                (meal['idMeal'], meal.get('strMeal'), [item['name'] for item in details.get_ingredients(i)])
+                for i, meal in enumerate(details)
+            ),
+            aliases=aliases,
+        )
+
+    @classmethod
+    def from_catalog(cls, catalog: OfflineMealDB, aliases: Optional[Mapping[str, str]] = None) -> PantryIndex:
+        """Build the matrix from every meal of a catalog snapshot."""
+        return cls.from_details(MealDetails(items=list(catalog.meals.values())), aliases=aliases)
+
+    def __len__(self) -> int:
+        """Return the number of meals."""
+        return len(self.ids)
+
+    def _key(self, name: str) -> str:
+        key = normalize(name)
+        return self.aliases.get(key, key)
+
+    def _pantry_columns(self, pantry: Iterable[str]) -> List[int]:
+        columns = (self._columns.get(self._key(name)) for name in pantry)
+        return sorted({column for column in columns if column is not None})
+
+    def _match(self, row: int, pantry: set, staples: set) -> PantryMatch:
+        columns = [c for c in self._rows[row] if c not in staples or c in pantry]
+        have = tuple(self.ingredients[c] for c in columns if c in pantry)
+        missing = tuple(self.ingredients[c] for c in columns if c not in pantry)
+        return PantryMatch(self.ids[row], self.names[row], len(have) / len(columns), have, missing)
+
+    def _top(self, have: Sequence[int], missing: Sequence[int], k: int) -> List[int]:
+        """Rows of the ``k`` best meals given each meal's matched and missing ingredient counts."""
+        if numpy is not None:
+            candidates = numpy.flatnonzero(have)
+            if not len(candidates):
+                return []
+            # Fewest missing first, then most matched, then catalog order, folded into one
+            # unique integer so argpartition cannot pick arbitrarily among ties at the k-th key.
+            width = len(self.ingredients) + 1
+            key = (missing[candidates] * width + width - have[candidates]) * len(self.ids) + candidates
+            if k < len(candidates):
+                part = numpy.argpartition(key, k)[:k]
+                candidates, key = candidates[part], key[part]
+            return candidates[numpy.argsort(key)].tolist()
+        rows = [row for row, count in enumerate(have) if count]
+        rows.sort(key=lambda row: (missing[row], -have[row], row))
+        return rows[:k]
+
+    def rank(self, pantry: Iterable[str], k: int = 10, staples: Iterable[str] = ()) -> List[PantryMatch]:
+        """
+        Rank all meals against a pantry.
+
+        Args:
+            pantry: Ingredient names the user has, in any case or spelling known to ``aliases``.
+                Names not used by any meal are ignored.
+            k: Number of meals to return. Defaults to 10.
+            staples: Ingredients assumed to be at hand (e.g. salt, water). They are never
+                reported missing, but a meal needs at least one pantry ingredient to be ranked.
+
+        Returns:
+            The ``k`` best meals, best first.
+        """
+        return self.rank_many([pantry], k, staples)[0]
+
+    def rank_many(
+        self, pantries: Sequence[Iterable[str]], k: int = 10, staples: Iterable[str] = ()
+    ) -> List[List[PantryMatch]]:
+        """
+        Rank all meals against several pantries at once.
+
+        Args:
+            pantries: One list of ingredient names per query.
+            k: Number of meals per query. Defaults to 10.
+            staples: Ingredients assumed to be at hand in every pantry.
+
+        Returns:
+            One ranked list per pantry, in input order.
+        """
+        staple_columns = set(self._pantry_columns(staples))
+        queries = [self._pantry_columns(pantry) for pantry in pantries]
+        counts = []
+        if numpy is not None:
+            for columns in queries:
+                # A pantry is a handful of columns: summing them beats a full matrix product.
+                have = self._matrix[:, columns].sum(axis=1).astype(numpy.int64)
+                used = self._matrix[:, sorted(staple_columns.difference(columns))].sum(axis=1).astype(numpy.int64)
+                counts.append((have, self._sizes - have - used))
+        else:
+            for columns in queries:
+                mask = sum(1 << column for column in columns)
+                staple_mask = sum(1 << column for column in staple_columns) & ~mask
+                have = [bin(row & mask).count('1') for row in self._masks]
+                counts.append((have, [
+                    len(self._rows[i]) - have[i] - bin(row & staple_mask).count('1') for i, row in enumerate(self._masks)
+                ]))
+
+        results = []
+        for columns, (have, missing) in zip(queries, counts):
+            pantry = set(columns)
+            results.append([self._match(row, pantry, staple_columns) for row in self._top(have, missing, k)])
+        return results
@@ -0,0 +1,50 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Client-side query planning for combined filters.
+
+TheMealDB's ``filter.php`` accepts a single criterion per request. ``find_meals``
+on each client fetches one list per criterion and intersects them locally with
+``MealList.intersect``; this module builds those per-criterion calls.
+
+"""
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+def filter_calls(client, ingredients: Iterable[str], category: Optional[str], area: Optional[str]) -> Dict[str, Callable[[], Any]]:
+    """
+    Build the filter calls needed by ``find_meals``, keyed by their criterion.
+
+    Args:
+        client: The client whose ``filter_by_*`` methods are used. For ``AsyncMealDB``
+            the callables return coroutines.
+        ingredients: Ingredients to filter by.
+        category: Optional category to filter by.
+        area: Optional area to filter by.
+
+    Returns:
+        Mapping of criterion to a zero-argument callable.
+
+    Raises:
+        ValueError: If no criteria are given.
+    """
+    calls: Dict[str, Callable[[], Any]] = {}
+    for ingredient in dict.fromkeys(ingredients):
+        calls[f'i={ingredient}'] = partial(client.filter_by_ingredient, ingredient)
+    if category is not None:
+        calls[f'c={category}'] = partial(client.filter_by_category, category)
+    if area is not None:
+        calls[f'a={area}'] = partial(client.filter_by_area, area)
+    if not calls:
+        raise ValueError('find_meals() needs at least one ingredient, category or area')
+    return calls
@@ -0,0 +1,228 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Client-side rate limiting and retries.
+
+``RateLimiter`` is a token bucket shared by every request a client makes (and by
+several clients if the same instance is passed to each). ``RetryPolicy`` retries
+idempotent GETs that failed with a transport error or a retryable status (429 and
+5xx by default), using exponential backoff with full jitter and honouring
+``Retry-After``.
+
+Usage::
+
+    mb = MealDB('1', rate_limiter=RateLimiter(10, burst=20), retry=RetryPolicy(max_retries=5))
+
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional
+
+import httpx
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Each request
+    takes one token; callers that find the bucket empty reserve a future token and
+    wait for it, so waiting callers are served in arrival order.
+
+    Attributes:
+        rate: Sustained requests per second.
+        burst: Bucket size: how many requests may be sent back to back.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            rate: Sustained requests per second. Must be positive.
+            burst: Bucket size. Defaults to ``max(1, rate)``.
+
+        Raises:
+            ValueError: If ``rate`` or ``burst`` is not positive.
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        if self.burst <= 0:
+            raise ValueError('burst must be positive')
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, borrowing against the refill if none is available.
+
+        Returns:
+            Seconds the caller must wait before sending its request (0 if a token was free).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns the time waited in seconds."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+@dataclass
+class RetryStats:
+    """
+    Counters for a retry policy.
+
+    Attributes:
+        retries: Attempts that were retried.
+        throttled: 429 responses received.
+        gave_up: Requests that failed after their retry budget was spent.
+        waited: Total seconds slept in backoff.
+    """
+    retries: int = 0
+    throttled: int = 0
+    gave_up: int = 0
+    waited: float = 0.0
+
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Returns:
+        The delay in seconds, or None if the header is missing or invalid.
+    """
+    value = response.headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Retry schedule for idempotent GET requests.
+
+    The delay before retry ``n`` (0-based) is drawn uniformly from
+    ``[0, min(max_backoff, backoff * 2**n)]`` and raised to the server's
+    ``Retry-After`` when that is larger. A request gives up once it has been
+    retried ``max_retries`` times, once the next delay would exceed ``max_wait``,
+    or once ``max_elapsed`` seconds have been spent retrying it. A policy can be
+    shared between clients; its counters are then combined.
+
+    Attributes:
+        max_retries: Retries per request.
+        backoff: Base delay in seconds.
+        max_backoff: Upper bound of the exponential backoff.
+        max_wait: Longest single delay (including ``Retry-After``) worth waiting for.
+        max_elapsed: Total seconds a request may spend retrying.
+        statuses: Response status codes that are retried.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_wait: float = 60.0,
+        max_elapsed: float = 120.0,
+        statuses: Collection[int] = RETRY_STATUSES,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_retries: Retries per request. Defaults to 3.
+            backoff: Base delay in seconds. Defaults to 0.5.
+            max_backoff: Upper bound of the exponential backoff in seconds. Defaults to 30.
+            max_wait: Longest single delay worth waiting for; a longer ``Retry-After``
+                fails the request immediately. Defaults to 60.
+            max_elapsed: Total seconds a request may spend retrying. Defaults to 120.
+            statuses: Status codes to retry. Defaults to 429, 500, 502, 503 and 504.
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_wait = max_wait
+        self.max_elapsed = max_elapsed
+        self.statuses = frozenset(statuses)
+        self._lock = threading.Lock()
+        self._stats = RetryStats()
+
+    def delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt and how long to wait first.
+
+        Args:
+            attempt: Number of retries already made for this request.
+            elapsed: Seconds since the first attempt started.
+            response: The attempt's response, if one was received.
+            error: The attempt's exception, if it raised.
+
+        Returns:
+            Seconds to wait before retrying, or None to stop. Successful and
+            non-retryable outcomes return None without touching the counters.
+        """
+        if response is not None:
+            if response.status_code == 429:
+                with self._lock:
+                    self._stats.throttled += 1
+            if response.status_code not in self.statuses:
+                return None
+        elif not isinstance(error, httpx.TransportError):
+            return None
+
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        server_delay = retry_after(response) if response is not None else None
+        if server_delay is not None:
+            delay = max(delay, server_delay)
+        with self._lock:
+            if attempt >= self.max_retries or delay > self.max_wait or elapsed + delay > self.max_elapsed:
+                self._stats.gave_up += 1
+                return None
+            self._stats.retries += 1
+            self._stats.waited += delay
+        return delay
+
+    def stats(self) -> RetryStats:
+        """Return a snapshot of the retry counters."""
+        with self._lock:
+            return RetryStats(**vars(self._stats))
@@ -0,0 +1,213 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+"More like this" recommendations from TF-IDF ingredient vectors.
+
+``SimilarityIndex.build`` turns every meal of a catalog into a TF-IDF weighted
+vector of its ingredients, optionally extended with its category, area and
+tags. It L2-normalizes the vectors and finds each meal's top-k cosine
+neighbours with batched NumPy matrix products. The result is a neighbour table:
+serving a recommendation is one dictionary lookup, and the table can be saved to
+JSON and loaded without NumPy::
+
+    index = SimilarityIndex.build(OfflineMealDB.from_snapshot('catalog.jsonl'), k=20)
+    index.save('neighbours.json')
+    ...
+    SimilarityIndex.load('neighbours.json').similar('52772', limit=5)
+
+Building needs the ``numpy`` extra (``pip install py-mealdb[numpy]``).
+
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+
+from collections import Counter
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from .autocomplete import normalize
+from .models import MealDetails
+from .offline import OfflineMealDB
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+FORMAT_VERSION = 1
+
+# Relative weight of each feature group; ingredients carry most of the signal.
+DEFAULT_WEIGHTS: Dict[str, float] = {'ingredient': 1.0, 'category': 0.5, 'area': 0.5, 'tag': 0.3}
+
+
+def meal_features(details: MealDetails, index: int, groups: Tuple[str, ...]) -> List[str]:
+    """
+    Return the feature tokens of one meal, e.g. ``['ingredient:chicken', 'area:indian']``.
+
+    Args:
+        details: The meals.
+        index: Position of the meal in ``details``.
+        groups: Feature groups to include: 'ingredient', 'category', 'area' and/or 'tag'.
+    """
+    meal = details[index]
+    values = {
+        'ingredient': [item['name'] for item in details.get_ingredients(index)] if 'ingredient' in groups else [],
+        'category': [meal.get('strCategory')] if 'category' in groups else [],
+        'area': [meal.get('strArea')] if 'area' in groups else [],
+        'tag': details.get_tags(index) if 'tag' in groups else [],
+    }
+    tokens = (f'{group}:{normalize(value)}' for group, names in values.items() for value in names)
+    return list(dict.fromkeys(token for token in tokens if not token.endswith(':')))
+
+
+class SimilarityIndex:
+    """
+    Precomputed top-k neighbour table.
+
+    Attributes:
+        k: Neighbours stored per meal.
+        neighbours: ``idMeal`` → ``[(idMeal, cosine similarity), ...]``, most similar first.
+    """
+
+    def __init__(self, neighbours: Mapping[str, List[Tuple[str, float]]], k: int):
+        """
+        Wrap an existing neighbour table; use ``build`` or ``load`` to create one.
+
+        Args:
+            neighbours: ``idMeal`` → neighbours, most similar first.
+            k: Neighbours stored per meal.
+        """
+        self.neighbours = dict(neighbours)
+        self.k = k
+
+    def __len__(self) -> int:
+        """Return the number of meals in the table."""
+        return len(self.neighbours)
+
+    def __contains__(self, id: object) -> bool:
+        return str(id) in self.neighbours
+
+    def similar(self, id: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Return the meals most similar to ``id``.
+
+        Args:
+            id: The ``idMeal`` to find neighbours for.
+            limit: Maximum number of neighbours. Defaults to all ``k`` stored.
+
+        Returns:
+            ``(idMeal, cosine similarity)`` pairs, most similar first; empty for an unknown meal.
+        """
+        return self.neighbours.get(str(id), [])[:limit]
+
+    @classmethod
+    def build(
+        cls,
+        meals: Union[OfflineMealDB, MealDetails],
+        k: int = 10,
+        features: Tuple[str, ...] = ('ingredient', 'category', 'area', 'tag'),
+        weights: Optional[Mapping[str, float]] = None,
+        batch_size: int = 1024,
+    ) -> SimilarityIndex:
+        """
+        Compute the neighbour table for a catalog.
+
+        Each feature is weighted by its smoothed inverse document frequency,
+        ``ln((1 + n) / (1 + df)) + 1``, times its group weight, so rare
+        ingredients say more about a meal than salt or water. Similarities of a
+        batch of meals against the whole catalog are one matrix product.
+
+        Args:
+            meals: A catalog snapshot or full meals.
+            k: Neighbours to keep per meal. Defaults to 10.
+            features: Feature groups to use. Defaults to ingredients, category, area and tags.
+            weights: Per-group weights, merged over ``DEFAULT_WEIGHTS``.
+            batch_size: Meals compared per matrix product; bounds memory to
+                ``batch_size × len(meals)`` floats. Defaults to 1024.
+
+        Returns:
+            The neighbour table. Meals without features get no neighbours, and
+            only neighbours with a positive similarity are kept.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If ``features`` names an unknown group.
+        """
+        if numpy is None:
+            raise ImportError('Building a SimilarityIndex requires numpy: pip install py-mealdb[numpy]')
+        unknown = set(features) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f'Unknown feature groups {sorted(unknown)}; expected some of {list(DEFAULT_WEIGHTS)}')
+        details = MealDetails(items=list(meals.meals.values())) if isinstance(meals, OfflineMealDB) else meals
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        ids = [str(meal['idMeal']) for meal in details]
+        tokens = [meal_features(details, i, tuple(features)) for i in range(len(ids))]
+
+        vocabulary: Dict[str, int] = {}
+        for meal_tokens in tokens:
+            for token in meal_tokens:
+                vocabulary.setdefault(token, len(vocabulary))
+        frequency = Counter(token for meal_tokens in tokens for token in meal_tokens)
+        idf = numpy.zeros(len(vocabulary), dtype=numpy.float32)
+        for token, column in vocabulary.items():
+            idf[column] = (math.log((1 + len(ids)) / (1 + frequency[token])) + 1) * weights[token.split(':', 1)[0]]
+
+        vectors = numpy.zeros((len(ids), len(vocabulary)), dtype=numpy.float32)
+        for row, meal_tokens in enumerate(tokens):
+            vectors[row, [vocabulary[token] for token in meal_tokens]] = 1
+        vectors *= idf
+        norms = numpy.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= numpy.where(norms > 0, norms, 1)
+
+        neighbours: Dict[str, List[Tuple[str, float]]] = {}
+        keep = min(k, len(ids) - 1)
+        for start in range(0, len(ids), batch_size):
+            # Compare at the precision the table stores, so equal scores tie exactly.
+            scores = numpy.round(vectors[start:start + batch_size] @ vectors.T, 6)
+            rows = numpy.arange(len(scores))
+            scores[rows, rows + start] = -1  # never recommend the meal itself
+            kth = -numpy.partition(-scores, keep - 1, axis=1)[:, keep - 1] if keep > 0 else None
+            for row in rows.tolist():
+                if kth is None:
+                    top: List[int] = []
+                else:
+                    # Every meal scoring at least the k-th best competes, so ties at the
+                    # cut-off are broken in catalog order rather than by the partition.
+                    row_scores = scores[row]
+                    candidates = numpy.flatnonzero(row_scores >= kth[row] if kth[row] > 0 else row_scores > 0)
+                    order = numpy.argsort(-row_scores[candidates], kind='stable')[:keep]
+                    top = candidates[order].tolist()
+                neighbours[ids[start + row]] = [(ids[column], round(float(scores[row, column]), 6)) for column in top]
+        return cls(neighbours, k)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the table to a JSON file, replacing it atomically."""
+        tmp = f'{os.fspath(path)}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as file:
+            json.dump({'version': FORMAT_VERSION, 'k': self.k, 'neighbours': self.neighbours}, file)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> SimilarityIndex:
+        """
+        Read a table written by ``save``.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+        """
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f'Unsupported similarity table version: {data.get("version")!r}')
+        return cls({id: [tuple(pair) for pair in pairs] for id, pairs in data['neighbours'].items()}, data['k'])
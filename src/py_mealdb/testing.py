@@ -0,0 +1,466 @@
+"""
+*********************************************************************
+* Copyright (c) 2026 Sherwin Varghese
+* This program and the accompanying materials are made
+* available under the terms of the Eclipse Public License 2.0
+* which is available at https://www.eclipse.org/legal/epl-2.0/
+*
+*
+* SPDX-License-Identifier: EPL-2.0
+**********************************************************************
+
+
+Offline test and benchmark helpers.
+
+- ``RecordingTransport`` forwards requests to a real transport and saves every
+  response to a JSON cassette file.
+- ``ReplayTransport`` serves the responses of a cassette without any network.
+- ``StandInServer`` is a local HTTP server implementing TheMealDB's paths over a
+  catalog of meal dictionaries, with configurable latency and error injection.
+  ``server.transport()`` routes a client's requests to it over real sockets, and
+  ``RedirectTransport(url)`` does the same for a server in another process.
+
+All transports work with both ``MealDB`` and ``AsyncMealDB``::
+
+    with StandInServer(meals, latency=0.02, error_rate=0.05) as server:
+        with MealDB('1', transport=server.transport()) as mb:
+            mb.filter_by_area('Italian')
+
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+
+from collections import defaultdict, deque
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import httpx
+
+from .offline import OfflineMealDB
+
+# Headers that describe the wire encoding rather than the (decoded) recorded body.
+_SKIPPED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection'})
+
+
+def _encode_body(content: bytes, content_type: str) -> Dict[str, str]:
+    if 'json' in content_type or content_type.startswith('text/'):
+        try:
+            return {'body': content.decode('utf-8')}
+        except UnicodeDecodeError:
+            pass
+    return {'body_base64': base64.b64encode(content).decode('ascii')}
+
+
+def _decode_body(response: Dict[str, Any]) -> bytes:
+    if 'body_base64' in response:
+        return base64.b64decode(response['body_base64'])
+    return response.get('body', '').encode('utf-8')
+
+
+def _sync_transport(owner: object, transport: object) -> httpx.BaseTransport:
+    """Return ``transport`` if it can handle sync requests, else raise a TypeError naming ``owner``."""
+    if not isinstance(transport, httpx.BaseTransport):
+        raise TypeError(
+            f'{type(owner).__name__} wraps {type(transport).__name__}, which cannot handle sync '
+            'requests; pass an httpx.BaseTransport to use it with MealDB or httpx.Client'
+        )
+    return transport
+
+
+def _async_transport(owner: object, transport: object) -> httpx.AsyncBaseTransport:
+    """Return ``transport`` if it can handle async requests, else raise a TypeError naming ``owner``."""
+    if not isinstance(transport, httpx.AsyncBaseTransport):
+        raise TypeError(
+            f'{type(owner).__name__} wraps {type(transport).__name__}, which cannot handle async '
+            'requests; pass an httpx.AsyncBaseTransport to use it with AsyncMealDB or httpx.AsyncClient'
+        )
+    return transport
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport that records every response into a cassette file.
+
+    Requests are forwarded to ``transport`` (a new ``httpx.HTTPTransport`` or
+    ``httpx.AsyncHTTPTransport`` by default). Bodies are stored decoded, one
+    interaction per response, and the cassette is rewritten after each one.
+
+    Attributes:
+        path: The cassette file.
+        interactions: The recorded interactions, in order.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None,
+    ):
+        """
+        Start a new cassette.
+
+        Args:
+            path: Where to write the cassette; an existing file is replaced.
+            transport: The transport that performs the real requests. It must match
+                how the recorder is used: sync requests raise ``TypeError`` for an
+                async-only transport, and async requests for a sync-only one.
+        """
+        self.path = os.fspath(path)
+        self.interactions: List[Dict[str, Any]] = []
+        self._transport = transport
+        self._lock = threading.Lock()
+
+    def _record(
+        self, request: httpx.Request, recorded: Dict[str, str], response: httpx.Response, content: bytes
+    ) -> httpx.Response:
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _SKIPPED_HEADERS]
+        interaction = {
+            'request': recorded,
+            'response': {
+                'status': response.status_code,
+                'headers': headers,
+                **_encode_body(content, response.headers.get('content-type', '')),
+            },
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+            tmp = f'{self.path}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as file:
+                json.dump({'interactions': self.interactions}, file, indent=1, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        # Capture the URL first: the wrapped transport may rewrite it (see StandInServer.transport).
+        recorded = {'method': request.method, 'url': str(request.url)}
+        response = _sync_transport(self, self._transport).handle_request(request)
+        try:
+            content = httpx.Response(
+                response.status_code, headers=response.headers, stream=response.stream, request=request
+            ).read()
+        finally:
+            response.close()
+        return self._record(request, recorded, response, content)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        # Capture the URL first: the wrapped transport may rewrite it (see StandInServer.transport).
+        recorded = {'method': request.method, 'url': str(request.url)}
+        response = await _async_transport(self, self._transport).handle_async_request(request)
+        try:
+            content = await httpx.Response(
+                response.status_code, headers=response.headers, stream=response.stream, request=request
+            ).aread()
+        finally:
+            await response.aclose()
+        return self._record(request, recorded, response, content)
+
+    def close(self) -> None:
+        if isinstance(self._transport, httpx.BaseTransport):
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            await self._transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport serving recorded responses from a cassette file.
+
+    Interactions are matched on method and URL. Several recordings of the same
+    request are replayed in order, and the last one is repeated once they run out.
+
+    Raises ``LookupError`` for a request that is not in the cassette.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """
+        Load a cassette.
+
+        Args:
+            path: A cassette written by ``RecordingTransport``.
+        """
+        with open(path, encoding='utf-8') as file:
+            interactions = json.load(file)['interactions']
+        self._responses: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        for interaction in interactions:
+            request = interaction['request']
+            self._responses[(request['method'], request['url'])].append(interaction['response'])
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = (request.method, str(request.url))
+        with self._lock:
+            queue = self._responses.get(key)
+            if not queue:
+                raise LookupError(f'No recorded response for {request.method} {request.url}')
+            recorded = queue.popleft() if len(queue) > 1 else queue[0]
+        return httpx.Response(
+            recorded['status'], headers=recorded['headers'], content=_decode_body(recorded), request=request
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return self.handle_request(request)
+
+
+class RedirectTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport that sends every request to a fixed origin, keeping its path and query.
+
+    Use it to point an unchanged client at a stand-in server, including one running
+    in another process: ``MealDB('1', transport=RedirectTransport(url))``.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None,
+    ):
+        """
+        Args:
+            url: The origin to send requests to, e.g. ``'http://127.0.0.1:8080'``.
+            transport: The transport that performs the requests. Defaults to a new
+                ``httpx.HTTPTransport`` (or ``httpx.AsyncHTTPTransport`` when used asynchronously).
+                Using a sync-only transport asynchronously, or the reverse, raises ``TypeError``.
+        """
+        origin = httpx.URL(url)
+        self._host = origin.host
+        self._port = origin.port
+        self._transport = transport
+
+    def _rewrite(self, request: httpx.Request) -> None:
+        request.url = request.url.copy_with(scheme='http', host=self._host, port=self._port)
+        request.headers['Host'] = f'{self._host}:{self._port}'
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        self._rewrite(request)
+        return _sync_transport(self, self._transport).handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        self._rewrite(request)
+        return await _async_transport(self, self._transport).handle_async_request(request)
+
+    def close(self) -> None:
+        if isinstance(self._transport, httpx.BaseTransport):
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            await self._transport.aclose()
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Room for many clients opening connections at once (e.g. one per call in load tests).
+    request_queue_size = 1024
+
+
+def _image_bytes(name: str) -> bytes:
+    """Deterministic placeholder image body for an ingredient image path."""
+    return b'\x89PNG\r\n\x1a\n' + hashlib.sha256(name.encode('utf-8')).digest() * 32
+
+
+class StandInServer:
+    """
+    Local HTTP stand-in for TheMealDB.
+
+    Serves ``search.php``, ``lookup.php``, ``filter.php``, ``list.php``,
+    ``categories.php`` and ``random.php`` from an ``OfflineMealDB`` built over
+    ``meals``, plus ingredient images (placeholder PNGs with ``ETag`` and
+    ``Last-Modified``, answering conditional requests with ``304``). Unknown
+    paths return ``404``. Requests are handled on threads with keep-alive.
+
+    Attributes:
+        catalog: The ``OfflineMealDB`` answering the queries.
+        latency: Seconds added to every response, or a callable returning them.
+        error_rate: Probability of answering with ``error_status`` instead.
+        error_status: Status code of injected errors.
+        retry_after: ``Retry-After`` value sent with injected errors, or None.
+        requests: Number of requests handled so far.
+        url: Base URL of the running server, e.g. ``'http://127.0.0.1:53211'``.
+    """
+
+    def __init__(
+        self,
+        meals: Union[Iterable[Dict[str, Any]], OfflineMealDB] = (),
+        latency: Union[float, Callable[[], float]] = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: Optional[float] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Create the server; it starts on ``start()`` or when used as a context manager.
+
+        Args:
+            meals: Full meal dictionaries, or a ready ``OfflineMealDB``.
+            latency: Seconds to delay each response, or a callable returning a delay
+                (e.g. ``lambda: random.uniform(0.01, 0.1)``). Defaults to 0.
+            error_rate: Probability (0 to 1) that a request fails with ``error_status``. Defaults to 0.
+            error_status: Status code of injected errors. Defaults to 503.
+            retry_after: ``Retry-After`` seconds sent with injected errors. Defaults to None.
+            host: Interface to bind. Defaults to '127.0.0.1'.
+            port: Port to bind; 0 picks a free one. Defaults to 0.
+            seed: Seed for error injection and ``random.php``, for reproducible runs.
+        """
+        self.catalog = meals if isinstance(meals, OfflineMealDB) else OfflineMealDB(meals)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._modified = formatdate(time.time(), usegmt=True)
+        self._httpd = _HTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> StandInServer:
+        """Start serving on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name='mealdb-stand-in', daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the server and release its socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> StandInServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def transport(self, **kwargs) -> httpx.BaseTransport:
+        """
+        Return a sync transport that sends a client's requests to this server.
+
+        Args:
+            **kwargs: Passed to ``httpx.HTTPTransport``.
+        """
+        return RedirectTransport(self.url, httpx.HTTPTransport(**kwargs))
+
+    def async_transport(self, **kwargs) -> httpx.AsyncBaseTransport:
+        """
+        Return an async transport that sends a client's requests to this server.
+
+        Args:
+            **kwargs: Passed to ``httpx.AsyncHTTPTransport``.
+        """
+        return RedirectTransport(self.url, httpx.AsyncHTTPTransport(**kwargs))
+
+    def handle(self, path: str, query: Dict[str, str], headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Answer one request.
+
+        Args:
+            path: The URL path, e.g. '/api/json/v1/1/filter.php'.
+            query: The query parameters.
+            headers: The request headers, with lower-case names.
+
+        Returns:
+            ``(status, headers, body)``.
+        """
+        with self._lock:
+            self.requests += 1
+            failed = self.error_rate and self._random.random() < self.error_rate
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay:
+            time.sleep(delay)
+        if failed:
+            extra = {'Retry-After': f'{self.retry_after:g}'} if self.retry_after is not None else {}
+            return self.error_status, extra, b''
+
+        if path.startswith('/images/ingredients/'):
+            etag = f'"{hashlib.sha256(path.encode("utf-8")).hexdigest()[:16]}"'
+            validators = {'ETag': etag, 'Last-Modified': self._modified, 'Content-Type': 'image/png'}
+            if headers.get('if-none-match') == etag or headers.get('if-modified-since') == self._modified:
+                return 304, validators, b''
+            return 200, validators, _image_bytes(path)
+
+        key, items = self._query(path.rsplit('/', 1)[-1], query)
+        if key is None:
+            return 404, {}, b''
+        body = json.dumps({key: list(items) or None}, ensure_ascii=False).encode('utf-8')
+        return 200, {'Content-Type': 'application/json'}, body
+
+    def _query(self, script: str, query: Dict[str, str]) -> Tuple[Optional[str], Iterable[Mapping[str, Any]]]:
+        catalog = self.catalog
+        if script == 'search.php' and 's' in query:
+            return 'meals', catalog.get_meal_by_name(query['s'])
+        if script == 'search.php' and 'f' in query:
+            return 'meals', catalog.list_all_meals(query['f'])
+        if script == 'lookup.php' and 'i' in query:
+            return 'meals', catalog.meal_details_by_id(query['i'])
+        if script == 'random.php':
+            ids = list(catalog.meals)
+            return 'meals', [catalog.meals[self._random.choice(ids)]] if ids else []
+        if script == 'categories.php':
+            return 'categories', catalog.list_meal_categories()
+        if script == 'list.php':
+            for param, method in (('c', catalog.list_all_categories), ('a', catalog.list_all_areas),
+                                  ('i', catalog.list_all_ingredients)):
+                if query.get(param) == 'list':
+                    return 'meals', method()
+        if script == 'filter.php':
+            for param, method in (('i', catalog.filter_by_ingredient), ('c', catalog.filter_by_category),
+                                  ('a', catalog.filter_by_area)):
+                if param in query:
+                    return 'meals', method(query[param])
+        return None, ()
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately; without TCP_NODELAY each keep-alive
+            # response waits for the client's delayed ACK.
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                status, headers, body = server.handle(
+                    unquote(parts.path),
+                    dict(parse_qsl(parts.query)),
+                    {k.lower(): v for k, v in self.headers.items()},
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
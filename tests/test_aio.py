@@ -0,0 +1,248 @@
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+import httpx
+
+from py_mealdb import AsyncMealDB
+from py_mealdb.models import MealDetails, MealList, CategoryList, AreaList, IngredientList
+
+
+RESPONSES = {
+    '/api/json/v1/1/search.php?s=Arrabiata': {'meals': [{'idMeal': '52771', 'strMeal': 'Spicy Arrabiata Penne'}]},
+    '/api/json/v1/1/search.php?f=a': {'meals': [{'idMeal': '52768', 'strMeal': 'Apple Frangipan Tart'}]},
+    '/api/json/v1/1/lookup.php?i=52772': {'meals': [{'idMeal': '52772', 'strMeal': 'Teriyaki Chicken Casserole'}]},
+    '/api/json/v1/1/lookup.php?i=0': {'meals': None},
+    '/api/json/v1/1/random.php': {'meals': [{'idMeal': '52900', 'strMeal': 'Random Meal'}]},
+    '/api/json/v1/1/latest.php': {'meals': [1, 2, 3]},
+    '/api/json/v1/1/categories.php': {'categories': [{'strCategory': 'Beef'}, {'strCategory': 'Chicken'}]},
+    '/api/json/v1/1/list.php?c=list': {'meals': [{'strCategory': 'Beef'}]},
+    '/api/json/v1/1/list.php?a=list': {'meals': [{'strArea': 'Canadian'}, {'strArea': 'Mexican'}]},
+    '/api/json/v1/1/list.php?i=list': {'meals': [{'strIngredient': 'Chicken'}]},
+    '/api/json/v1/1/filter.php?i=Chicken': {'meals': [{'idMeal': '1', 'strMeal': 'Chicken Curry', 'strMealThumb': 't'}]},
+    '/api/json/v1/1/filter.php?c=Seafood': {'meals': [{'idMeal': '2', 'strMeal': 'Salmon', 'strMealThumb': 't'}]},
+    '/api/json/v1/1/filter.php?a=Canadian': {'meals': [{'idMeal': '3', 'strMeal': 'Poutine', 'strMealThumb': 't'}]},
+}
+
+
+def handler(request):
+    path = request.url.raw_path.decode()
+    if path.startswith('/images/ingredients/'):
+        return httpx.Response(200, content=b'fake_image_data')
+    if path in RESPONSES:
+        return httpx.Response(200, json=RESPONSES[path])
+    return httpx.Response(500)
+
+
+class TestAsyncMealDB(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.meal_db = AsyncMealDB(1, transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.meal_db.aclose()
+
+    async def test_get_meal_by_name(self):
+        response = await self.meal_db.get_meal_by_name('Arrabiata')
+        self.assertIsInstance(response, MealDetails)
+        self.assertEqual(response.names, ['Spicy Arrabiata Penne'])
+
+    async def test_meal_details_by_id(self):
+        response = await self.meal_db.meal_details_by_id('52772')
+        self.assertIsInstance(response, MealDetails)
+        self.assertEqual(response.ids, ['52772'])
+
+    async def test_meal_details_by_id_not_found(self):
+        response = await self.meal_db.meal_details_by_id('0')
+        self.assertIsInstance(response, MealDetails)
+        self.assertEqual(len(response), 0)
+
+    async def test_meal_details_by_ids(self):
+        in_flight = 0
+        peak = 0
+
+        async def lookup(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            id = request.url.params['i']
+            if id == 'bad':
+                return httpx.Response(500)
+            if id == 'unknown':
+                return httpx.Response(200, json={'meals': None})
+            return httpx.Response(200, json={'meals': [{'idMeal': id, 'strMeal': f'Meal {id}'}]})
+
+        ids = [str(i) for i in range(10)] + ['bad', 'unknown', '0', '5']
+        async with AsyncMealDB(1, transport=httpx.MockTransport(lookup)) as meal_db:
+            response = await meal_db.meal_details_by_ids(ids, max_concurrency=3)
+
+        self.assertEqual(response.ids, [str(i) for i in range(10)])
+        self.assertEqual(list(response.errors), ['bad', 'unknown'])
+        self.assertIsInstance(response.errors['unknown'], LookupError)
+        self.assertLessEqual(peak, 3)
+
+    async def test_single_random_meal(self):
+        response = await self.meal_db.single_random_meal()
+        self.assertEqual(response[0]['strMeal'], 'Random Meal')
+
+    async def test_list_all_meals(self):
+        response = await self.meal_db.list_all_meals('a')
+        self.assertIsInstance(response, MealDetails)
+        self.assertIn('Apple Frangipan Tart', response.names)
+
+    async def test_get_latest_meal_requires_subscription(self):
+        response = await self.meal_db.get_latest_meal()
+        self.assertEqual(response, "You need to subscribe to The Meal DB API to access this endpoint")
+
+    async def test_list_meal_categories(self):
+        response = await self.meal_db.list_meal_categories()
+        self.assertIsInstance(response, CategoryList)
+        self.assertEqual(response.categories, ['Beef', 'Chicken'])
+
+    async def test_list_all_categories(self):
+        response = await self.meal_db.list_all_categories()
+        self.assertIsInstance(response, CategoryList)
+        self.assertIn('Chicken', response.categories)
+
+    async def test_list_all_areas(self):
+        response = await self.meal_db.list_all_areas()
+        self.assertIsInstance(response, AreaList)
+        self.assertEqual(response.areas, ['Canadian', 'Mexican'])
+
+    async def test_list_all_ingredients(self):
+        response = await self.meal_db.list_all_ingredients()
+        self.assertIsInstance(response, IngredientList)
+        self.assertEqual(response.ingredients, ['Chicken'])
+
+    async def test_list_all(self):
+        response = await self.meal_db.list_all()
+        self.assertIsInstance(response['categories'], CategoryList)
+        self.assertEqual(response['categories'].categories, ['Beef'])
+        self.assertIsInstance(response['areas'], AreaList)
+        self.assertIsInstance(response['ingredients'], IngredientList)
+
+    async def test_list_all_return_exceptions(self):
+        def failing(request):
+            if request.url.params.get('i') == 'list':
+                return httpx.Response(503)
+            return handler(request)
+
+        async with AsyncMealDB(1, transport=httpx.MockTransport(failing)) as meal_db:
+            response = await meal_db.list_all(return_exceptions=True)
+            self.assertIsInstance(response['ingredients'], httpx.HTTPStatusError)
+            self.assertEqual(response['areas'].areas, ['Canadian', 'Mexican'])
+
+            with self.assertRaises(httpx.HTTPStatusError):
+                await meal_db.list_all()
+
+    async def test_filters(self):
+        by_ingredient, by_category, by_area = await asyncio.gather(
+            self.meal_db.filter_by_ingredient('Chicken'),
+            self.meal_db.filter_by_category('Seafood'),
+            self.meal_db.filter_by_area('Canadian'),
+        )
+        for response in (by_ingredient, by_category, by_area):
+            self.assertIsInstance(response, MealList)
+        self.assertEqual(by_ingredient.names, ['Chicken Curry'])
+        self.assertEqual(by_category.names, ['Salmon'])
+        self.assertEqual(by_area.names, ['Poutine'])
+
+    async def test_find_meals(self):
+        response = await self.meal_db.find_meals(ingredients=['Chicken'], area='Canadian')
+        self.assertIsInstance(response, MealList)
+        self.assertEqual(len(response), 0)
+
+        response = await self.meal_db.find_meals(category='Seafood')
+        self.assertEqual(response.names, ['Salmon'])
+
+    async def test_status_error(self):
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.meal_db.filter_by_area('Nowhere')
+
+    async def test_ingredient_images(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                self.assertTrue(await self.meal_db.get_ingredient_image('tomato'))
+                self.assertTrue(await self.meal_db.get_ingredient_image_small('tomato'))
+                with open('tomato.png', 'rb') as file:
+                    self.assertEqual(file.read(), b'fake_image_data')
+                self.assertTrue(os.path.exists('tomato-small.png'))
+            finally:
+                os.chdir(cwd)
+
+
+    async def test_ingredient_image_sink_and_not_modified(self):
+        sink = io.BytesIO()
+        self.assertTrue(await self.meal_db.get_ingredient_image('tomato', dest=sink))
+        self.assertEqual(sink.getvalue(), b'fake_image_data')
+
+        async with AsyncMealDB(1, transport=httpx.MockTransport(lambda request: httpx.Response(304))) as meal_db:
+            with tempfile.TemporaryDirectory() as tmp:
+                with open(os.path.join(tmp, 'tomato-small.png'), 'wb') as file:
+                    file.write(b'cached')
+                self.assertFalse(await meal_db.get_ingredient_image_small('tomato', dest=tmp))
+
+
+    async def test_concurrent_identical_calls_share_one_request(self):
+        requests = []
+        release = asyncio.Event()
+
+        async def slow(request):
+            requests.append(request)
+            await release.wait()
+            if request.url.params.get('c') == 'Broken':
+                return httpx.Response(503)
+            return handler(request)
+
+        async with AsyncMealDB(1, transport=httpx.MockTransport(slow)) as meal_db:
+            calls = [asyncio.ensure_future(meal_db.meal_details_by_id('52772')) for _ in range(5)]
+            calls += [asyncio.ensure_future(meal_db.filter_by_category('Broken')) for _ in range(3)]
+            await asyncio.sleep(0)
+            calls[0].cancel()
+            release.set()
+            results = await asyncio.gather(*calls, return_exceptions=True)
+
+            self.assertEqual(len(requests), 2)
+            self.assertIsInstance(results[0], asyncio.CancelledError)
+            self.assertEqual([result.ids for result in results[1:5]], [['52772']] * 4)
+            self.assertTrue(all(isinstance(result, httpx.HTTPStatusError) for result in results[5:]))
+            self.assertEqual(meal_db.single_flight.coalesced, 6)
+
+    async def test_iter_all_meals(self):
+        requested = []
+
+        def pages(request):
+            letter = request.url.params['f']
+            requested.append(letter)
+            if letter == 'e':
+                return httpx.Response(503)
+            meals = [{'idMeal': letter, 'strMeal': letter}, {'idMeal': 'a', 'strMeal': 'a'}]
+            return httpx.Response(200, json={'meals': None if letter == 'b' else meals})
+
+        async with AsyncMealDB(1, transport=httpx.MockTransport(pages)) as meal_db:
+            self.assertEqual([meal['idMeal'] async for meal in meal_db.iter_all_meals(letters='abcd')], ['a', 'c', 'd'])
+
+            requested.clear()
+            meals = meal_db.iter_all_meals(prefetch=1)
+            self.assertEqual((await meals.__anext__())['idMeal'], 'a')
+            await meals.aclose()
+            await asyncio.sleep(0)
+            # Only 'b' runs ahead of 'a'; nothing more is scheduled until 'a' is consumed.
+            self.assertEqual(requested, ['a', 'b'])
+
+            requested.clear()
+            self.assertEqual([meal['idMeal'] async for meal in meal_db.iter_all_meals(letters='abc', prefetch=0)],
+                             ['a', 'c'])
+            self.assertEqual(requested, ['a', 'b', 'c'])
+
+            with self.assertRaises(httpx.HTTPStatusError):
+                [meal async for meal in meal_db.iter_all_meals(letters='de')]
+
+
+if __name__ == '__main__':
+    unittest.main()
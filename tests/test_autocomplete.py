@@ -0,0 +1,81 @@
+import unittest
+
+from py_mealdb.autocomplete import AutocompleteIndex, Suggestion, normalize, trigrams
+from py_mealdb.models import IngredientList
+from py_mealdb.offline import OfflineMealDB
+
+MEALS = [
+    {'idMeal': '52795', 'strMeal': 'Chicken Handi', 'strIngredient1': 'Chicken', 'strIngredient2': 'Onion'},
+    {'idMeal': '52945', 'strMeal': 'Kung Pao Chicken', 'strIngredient1': 'Chicken', 'strIngredient2': 'Soy Sauce'},
+    {'idMeal': '52959', 'strMeal': 'Baked salmon with fennel & tomatoes', 'strIngredient1': 'Salmon'},
+    {'idMeal': '52802', 'strMeal': 'Fish pie', 'strIngredient1': 'Salmon'},
+    {'idMeal': '52917', 'strMeal': 'White chocolate crème brûlée', 'strIngredient1': 'Crème Fraîche'},
+]
+
+
+class TestAutocompleteIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = AutocompleteIndex.from_catalog(OfflineMealDB(MEALS))
+
+    def test_normalize(self):
+        self.assertEqual(normalize('  Crème Fraîche '), 'creme fraiche')
+        self.assertEqual(normalize('Fennel & Tomatoes'), 'fennel tomatoes')
+        self.assertEqual(trigrams('ab'), {'  a', ' ab', 'ab '})
+
+    def test_build(self):
+        self.assertEqual(len(self.index), 5 + 5)
+
+    def test_complete(self):
+        self.assertEqual(
+            [(s.kind, s.value) for s in self.index.complete('chick')],
+            [('ingredient', 'Chicken'), ('meal', '52795'), ('meal', '52945')],
+        )
+        self.assertEqual([s.value for s in self.index.complete('SAL', kind='meal')], ['52959'])
+        self.assertEqual([s.value for s in self.index.complete('salmon w')], ['52959'])
+        self.assertEqual([s.label for s in self.index.complete('creme', kind='ingredient')], ['Crème Fraîche'])
+        self.assertEqual(self.index.complete('xyz'), [])
+        self.assertEqual(self.index.complete(' '), [])
+        self.assertEqual(len(self.index.complete('c', limit=2)), 2)
+
+    def test_fuzzy(self):
+        results = self.index.fuzzy('chiken', kind='ingredient')
+        self.assertEqual(results[0], Suggestion('ingredient', 'Chicken', 'Chicken', results[0].score))
+        self.assertGreaterEqual(results[0].score, self.index.threshold)
+        self.assertEqual(self.index.fuzzy('kung pow chikn')[0].value, '52945')
+        self.assertEqual(self.index.fuzzy('zzzz'), [])
+
+    def test_search_tops_up_with_fuzzy(self):
+        results = self.index.search('salmn')
+        self.assertEqual([s.value for s in results[:2]], ['Salmon', '52959'])
+        self.assertTrue(all(s.score < 1 for s in results))
+        results = self.index.search('fish', limit=3)
+        self.assertEqual(results[0], Suggestion('meal', '52802', 'Fish pie', 1.0))
+
+    def test_incremental_insertion(self):
+        self.assertFalse(self.index.add_meal(MEALS[0]))
+        self.assertFalse(self.index.add_ingredient('chicken '))
+        self.assertTrue(self.index.add_meal({'idMeal': '1', 'strMeal': 'Chickpea curry'}))
+        self.assertTrue(self.index.add_ingredient('Chickpeas'))
+        self.assertEqual([s.value for s in self.index.complete('chickp')], ['Chickpeas', '1'])
+        self.assertEqual(self.index.fuzzy('chikpea curry')[0].value, '1')
+
+    def test_capacity(self):
+        index = AutocompleteIndex(capacity=2)
+        for i in range(5):
+            index.add_meal({'idMeal': str(i), 'strMeal': f'Pie {"x" * (5 - i)}'})
+        self.assertEqual([s.value for s in index.complete('pie', limit=10)], ['4', '3'])
+
+    def test_explicit_ingredients(self):
+        index = AutocompleteIndex.from_catalog(
+            OfflineMealDB(MEALS), ingredients=IngredientList(items=[{'strIngredient': 'Avocado'}])
+        )
+        self.assertEqual([s.value for s in index.complete('a', kind='ingredient')], ['Avocado'])
+
+    def test_invalid_kind(self):
+        with self.assertRaises(ValueError):
+            self.index.complete('a', kind='drink')
+
+
+if __name__ == '__main__':
+    unittest.main()
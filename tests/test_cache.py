@@ -0,0 +1,290 @@
+import os
+import tempfile
+import threading
+import unittest
+import httpx
+
+from unittest.mock import patch
+from py_mealdb import MealDB, AsyncMealDB
+from py_mealdb.cache import BaseCache, MemoryCache, SQLiteCache, is_not_found
+
+BASE = 'https://www.themealdb.com/api/json/v1/1'
+
+
+class TestMemoryCache(unittest.TestCase):
+
+    def test_hit_and_miss_counters(self):
+        cache = MemoryCache()
+        self.assertIsNone(cache.get(f'{BASE}/lookup.php?i=1'))
+        cache.set(f'{BASE}/lookup.php?i=1', b'{"meals":[]}')
+        self.assertEqual(cache.get(f'{BASE}/lookup.php?i=1'), b'{"meals":[]}')
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+        self.assertEqual(stats.bytes, len(b'{"meals":[]}'))
+
+    def test_uncacheable_endpoints_are_skipped(self):
+        cache = MemoryCache()
+        cache.set(f'{BASE}/random.php', b'{"meals":[]}')
+        cache.set('https://www.themealdb.com/images/ingredients/Lime.png', b'png')
+        self.assertEqual(len(cache), 0)
+
+    def test_entries_expire(self):
+        cache = MemoryCache(ttls={'filter.php': 10})
+        with patch('py_mealdb.cache.time.monotonic', return_value=100.0):
+            cache.set(f'{BASE}/filter.php?a=Canadian', b'{"meals":[]}')
+        with patch('py_mealdb.cache.time.monotonic', return_value=109.0):
+            self.assertIsNotNone(cache.get(f'{BASE}/filter.php?a=Canadian'))
+        with patch('py_mealdb.cache.time.monotonic', return_value=110.0):
+            self.assertIsNone(cache.get(f'{BASE}/filter.php?a=Canadian'))
+        self.assertEqual(len(cache), 0)
+
+    def test_negative_responses_use_negative_ttl(self):
+        cache = MemoryCache(negative_ttl=5)
+        self.assertTrue(is_not_found(b'{"meals": null}'))
+        self.assertEqual(cache.ttl_for(f'{BASE}/search.php?s=x', b'{"meals":null}'), 5)
+        self.assertEqual(cache.ttl_for(f'{BASE}/search.php?s=x', b'{"meals":[]}'), 3600)
+
+    def test_lru_eviction_by_entries(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set(f'{BASE}/lookup.php?i=1', b'1')
+        cache.set(f'{BASE}/lookup.php?i=2', b'2')
+        cache.get(f'{BASE}/lookup.php?i=1')
+        cache.set(f'{BASE}/lookup.php?i=3', b'3')
+
+        self.assertIsNotNone(cache.get(f'{BASE}/lookup.php?i=1'))
+        self.assertIsNone(cache.get(f'{BASE}/lookup.php?i=2'))
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_lru_eviction_by_bytes(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set(f'{BASE}/lookup.php?i=1', b'x' * 6)
+        cache.set(f'{BASE}/lookup.php?i=2', b'y' * 6)
+        cache.set(f'{BASE}/lookup.php?i=3', b'z' * 11)
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats().bytes, 6)
+        self.assertIsNotNone(cache.get(f'{BASE}/lookup.php?i=2'))
+
+    def test_thread_safety(self):
+        cache = MemoryCache(max_entries=50)
+
+        def worker(n):
+            for i in range(200):
+                cache.set(f'{BASE}/lookup.php?i={n}-{i}', b'x')
+                cache.get(f'{BASE}/lookup.php?i={n}-{i - 1}')
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        self.assertEqual(stats.entries, 50)
+        self.assertEqual(stats.bytes, 50)
+        self.assertEqual(stats.hits + stats.misses, 1600)
+
+
+class TestBaseCache(unittest.TestCase):
+
+    def test_incomplete_cache_cannot_be_instantiated(self):
+        class GetOnly(BaseCache):
+            def get(self, url):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnly()
+
+
+class TestSQLiteCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_persists_across_instances(self):
+        cache = SQLiteCache(self.path)
+        cache.set(f'{BASE}/categories.php', b'{"categories":[]}', {'ETag': '"abc"', 'Content-Encoding': 'gzip'})
+        cache.close()
+
+        reopened = SQLiteCache(self.path)
+        self.assertEqual(reopened.get(f'{BASE}/categories.php'), b'{"categories":[]}')
+        self.assertEqual(reopened.get_headers(f'{BASE}/categories.php'), {'etag': '"abc"'})
+        self.assertEqual(reopened.stats().hits, 1)
+        reopened.close()
+
+    def test_uses_wal_mode(self):
+        cache = SQLiteCache(self.path)
+        mode = cache._db.execute('PRAGMA journal_mode').fetchone()[0]
+        self.assertEqual(mode, 'wal')
+        cache.close()
+
+    def test_stale_entries_provide_validators(self):
+        cache = SQLiteCache(self.path, ttls={'lookup.php': 10})
+        url = f'{BASE}/lookup.php?i=1'
+        headers = {'ETag': '"v1"', 'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'}
+        with patch('py_mealdb.cache.time.time', return_value=1000.0):
+            cache.set(url, b'{"meals":[]}', headers)
+        with patch('py_mealdb.cache.time.time', return_value=1011.0):
+            self.assertIsNone(cache.get(url))
+            self.assertEqual(cache.validators(url), {
+                'If-None-Match': '"v1"',
+                'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT',
+            })
+            self.assertEqual(cache.revalidate(url), b'{"meals":[]}')
+            self.assertEqual(cache.get(url), b'{"meals":[]}')
+        cache.close()
+
+    def test_lru_eviction(self):
+        cache = SQLiteCache(self.path, max_entries=2)
+        for i, now in enumerate((1.0, 2.0, 3.0)):
+            with patch('py_mealdb.cache.time.time', return_value=now):
+                cache.set(f'{BASE}/lookup.php?i={i}', b'x')
+                if i == 1:
+                    cache.get(f'{BASE}/lookup.php?i=0')
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats().evictions, 1)
+        self.assertEqual(cache.validators(f'{BASE}/lookup.php?i=1'), {})
+        cache.close()
+
+    def test_eviction_at_scale_keeps_most_recent(self):
+        cache = SQLiteCache(self.path, max_entries=2000, max_bytes=3000 * 10)
+        statements = []
+        for i in range(5000):
+            with patch('py_mealdb.cache.time.time', return_value=float(i)):
+                if i == 4000:
+                    cache._db.set_trace_callback(statements.append)
+                cache.set(f'{BASE}/lookup.php?i={i}', b'x' * 10)
+        cache._db.set_trace_callback(None)
+
+        stats = cache.stats()
+        self.assertEqual((stats.entries, stats.bytes, stats.evictions), (2000, 20000, 3000))
+        with patch('py_mealdb.cache.time.time', return_value=5000.0):
+            self.assertIsNone(cache.get(f'{BASE}/lookup.php?i=2999'))
+            self.assertIsNotNone(cache.get(f'{BASE}/lookup.php?i=3000'))
+        # Sets stay constant-cost: totals come from a counter row, never a scan of the table.
+        self.assertFalse([sql for sql in statements if 'COUNT(' in sql or 'SUM(' in sql])
+        cache.close()
+
+    def test_eviction_by_bytes_and_totals_across_instances(self):
+        cache = SQLiteCache(self.path, max_bytes=100)
+        for i in range(5):
+            with patch('py_mealdb.cache.time.time', return_value=float(i)):
+                cache.set(f'{BASE}/lookup.php?i={i}', b'x' * 30)
+        cache.set(f'{BASE}/lookup.php?i=4', b'x' * 10)
+
+        other = SQLiteCache(self.path)
+        self.assertEqual((other.stats().entries, other.stats().bytes), (3, 70))
+        other.clear()
+        self.assertEqual((cache.stats().entries, cache.stats().bytes), (0, 0))
+        other.close()
+        cache.close()
+
+    def test_client_revalidates_with_conditional_request(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={'meals': [{'strArea': 'Canadian'}]}, headers={'ETag': '"v1"'})
+
+        cache = SQLiteCache(self.path, ttls={'list.php': 10})
+        with MealDB(1, cache=cache, transport=httpx.MockTransport(handler)) as meal_db:
+            with patch('py_mealdb.cache.time.time', return_value=1000.0):
+                meal_db.list_all_areas()
+                meal_db.list_all_areas()
+            with patch('py_mealdb.cache.time.time', return_value=1020.0):
+                response = meal_db.list_all_areas()
+
+        self.assertEqual(response.areas, ['Canadian'])
+        self.assertEqual(seen, [None, '"v1"'])
+        cache.close()
+
+
+class TestClientCaching(unittest.TestCase):
+
+    def test_categories_endpoints_share_one_request(self):
+        calls = []
+
+        def handler(request):
+            calls.append(str(request.url))
+            return httpx.Response(200, json={'categories': [{'strCategory': 'Beef'}]})
+
+        cache = MemoryCache()
+        with MealDB(1, cache=cache, transport=httpx.MockTransport(handler)) as meal_db:
+            self.assertEqual(meal_db.list_meal_categories().categories, ['Beef'])
+            self.assertEqual(meal_db.list_all_categories().categories, ['Beef'])
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats().hits, 1)
+
+    def test_not_found_is_cached(self):
+        calls = []
+
+        def handler(request):
+            calls.append(str(request.url))
+            return httpx.Response(200, content=b'{"meals":null}')
+
+        with MealDB(1, cache=MemoryCache(), transport=httpx.MockTransport(handler)) as meal_db:
+            meal_db.get_meal_by_name('Nothing')
+            self.assertEqual(len(meal_db.get_meal_by_name('Nothing')), 0)
+
+        self.assertEqual(len(calls), 1)
+
+    def test_errors_are_not_cached(self):
+        with MealDB(1, cache=MemoryCache(), transport=httpx.MockTransport(lambda r: httpx.Response(500))) as meal_db:
+            with self.assertRaises(httpx.HTTPStatusError):
+                meal_db.filter_by_area('Canadian')
+            self.assertEqual(len(meal_db.cache), 0)
+
+
+class TestAsyncClientCaching(unittest.IsolatedAsyncioTestCase):
+
+    async def test_cache_is_used(self):
+        calls = []
+
+        def handler(request):
+            calls.append(str(request.url))
+            return httpx.Response(200, json={'meals': [{'strArea': 'Canadian'}]})
+
+        async with AsyncMealDB(1, cache=MemoryCache(), transport=httpx.MockTransport(handler)) as meal_db:
+            await meal_db.list_all_areas()
+            response = await meal_db.list_all_areas()
+
+        self.assertEqual(response.areas, ['Canadian'])
+        self.assertEqual(len(calls), 1)
+
+    async def test_disk_cache_runs_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        threads = []
+
+        class RecordingCache(SQLiteCache):
+            def get(self, url):
+                threads.append(threading.get_ident())
+                return super().get(url)
+
+            def set(self, url, content, headers=None):
+                threads.append(threading.get_ident())
+                super().set(url, content, headers)
+
+        handler = lambda request: httpx.Response(200, json={'meals': [{'strArea': 'Canadian'}]})
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = RecordingCache(os.path.join(tmp, 'cache.db'))
+            async with AsyncMealDB(1, cache=cache, transport=httpx.MockTransport(handler)) as meal_db:
+                await meal_db.list_all_areas()
+                response = await meal_db.list_all_areas()
+            cache.close()
+
+        self.assertEqual(response.areas, ['Canadian'])
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(loop_thread, threads)
+
+
+if __name__ == '__main__':
+    unittest.main()
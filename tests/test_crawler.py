@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+import unittest
+import httpx
+
+from unittest.mock import patch
+from py_mealdb import MealDB
+from py_mealdb.cli import main
+from py_mealdb.crawler import crawl, checkpoint_path
+
+CATALOG = {
+    'a': [{'idMeal': '1', 'strMeal': 'Apple Pie'}, {'idMeal': '2', 'strMeal': 'Arrabiata'}],
+    'b': [{'idMeal': '3', 'strMeal': 'Beef Stew'}, {'idMeal': '1', 'strMeal': 'Apple Pie'}],
+    'c': None,
+}
+
+
+def handler(request):
+    letter = request.url.params['f']
+    if letter == 'x':
+        return httpx.Response(500)
+    return httpx.Response(200, json={'meals': CATALOG.get(letter)})
+
+
+def read_ids(path):
+    with open(path, encoding='utf-8') as file:
+        return [json.loads(line)['idMeal'] for line in file]
+
+
+class TestCrawler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.tmp.name, 'catalog.jsonl')
+        self.meal_db = MealDB(1, transport=httpx.MockTransport(handler))
+
+    def tearDown(self):
+        self.meal_db.close()
+        self.tmp.cleanup()
+
+    def test_crawl_dedupes_meals(self):
+        result = crawl(self.meal_db, self.output, letters='abc')
+
+        self.assertEqual(sorted(read_ids(self.output)), ['1', '2', '3'])
+        self.assertEqual(result.meals_written, 3)
+        self.assertEqual(sorted(result.letters_done), ['a', 'b', 'c'])
+        with open(checkpoint_path(self.output), encoding='utf-8') as file:
+            self.assertEqual(json.load(file), {'letters': ['a', 'b', 'c']})
+
+    def test_failed_letters_are_reported_and_retried(self):
+        result = crawl(self.meal_db, self.output, letters='ax')
+        self.assertEqual(list(result.errors), ['x'])
+        self.assertEqual(result.letters_done, ['a'])
+
+        result = crawl(self.meal_db, self.output, letters='abx')
+        self.assertEqual(result.letters_skipped, ['a'])
+        self.assertEqual(result.letters_done, ['b'])
+        self.assertEqual(sorted(read_ids(self.output)), ['1', '2', '3'])
+
+    def test_resume_drops_partial_line(self):
+        crawl(self.meal_db, self.output, letters='a')
+        with open(self.output, 'a', encoding='utf-8') as file:
+            file.write('{"idMeal": "9", "str')
+
+        result = crawl(self.meal_db, self.output, letters='ab')
+        self.assertEqual(result.meals_written, 1)
+        self.assertEqual(read_ids(self.output), ['1', '2', '3'])
+
+    def test_fresh_crawl_starts_over(self):
+        crawl(self.meal_db, self.output, letters='a')
+        result = crawl(self.meal_db, self.output, letters='a', resume=False)
+        self.assertEqual(result.letters_done, ['a'])
+        self.assertEqual(read_ids(self.output), ['1', '2'])
+
+    def test_cli_crawl(self):
+        transport = httpx.MockTransport(handler)
+        with patch('py_mealdb.cli.MealDB', lambda api_key: MealDB(api_key, transport=transport)):
+            with patch('sys.stderr'):
+                self.assertEqual(main(['crawl', self.output, '--letters', 'ab']), 0)
+                self.assertEqual(main(['crawl', self.output, '--letters', 'x']), 1)
+        self.assertEqual(sorted(read_ids(self.output)), ['1', '2', '3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
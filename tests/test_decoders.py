@@ -0,0 +1,87 @@
+import json
+import unittest
+import httpx
+
+from py_mealdb import MealDB
+from py_mealdb.decoders import Decoder, available_decoders, get_decoder
+from py_mealdb.models import MealDetails, MealList, CategoryList, AreaList, IngredientList
+
+MEAL = {
+    'idMeal': '52772', 'strMeal': 'Teriyaki Chicken Casserole', 'strCategory': 'Chicken',
+    'strArea': 'Japanese', 'strTags': 'Meat,Casserole', 'strIngredient1': 'soy sauce',
+    'strMeasure1': '3/4 cup', 'strIngredient2': '', 'strMeasure2': ' ', 'strUnknownField': 'ignored',
+}
+PAYLOADS = {
+    (MealDetails, 'meals'): {'meals': [MEAL]},
+    (MealList, 'meals'): {'meals': [{'strMeal': 'Poutine', 'strMealThumb': 't', 'idMeal': '52804'}]},
+    (CategoryList, 'categories'): {'categories': [{'idCategory': '1', 'strCategory': 'Beef'}]},
+    (AreaList, 'meals'): {'meals': [{'strArea': 'Canadian'}]},
+    (IngredientList, 'meals'): {'meals': [{'idIngredient': '1', 'strIngredient': 'Chicken', 'strDescription': None}]},
+}
+
+
+class TestDecoders(unittest.TestCase):
+
+    def test_stdlib_is_always_available(self):
+        self.assertIn('json', available_decoders())
+        self.assertIsNone(get_decoder(None))
+        self.assertEqual(get_decoder('auto').name, available_decoders()[-1])
+
+    def test_unknown_decoder(self):
+        with self.assertRaises(ValueError):
+            get_decoder('yaml')
+
+    def test_all_backends_build_equivalent_models(self):
+        for name in available_decoders():
+            decoder = get_decoder(name)
+            for (model, key), payload in PAYLOADS.items():
+                with self.subTest(decoder=name, model=model.__name__):
+                    eager = model.from_response(payload, key=key)
+                    decoded = model.from_response(decoder.decode(json.dumps(payload).encode(), model, key), key=key)
+                    self.assertEqual(len(decoded), len(eager))
+                    for item, expected in zip(decoded, eager):
+                        for field in expected:
+                            if field != 'strUnknownField':
+                                self.assertEqual(item[field], expected[field])
+
+    def test_meal_helpers_work_on_decoded_items(self):
+        for name in available_decoders():
+            with self.subTest(decoder=name):
+                meals = MealDetails.from_response(get_decoder(name).decode(json.dumps({'meals': [MEAL]}).encode(), MealDetails))
+                self.assertEqual(meals.get_ingredients(), [{'name': 'soy sauce', 'measure': '3/4 cup'}])
+                self.assertEqual(meals.get_tags(), ['Meat', 'Casserole'])
+                self.assertEqual(meals.to_meals()[0].category, 'Chicken')
+
+    def test_null_meals(self):
+        for name in available_decoders():
+            with self.subTest(decoder=name):
+                self.assertEqual(len(MealDetails.from_response(get_decoder(name).decode(b'{"meals":null}', MealDetails))), 0)
+
+    def test_client_uses_decoder(self):
+        calls = []
+
+        class RecordingDecoder(Decoder):
+            def decode(self, content, model=None, key='meals'):
+                calls.append((model, key))
+                return super().decode(content, model, key)
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={'categories': [{'strCategory': 'Beef'}]}))
+        with MealDB(1, decoder=RecordingDecoder(), transport=transport) as meal_db:
+            self.assertEqual(meal_db.list_all_categories().categories, ['Beef'])
+        self.assertEqual(calls, [(CategoryList, 'categories')])
+
+
+@unittest.skipUnless('msgspec' in available_decoders(), 'msgspec is not installed')
+class TestMsgspecDecoder(unittest.TestCase):
+
+    def test_items_are_typed_structs(self):
+        from py_mealdb.decoders import MealStruct
+        data = get_decoder('msgspec').decode(json.dumps({'meals': [MEAL]}).encode(), MealDetails)
+        self.assertIsInstance(data['meals'][0], MealStruct)
+        self.assertEqual(data['meals'][0].strArea, 'Japanese')
+        with self.assertRaises(KeyError):
+            data['meals'][0]['strUnknownField']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+import httpx
+
+from py_mealdb import MealDB, AsyncMealDB
+from py_mealdb.retry import RetryPolicy
+from py_mealdb.testing import RecordingTransport, RedirectTransport, ReplayTransport, StandInServer
+
+MEALS = [
+    {
+        'idMeal': '52771', 'strMeal': 'Spicy Arrabiata Penne', 'strCategory': 'Vegetarian',
+        'strArea': 'Italian', 'strMealThumb': 'https://example.com/1.jpg',
+        'strIngredient1': 'penne rigate', 'strIngredient2': 'Garlic', 'strIngredient3': '',
+    },
+    {
+        'idMeal': '52802', 'strMeal': 'Fish pie', 'strCategory': 'Seafood',
+        'strArea': 'British', 'strMealThumb': 'https://example.com/2.jpg',
+        'strIngredient1': 'Garlic', 'strIngredient2': 'Salmon', 'strIngredient3': None,
+    },
+    {
+        'idMeal': '52959', 'strMeal': 'Baked salmon with fennel & tomatoes', 'strCategory': 'Seafood',
+        'strArea': 'Italian', 'strMealThumb': 'https://example.com/3.jpg',
+        'strIngredient1': 'Salmon', 'strIngredient2': 'salmon',
+    },
+]
+
+
+class TestStandInServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StandInServer(MEALS, seed=1).start()
+        self.addCleanup(self.server.close)
+        self.meal_db = MealDB('1', transport=self.server.transport())
+        self.addCleanup(self.meal_db.close)
+
+    def test_endpoints(self):
+        mb = self.meal_db
+        self.assertEqual(mb.get_meal_by_name('salmon').ids, ['52959'])
+        self.assertEqual(mb.list_all_meals('f').names, ['Fish pie'])
+        self.assertEqual(mb.meal_details_by_id('52802').names, ['Fish pie'])
+        self.assertEqual(len(mb.meal_details_by_id('1')), 0)
+        self.assertIn(mb.single_random_meal().ids[0], {'52771', '52802', '52959'})
+        self.assertEqual(mb.filter_by_ingredient('Garlic').ids, ['52771', '52802'])
+        self.assertEqual(mb.filter_by_category('Seafood').ids, ['52802', '52959'])
+        self.assertEqual(mb.filter_by_area('Italian').ids, ['52771', '52959'])
+        self.assertEqual(mb.list_all_areas().areas, ['British', 'Italian'])
+        self.assertIn('Salmon', mb.list_all_ingredients().ingredients)
+        self.assertEqual(mb.list_meal_categories().categories, ['Seafood', 'Vegetarian'])
+        self.assertEqual(self.server.requests, 11)
+
+    def test_list_all(self):
+        lists = self.meal_db.list_all()
+        self.assertEqual(lists['categories'].categories, ['Seafood', 'Vegetarian'])
+        self.assertEqual(lists['areas'].areas, ['British', 'Italian'])
+        self.assertIn('Garlic', lists['ingredients'].ingredients)
+
+    def test_raw_requests(self):
+        with httpx.Client(base_url=self.server.url) as client:
+            self.assertEqual(client.get('/api/json/v1/1/filter.php', params={'a': 'Mexican'}).json(), {'meals': None})
+            self.assertEqual(client.get('/api/json/v1/1/list.php', params={'c': 'list'}).json()['meals'][0],
+                             {'strCategory': 'Seafood'})
+            self.assertEqual(client.get('/api/json/v1/1/unknown.php').status_code, 404)
+
+    def test_images(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertTrue(self.meal_db.get_ingredient_image('Garlic', tmp))
+            with open(os.path.join(tmp, 'Garlic.png'), 'rb') as file:
+                self.assertTrue(file.read().startswith(b'\x89PNG'))
+            # The file's mtime now matches Last-Modified, so the next download is a 304.
+            self.assertFalse(self.meal_db.get_ingredient_image('Garlic', tmp))
+            self.assertTrue(self.meal_db.get_ingredient_image_small('Garlic', tmp))
+
+    def test_error_injection_with_retries(self):
+        self.server.error_rate = 0.5
+        retry = RetryPolicy(max_retries=10, backoff=0.001)
+        with MealDB('1', transport=self.server.transport(), retry=retry) as mb:
+            for _ in range(10):
+                self.assertEqual(mb.filter_by_area('Italian').ids, ['52771', '52959'])
+        self.assertGreater(retry.stats().retries, 0)
+        self.assertEqual(self.server.requests, 10 + retry.stats().retries)
+
+    def test_error_injection_retry_after(self):
+        self.server.error_rate = 1.0
+        self.server.error_status = 429
+        self.server.retry_after = 120
+        with MealDB('1', transport=self.server.transport(), retry=RetryPolicy(max_wait=1)) as mb:
+            with self.assertRaises(httpx.HTTPStatusError) as cm:
+                mb.filter_by_area('Italian')
+        self.assertEqual(cm.exception.response.status_code, 429)
+        self.assertEqual(self.server.requests, 1)
+
+    def test_latency_and_coalescing(self):
+        self.server.latency = 0.1
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.meal_db.filter_by_area('Italian').ids))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [['52771', '52959']] * 8)
+        self.assertEqual(self.server.requests, 1)
+
+
+class TestAsyncStandInServer(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_requests(self):
+        with StandInServer(MEALS, latency=0.05) as server:
+            async with AsyncMealDB('1', transport=server.async_transport(), coalesce=False) as mb:
+                results = await asyncio.gather(*(mb.meal_details_by_id(id) for id in ['52771', '52802', '52959'] * 4))
+        self.assertEqual([r.ids[0] for r in results], ['52771', '52802', '52959'] * 4)
+        self.assertEqual(server.requests, 12)
+
+    async def test_list_all(self):
+        with StandInServer(MEALS) as server:
+            async with AsyncMealDB('1', transport=server.async_transport()) as mb:
+                lists = await mb.list_all()
+        self.assertEqual(lists['categories'].categories, ['Seafood', 'Vegetarian'])
+        self.assertEqual(lists['areas'].areas, ['British', 'Italian'])
+
+
+class TestRecordReplay(unittest.TestCase):
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp, StandInServer(MEALS) as server:
+            cassette = os.path.join(tmp, 'cassette.json')
+            os.mkdir(os.path.join(tmp, 'live'))
+            os.mkdir(os.path.join(tmp, 'replayed'))
+            recorder = RecordingTransport(cassette, server.transport())
+            with MealDB('1', transport=recorder) as mb:
+                recorded = mb.filter_by_area('Italian').ids
+                mb.meal_details_by_id('52802')
+                self.assertTrue(mb.get_ingredient_image('Salmon', os.path.join(tmp, 'live')))
+            self.assertEqual(len(recorder.interactions), 3)
+            with open(cassette, encoding='utf-8') as file:
+                self.assertIn('body_base64', json.load(file)['interactions'][2]['response'])
+
+            with MealDB('1', transport=ReplayTransport(cassette)) as mb:
+                self.assertEqual(mb.filter_by_area('Italian').ids, recorded)
+                self.assertEqual(mb.meal_details_by_id('52802').names, ['Fish pie'])
+                self.assertTrue(mb.get_ingredient_image('Salmon', os.path.join(tmp, 'replayed')))
+                with self.assertRaises(LookupError):
+                    mb.filter_by_area('Mexican')
+            with open(os.path.join(tmp, 'live', 'Salmon.png'), 'rb') as live, \
+                    open(os.path.join(tmp, 'replayed', 'Salmon.png'), 'rb') as replayed:
+                self.assertEqual(live.read(), replayed.read())
+            self.assertEqual(server.requests, 3)
+
+    def test_replay_in_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cassette = os.path.join(tmp, 'cassette.json')
+            responses = iter([httpx.Response(503), httpx.Response(200, json={'meals': None})])
+            recorder = RecordingTransport(cassette, httpx.MockTransport(lambda request: next(responses)))
+            with MealDB('1', transport=recorder, retry=RetryPolicy(backoff=0)) as mb:
+                self.assertEqual(len(mb.filter_by_area('Mexican')), 0)
+
+            replay = ReplayTransport(cassette)
+            with httpx.Client(transport=replay) as client:
+                url = 'https://www.themealdb.com/api/json/v1/1/filter.php?a=Mexican'
+                self.assertEqual([client.get(url).status_code for _ in range(3)], [503, 200, 200])
+
+    def test_mismatched_transport_raises_type_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            recorder = RecordingTransport(os.path.join(tmp, 'cassette.json'), httpx.AsyncHTTPTransport())
+            with MealDB('1', transport=recorder) as mb:
+                with self.assertRaisesRegex(TypeError, 'AsyncHTTPTransport'):
+                    mb.filter_by_area('Italian')
+
+        async def run():
+            async with AsyncMealDB('1', transport=RedirectTransport('http://127.0.0.1:1', httpx.HTTPTransport())) as mb:
+                await mb.filter_by_area('Italian')
+
+        with self.assertRaisesRegex(TypeError, 'RedirectTransport wraps HTTPTransport'):
+            asyncio.run(run())
+
+    def test_async_round_trip(self):
+        async def run(transport):
+            async with AsyncMealDB('1', transport=transport) as mb:
+                return (await mb.filter_by_category('Seafood')).ids
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer(MEALS) as server:
+            cassette = os.path.join(tmp, 'cassette.json')
+            recorded = asyncio.run(run(RecordingTransport(cassette, server.async_transport())))
+            self.assertEqual(asyncio.run(run(ReplayTransport(cassette))), recorded)
+            self.assertEqual(recorded, ['52802', '52959'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,16 @@
+import io
+import os
+import stat
+import tempfile
+import threading
+import time
 import unittest
 import unittest.mock
 import httpx
 
 from py_mealdb import MealDB
-from py_mealdb.models import MealDetails, MealList, CategoryList, AreaList, IngredientList
-from unittest.mock import Mock, patch, mock_open
+from py_mealdb.models import MealDetails, MealList, MealColumns, CategoryList, AreaList, IngredientList
+from unittest.mock import Mock, patch
 
 
 class TestMealDB(unittest.TestCase):
@@ -13,10 +19,13 @@ class TestMealDB(unittest.TestCase):
         self.api_key = 1
         self.meal_db = MealDB(self.api_key)
 
+    def tearDown(self):
+        self.meal_db.close()
+
     # ─────────────────────────────────────────
     # get_meal_by_name
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_meal_by_name_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [
@@ -32,7 +41,7 @@ class TestMealDB(unittest.TestCase):
         self.assertIn('Arrabiata', response.names)
         self.assertIn('Arrabiata Sauce', response.names)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_meal_by_name_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': None}
@@ -42,14 +51,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.get_meal_by_name('NonExistentMeal')
         self.assertIsInstance(response, MealDetails)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_meal_by_name_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.get_meal_by_name('Arrabiata')
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_meal_by_name_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -63,7 +72,7 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # meal_details_by_id
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_meal_details_by_id_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [{'idMeal': '52772', 'strMeal': 'Arrabiata'}]}
@@ -76,7 +85,7 @@ class TestMealDB(unittest.TestCase):
         self.assertEqual(response[0]['idMeal'], '52772')
         self.assertEqual(response[0]['strMeal'], 'Arrabiata')
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_meal_details_by_id_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': None}
@@ -86,14 +95,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.meal_details_by_id('99999')
         self.assertIsInstance(response, MealDetails)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_meal_details_by_id_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.meal_details_by_id('52772')
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_meal_details_by_id_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -104,10 +113,34 @@ class TestMealDB(unittest.TestCase):
         with self.assertRaises(httpx.HTTPStatusError):
             self.meal_db.meal_details_by_id('52772')
 
+    def test_meal_details_by_ids_dedupes_and_keeps_order(self):
+        seen = []
+        lock = threading.Lock()
+
+        def handler(request):
+            id = request.url.params['i']
+            with lock:
+                seen.append(id)
+            if id == '3':
+                return httpx.Response(500)
+            if id == '999':
+                return httpx.Response(200, json={'meals': None})
+            return httpx.Response(200, json={'meals': [{'idMeal': id, 'strMeal': f'Meal {id}'}]})
+
+        with MealDB(self.api_key, transport=httpx.MockTransport(handler)) as meal_db:
+            response = meal_db.meal_details_by_ids(['2', '1', '3', '999', '2', '4'], max_concurrency=2)
+
+        self.assertIsInstance(response, MealDetails)
+        self.assertEqual(response.ids, ['2', '1', '4'])
+        self.assertEqual(sorted(seen), ['1', '2', '3', '4', '999'])
+        self.assertEqual(list(response.errors), ['3', '999'])
+        self.assertIsInstance(response.errors['3'], httpx.HTTPStatusError)
+        self.assertIsInstance(response.errors['999'], LookupError)
+
     # ─────────────────────────────────────────
     # single_random_meal
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_single_random_meal_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [{'idMeal': '52772', 'strMeal': 'Random Meal'}]}
@@ -119,7 +152,7 @@ class TestMealDB(unittest.TestCase):
         self.assertGreater(len(response), 0)
         self.assertEqual(response[0]['strMeal'], 'Random Meal')
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_single_random_meal_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': None}
@@ -130,14 +163,14 @@ class TestMealDB(unittest.TestCase):
         self.assertIsInstance(response, MealDetails)
 
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_single_random_meal_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.single_random_meal()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_single_random_meal_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -151,7 +184,7 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # list_all_meals
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_meals_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [
@@ -167,7 +200,7 @@ class TestMealDB(unittest.TestCase):
         self.assertIn('Apple Pie', response.names)
         self.assertIn('Avocado Toast', response.names)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_meals_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': None}
@@ -178,14 +211,14 @@ class TestMealDB(unittest.TestCase):
         self.assertIsInstance(response, MealDetails)
         self.assertEqual(len(response), 0)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_meals_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.list_all_meals('a')
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_meals_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -199,7 +232,7 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # list_meal_categories
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_meal_categories_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'categories': [
@@ -215,7 +248,7 @@ class TestMealDB(unittest.TestCase):
         self.assertIn('Beef', response.categories)
         self.assertIn('Chicken', response.categories)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_meal_categories_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'categories': None}
@@ -225,14 +258,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.list_meal_categories()
         self.assertIsInstance(response, CategoryList)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_meal_categories_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.list_meal_categories()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_meal_categories_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -246,7 +279,7 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # list_all_categories
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_categories_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'categories': [
@@ -262,7 +295,7 @@ class TestMealDB(unittest.TestCase):
         self.assertIn('Beef', response.categories)
         self.assertIn('Chicken', response.categories)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_categories_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'categories': None}
@@ -272,14 +305,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.list_all_categories()
         self.assertIsInstance(response, CategoryList)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_categories_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.list_all_categories()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_categories_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -293,7 +326,7 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # list_all_areas
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_areas_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [
@@ -309,7 +342,7 @@ class TestMealDB(unittest.TestCase):
         self.assertIn('Mexican', response.areas)
         self.assertIn('Canadian', response.areas)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_areas_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': None}
@@ -319,14 +352,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.list_all_areas()
         self.assertIsInstance(response, AreaList)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_areas_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.list_all_areas()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_areas_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -340,7 +373,7 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # list_all_ingredients
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_ingredients_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [
@@ -356,7 +389,7 @@ class TestMealDB(unittest.TestCase):
         self.assertIn('Chicken', response.ingredients)
         self.assertIn('Beef', response.ingredients)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_ingredients_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': None}
@@ -366,14 +399,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.list_all_ingredients()
         self.assertIsInstance(response, IngredientList)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_ingredients_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.list_all_ingredients()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_ingredients_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -387,7 +420,7 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # list_all
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -406,14 +439,14 @@ class TestMealDB(unittest.TestCase):
         self.assertIsInstance(response['areas'], AreaList)
         self.assertIsInstance(response['ingredients'], IngredientList)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.list_all()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_list_all_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -424,10 +457,37 @@ class TestMealDB(unittest.TestCase):
         with self.assertRaises(httpx.HTTPStatusError):
             self.meal_db.list_all()
 
+    def test_list_all_runs_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def handler(request):
+            barrier.wait()
+            return httpx.Response(200, json={'meals': [], 'categories': []})
+
+        with MealDB(self.api_key, transport=httpx.MockTransport(handler)) as meal_db:
+            response = meal_db.list_all()
+
+        self.assertEqual(set(response), {'categories', 'areas', 'ingredients'})
+
+    def test_list_all_return_exceptions(self):
+        def handler(request):
+            if request.url.params.get('a') == 'list':
+                return httpx.Response(500)
+            return httpx.Response(200, json={'meals': [{'strIngredient': 'Chicken'}], 'categories': []})
+
+        with MealDB(self.api_key, transport=httpx.MockTransport(handler)) as meal_db:
+            response = meal_db.list_all(return_exceptions=True)
+            self.assertIsInstance(response['areas'], httpx.HTTPStatusError)
+            self.assertIsInstance(response['categories'], CategoryList)
+            self.assertEqual(response['ingredients'].ingredients, ['Chicken'])
+
+            with self.assertRaises(httpx.HTTPStatusError):
+                meal_db.list_all()
+
     # ─────────────────────────────────────────
     # filter_by_ingredient
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_ingredient_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [
@@ -443,7 +503,7 @@ class TestMealDB(unittest.TestCase):
         self.assertIn('52772', response.ids)
         self.assertIn('Chicken Curry', response.names)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_ingredient_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': None}
@@ -453,14 +513,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.filter_by_ingredient('NonExistentIngredient')
         self.assertIsInstance(response, MealList)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_ingredient_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.filter_by_ingredient('Chicken')
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_ingredient_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -474,7 +534,7 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # filter_by_category
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_category_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [
@@ -490,7 +550,7 @@ class TestMealDB(unittest.TestCase):
         self.assertIn('Salmon', response.names)
         self.assertIn('Tuna', response.names)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_category_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': None}
@@ -500,14 +560,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.filter_by_category('NonExistentCategory')
         self.assertIsInstance(response, MealList)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_category_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.filter_by_category('Seafood')
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_category_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -521,7 +581,7 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # filter_by_area
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_area_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [
@@ -537,7 +597,7 @@ class TestMealDB(unittest.TestCase):
         self.assertIn('Poutine', response.names)
         self.assertIn('BeaverTails', response.names)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_area_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': None}
@@ -547,14 +607,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.filter_by_area('NonExistentArea')
         self.assertIsInstance(response, MealList)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_area_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.filter_by_area('Canadian')
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_filter_by_area_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -565,10 +625,66 @@ class TestMealDB(unittest.TestCase):
         with self.assertRaises(httpx.HTTPStatusError):
             self.meal_db.filter_by_area('Canadian')
 
+    # ─────────────────────────────────────────
+    # find_meals
+    # ─────────────────────────────────────────
+    def test_find_meals_intersects_filters(self):
+        lists = {
+            'i=Garlic': ['1', '2', '3', '4'],
+            'c=Seafood': ['2', '3', '5'],
+            'a=Italian': ['3', '2', '9'],
+        }
+        seen = []
+
+        def handler(request):
+            key = str(request.url).split('?', 1)[1]
+            seen.append(key)
+            return httpx.Response(200, json={'meals': [
+                {'idMeal': id, 'strMeal': f'Meal {id}', 'strMealThumb': 't'} for id in lists[key]
+            ]})
+
+        with MealDB(self.api_key, transport=httpx.MockTransport(handler)) as meal_db:
+            response = meal_db.find_meals(ingredients=['Garlic'], category='Seafood', area='Italian')
+
+        self.assertIsInstance(response, MealList)
+        self.assertEqual(response.ids, ['2', '3'])
+        self.assertEqual(sorted(seen), sorted(lists))
+
+    def test_find_meals_columnar(self):
+        lists = {'i=Garlic': ['1', '2', '3', '4'], 'a=Italian': ['3', '2', '9']}
+
+        def handler(request):
+            return httpx.Response(200, json={'meals': [
+                {'strMeal': f'Meal {id}', 'strMealThumb': None, 'idMeal': id}
+                for id in lists[str(request.url).split('?', 1)[1]]
+            ]})
+
+        with MealDB(self.api_key, columnar=True, transport=httpx.MockTransport(handler)) as meal_db:
+            with patch('httpx.Response.json') as decode:
+                response = meal_db.find_meals(ingredients=['Garlic'], area='Italian')
+                decode.assert_not_called()
+
+        self.assertIsInstance(response.items, MealColumns)
+        self.assertEqual(response.ids, ['3', '2'])
+        self.assertEqual(response[0], {'strMeal': 'Meal 3', 'strMealThumb': None, 'idMeal': '3'})
+
+    def test_find_meals_empty_result(self):
+        def handler(request):
+            if request.url.params.get('a'):
+                return httpx.Response(200, json={'meals': None})
+            return httpx.Response(200, json={'meals': [{'idMeal': '1', 'strMeal': 'x', 'strMealThumb': 't'}]})
+
+        with MealDB(self.api_key, transport=httpx.MockTransport(handler)) as meal_db:
+            self.assertEqual(len(meal_db.find_meals(ingredients=['Garlic', 'Salmon'], area='Nowhere')), 0)
+
+    def test_find_meals_requires_criteria(self):
+        with self.assertRaises(ValueError):
+            self.meal_db.find_meals()
+
     # ─────────────────────────────────────────
     # get_latest_meal
     # ─────────────────────────────────────────
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_latest_meal_success(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [{'idMeal': '52772', 'strMeal': 'Latest Meal'}]}
@@ -579,7 +695,7 @@ class TestMealDB(unittest.TestCase):
         if isinstance(response, list):
             self.assertGreater(len(response), 0)
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_latest_meal_not_found(self, mock_get):
         mock_response = Mock()
         mock_response.json.return_value = {'meals': [1, 2, 3]}
@@ -588,14 +704,14 @@ class TestMealDB(unittest.TestCase):
         response = self.meal_db.get_latest_meal()
         self.assertEqual(response, "You need to subscribe to The Meal DB API to access this endpoint")
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_latest_meal_http_error(self, mock_get):
         mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
         with self.assertRaises(httpx.HTTPError):
             self.meal_db.get_latest_meal()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_latest_meal_status_error(self, mock_get):
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -609,68 +725,303 @@ class TestMealDB(unittest.TestCase):
     # ─────────────────────────────────────────
     # get_ingredient_image
     # ─────────────────────────────────────────
-    @patch('httpx.get')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_get_ingredient_image_success(self, mock_file, mock_get):
-        mock_response = Mock()
-        mock_response.content = b'fake_image_data'
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+    def image_client(self, handler):
+        self.requests = []
+
+        def record(request):
+            self.requests.append(request)
+            return handler(request)
+
+        meal_db = MealDB(self.api_key, transport=httpx.MockTransport(record))
+        self.addCleanup(meal_db.close)
+        return meal_db
+
+    def test_get_ingredient_image_success(self):
+        meal_db = self.image_client(lambda request: httpx.Response(
+            200, content=b'fake_image_data', headers={'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        ))
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertTrue(meal_db.get_ingredient_image('tomato', dest=tmp))
+            path = os.path.join(tmp, 'tomato.png')
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), b'fake_image_data')
+            self.assertEqual(os.path.getmtime(path), 1445412480)
+            self.assertEqual(os.listdir(tmp), ['tomato.png'])
+        self.assertEqual(self.requests[0].url.path, '/images/ingredients/tomato.png')
+
+    def test_get_ingredient_image_file_mode_follows_umask(self):
+        meal_db = self.image_client(lambda request: httpx.Response(200, content=b'fake_image_data'))
+        umask = os.umask(0)
+        os.umask(umask)
+        with tempfile.TemporaryDirectory() as tmp:
+            meal_db.get_ingredient_image('tomato', dest=tmp)
+            mode = stat.S_IMODE(os.stat(os.path.join(tmp, 'tomato.png')).st_mode)
+        self.assertEqual(mode, 0o666 & ~umask)
+
+    def test_download_image_returns_response(self):
+        def handler(request):
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b'fake_image_data', headers={'ETag': '"v1"'})
+
+        meal_db = self.image_client(handler)
+        sink = io.BytesIO()
+        r = meal_db.download_image('tomato', sink, small=True)
+        self.assertEqual(r.headers['etag'], '"v1"')
+        self.assertEqual(sink.getvalue(), b'fake_image_data')
+        self.assertEqual(self.requests[0].url.path, '/images/ingredients/tomato-Small.png')
+        self.assertIsNone(meal_db.download_image('tomato', io.BytesIO(), headers={'If-None-Match': '"v1"'}))
+
+    def test_get_ingredient_image_to_file_object(self):
+        meal_db = self.image_client(lambda request: httpx.Response(200, content=b'fake_image_data'))
+        sink = io.BytesIO()
+        self.assertTrue(meal_db.get_ingredient_image('tomato', dest=sink))
+        self.assertEqual(sink.getvalue(), b'fake_image_data')
+        self.assertNotIn('if-modified-since', self.requests[0].headers)
+
+    def test_get_ingredient_image_not_modified(self):
+        meal_db = self.image_client(lambda request: httpx.Response(304))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tomato.png')
+            with open(path, 'wb') as file:
+                file.write(b'cached')
+            self.assertFalse(meal_db.get_ingredient_image('tomato', dest=tmp))
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), b'cached')
+        self.assertIn('if-modified-since', self.requests[0].headers)
+
+    def test_get_ingredient_image_http_error(self):
+        def handler(request):
+            raise httpx.ConnectError("Mocked HTTP error", request=request)
+
+        meal_db = self.image_client(handler)
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(httpx.HTTPError):
+                meal_db.get_ingredient_image('tomato', dest=tmp)
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_get_ingredient_image_status_error(self):
+        meal_db = self.image_client(lambda request: httpx.Response(404))
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(httpx.HTTPStatusError):
+                meal_db.get_ingredient_image('tomato', dest=tmp)
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_get_ingredient_image_interrupted_keeps_old_file(self):
+        class Interrupted(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b'partial'
+                raise httpx.ReadError('connection reset')
+
+        meal_db = self.image_client(lambda request: httpx.Response(200, stream=Interrupted()))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tomato.png')
+            with open(path, 'wb') as file:
+                file.write(b'old')
+            with self.assertRaises(httpx.ReadError):
+                meal_db.get_ingredient_image('tomato', dest=tmp)
+            self.assertEqual(os.listdir(tmp), ['tomato.png'])
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), b'old')
 
-        result = self.meal_db.get_ingredient_image('tomato')
-        self.assertTrue(result)
-        mock_file.assert_called_once_with('tomato.png', 'wb')
+    # ─────────────────────────────────────────
+    # get_ingredient_image_small
+    # ─────────────────────────────────────────
+    def test_get_ingredient_image_small_success(self):
+        meal_db = self.image_client(lambda request: httpx.Response(200, content=b'fake_image_data'))
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertTrue(meal_db.get_ingredient_image_small('tomato', dest=tmp))
+            self.assertEqual(os.listdir(tmp), ['tomato-small.png'])
+        self.assertEqual(self.requests[0].url.path, '/images/ingredients/tomato-Small.png')
+
+    def test_get_ingredient_image_small_status_error(self):
+        meal_db = self.image_client(lambda request: httpx.Response(404))
+        with self.assertRaises(httpx.HTTPStatusError):
+            meal_db.get_ingredient_image_small('tomato', dest=io.BytesIO())
 
-    @patch('httpx.get')
-    def test_get_ingredient_image_http_error(self, mock_get):
-        mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
 
-        with self.assertRaises(httpx.HTTPError):
-            self.meal_db.get_ingredient_image('tomato')
+    # ─────────────────────────────────────────
+    # pooled client
+    # ─────────────────────────────────────────
+    def test_custom_transport_is_used(self):
+        seen = []
 
-    @patch('httpx.get')
-    def test_get_ingredient_image_status_error(self, mock_get):
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "404 Not Found", request=Mock(), response=Mock()
-        )
-        mock_get.return_value = mock_response
+        def handler(request):
+            seen.append(str(request.url))
+            return httpx.Response(200, json={'meals': [{'idMeal': '52772', 'strMeal': 'Arrabiata'}]})
 
-        with self.assertRaises(httpx.HTTPStatusError):
-            self.meal_db.get_ingredient_image('tomato')
+        with MealDB(self.api_key, transport=httpx.MockTransport(handler)) as meal_db:
+            response = meal_db.meal_details_by_id('52772')
 
-    # ─────────────────────────────────────────
-    # get_ingredient_image_small
-    # ─────────────────────────────────────────
-    @patch('httpx.get')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_get_ingredient_image_small_success(self, mock_file, mock_get):
-        mock_response = Mock()
-        mock_response.content = b'fake_image_data'
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        self.assertIsInstance(response, MealDetails)
+        self.assertEqual(response.ids, ['52772'])
+        self.assertEqual(seen, ['https://www.themealdb.com/api/json/v1/1/lookup.php?i=52772'])
 
-        result = self.meal_db.get_ingredient_image_small('tomato')
-        self.assertTrue(result)
-        mock_file.assert_called_once_with('tomato-small.png', 'wb')
+    def test_client_is_reused_across_calls(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={'meals': None}))
+        meal_db = MealDB(self.api_key, transport=transport)
+        client = meal_db._client
 
-    @patch('httpx.get')
-    def test_get_ingredient_image_small_http_error(self, mock_get):
-        mock_get.side_effect = httpx.HTTPError("Mocked HTTP error")
+        meal_db.filter_by_area('Canadian')
+        meal_db.filter_by_category('Seafood')
+        self.assertIs(meal_db._client, client)
 
-        with self.assertRaises(httpx.HTTPError):
-            self.meal_db.get_ingredient_image_small('tomato')
+        meal_db.close()
+        self.assertTrue(client.is_closed)
 
-    @patch('httpx.get')
-    def test_get_ingredient_image_small_status_error(self, mock_get):
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "404 Not Found", request=Mock(), response=Mock()
-        )
-        mock_get.return_value = mock_response
+    def test_lazy_models(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=(
+            b'{"meals":[{"strMeal":"Poutine","strMealThumb":"t","idMeal":"52804"}]}'
+        )))
+        with MealDB(self.api_key, lazy=True, transport=transport) as meal_db:
+            response = meal_db.filter_by_area('Canadian')
 
+        self.assertIsInstance(response, MealList)
+        self.assertEqual(response.ids, ['52804'])
+        self.assertFalse(response.items.decoded)
+        self.assertEqual(response[0]['strMeal'], 'Poutine')
+
+    def test_compression_disabled_requests_identity(self):
+        headers = []
+
+        def handler(request):
+            headers.append(request.headers['Accept-Encoding'])
+            return httpx.Response(200, json={'meals': None})
+
+        with MealDB(self.api_key, compression=False, transport=httpx.MockTransport(handler)) as meal_db:
+            meal_db.single_random_meal()
+
+        self.assertEqual(headers, ['identity'])
+
+    # ─────────────────────────────────────────
+    # request coalescing
+    # ─────────────────────────────────────────
+    def run_concurrently(self, meal_db, call, count=8):
+        results = [None] * count
+
+        def worker(index):
+            try:
+                results[index] = call(meal_db)
+            except Exception as exc:
+                results[index] = exc
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def blocking_client(self, response, coalesce=True):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            self.started.set()
+            self.release.wait(5)
+            return response()
+
+        meal_db = MealDB(self.api_key, coalesce=coalesce, transport=httpx.MockTransport(handler))
+        self.addCleanup(meal_db.close)
+        return meal_db
+
+    def wait_for_followers(self, meal_db, count):
+        for _ in range(500):
+            if meal_db.single_flight.coalesced >= count:
+                return
+            time.sleep(0.01)
+
+    def test_concurrent_identical_calls_share_one_request(self):
+        meal_db = self.blocking_client(lambda: httpx.Response(200, json={'meals': [{'idMeal': '52772', 'strMeal': 'Arrabiata'}]}))
+        threads, results = self.run_concurrently(meal_db, lambda db: db.meal_details_by_id('52772'))
+        self.started.wait(5)
+        self.wait_for_followers(meal_db, 7)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual([result.ids for result in results], [['52772']] * 8)
+        self.assertEqual(len({id(result) for result in results}), 8)
+        meal_db.meal_details_by_id('52772')
+        self.assertEqual(len(self.requests), 2)
+
+    def test_coalesced_calls_share_the_exception(self):
+        meal_db = self.blocking_client(lambda: httpx.Response(503))
+        threads, results = self.run_concurrently(meal_db, lambda db: db.filter_by_category('Seafood'), count=4)
+        self.started.wait(5)
+        self.wait_for_followers(meal_db, 3)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(all(isinstance(result, httpx.HTTPStatusError) for result in results))
+
+    def test_random_and_disabled_coalescing_are_not_shared(self):
+        for coalesce, call in ((True, lambda db: db.single_random_meal()), (False, lambda db: db.filter_by_area('Canadian'))):
+            with self.subTest(coalesce=coalesce):
+                meal_db = self.blocking_client(lambda: httpx.Response(200, json={'meals': None}), coalesce=coalesce)
+                self.release.set()
+                threads, _ = self.run_concurrently(meal_db, call, count=3)
+                for thread in threads:
+                    thread.join()
+                self.assertEqual(len(self.requests), 3)
+
+
+PAGES = {
+    'a': [{'idMeal': '1', 'strMeal': 'Apple pie'}, {'idMeal': '2', 'strMeal': 'Arrabiata'}],
+    'b': None,
+    'c': [{'idMeal': '3', 'strMeal': 'Chili'}, {'idMeal': '1', 'strMeal': 'Apple pie'}],
+    'd': [{'idMeal': '4', 'strMeal': 'Dal'}],
+}
+
+
+class TestIterAllMeals(unittest.TestCase):
+
+    def client(self, pages=PAGES, failing=()):
+        self.requested = []
+
+        def handler(request):
+            letter = request.url.params['f']
+            self.requested.append(letter)
+            if letter in failing:
+                return httpx.Response(503)
+            return httpx.Response(200, json={'meals': pages.get(letter)})
+
+        meal_db = MealDB('1', transport=httpx.MockTransport(handler))
+        self.addCleanup(meal_db.close)
+        return meal_db
+
+    def test_yields_every_meal_once_in_letter_order(self):
+        meals = list(self.client().iter_all_meals(letters='abcd'))
+        self.assertEqual([meal['idMeal'] for meal in meals], ['1', '2', '3', '4'])
+        self.assertEqual(sorted(self.requested), ['a', 'b', 'c', 'd'])
+
+    def test_fetches_lazily_with_bounded_prefetch(self):
+        pages = {letter: [{'idMeal': letter, 'strMeal': letter}] for letter in 'abcdefgh'}
+        meals = self.client(pages).iter_all_meals(prefetch=2)
+        self.assertEqual(next(meals)['idMeal'], 'a')
+        time.sleep(0.05)
+        # The consumed letter plus two prefetched ones.
+        self.assertEqual(sorted(self.requested), ['a', 'b', 'c'])
+        meals.close()
+        time.sleep(0.05)
+        self.assertEqual(len(self.requested), 3)
+
+    def test_prefetch_zero_fetches_one_letter_at_a_time(self):
+        pages = {letter: [{'idMeal': letter, 'strMeal': letter}] for letter in 'abc'}
+        meals = self.client(pages).iter_all_meals(prefetch=0)
+        self.assertEqual(next(meals)['idMeal'], 'a')
+        time.sleep(0.05)
+        self.assertEqual(self.requested, ['a'])
+        self.assertEqual([meal['idMeal'] for meal in meals], ['b', 'c'])
+
+    def test_error_is_raised_at_its_letter(self):
+        meals = self.client(failing='c').iter_all_meals(letters='abcd')
+        self.assertEqual([next(meals)['idMeal'], next(meals)['idMeal']], ['1', '2'])
         with self.assertRaises(httpx.HTTPStatusError):
-            self.meal_db.get_ingredient_image_small('tomato')
+            next(meals)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,106 @@
+import io
+import unittest
+import httpx
+
+from py_mealdb import MealDB, AsyncMealDB
+from py_mealdb.cache import MemoryCache
+from py_mealdb.metrics import Metrics, endpoint_label
+from py_mealdb.retry import RetryPolicy
+
+BODY = b'{"meals":[{"idMeal":"52772","strMeal":"Teriyaki Chicken Casserole"}]}'
+
+
+def handler(request):
+    if request.url.params.get('a') == 'Nowhere':
+        return httpx.Response(500)
+    if request.url.params.get('c') == 'Down':
+        raise httpx.ConnectError('refused', request=request)
+    if request.url.path.startswith('/images/'):
+        return httpx.Response(200, content=b'png-bytes')
+    return httpx.Response(200, content=BODY)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = Metrics(buckets=(0.5, 60.0))
+        self.meal_db = MealDB(1, metrics=self.metrics, transport=httpx.MockTransport(handler))
+
+    def tearDown(self):
+        self.meal_db.close()
+
+    def test_endpoint_label(self):
+        self.assertEqual(endpoint_label('https://www.themealdb.com/api/json/v1/1/filter.php?a=Canadian'), 'filter.php?a')
+        self.assertEqual(endpoint_label('https://www.themealdb.com/api/json/v1/1/random.php'), 'random.php')
+        self.assertEqual(endpoint_label('https://www.themealdb.com/images/ingredients/Lime.png'), 'images/ingredients')
+
+    def test_records_requests_and_parsing(self):
+        self.meal_db.meal_details_by_id('52772')
+        self.meal_db.meal_details_by_id('52773')
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.meal_db.filter_by_area('Nowhere')
+        with self.assertRaises(httpx.ConnectError):
+            self.meal_db.filter_by_category('Down')
+        self.meal_db.get_ingredient_image('Lime', dest=io.BytesIO())
+
+        stats = self.metrics.snapshot()
+        lookup = stats['lookup.php?i']
+        self.assertEqual(lookup.statuses, {'200': 2})
+        self.assertEqual(lookup.latency_count, 2)
+        self.assertEqual(lookup.buckets, [2, 2])
+        self.assertEqual(lookup.bytes, 2 * len(BODY))
+        self.assertEqual(lookup.parses, 2)
+        self.assertGreater(lookup.decode_seconds + lookup.build_seconds, 0)
+        self.assertEqual(stats['filter.php?a'].statuses, {'500': 1})
+        self.assertEqual(stats['filter.php?c'].statuses, {'ConnectError': 1})
+        self.assertEqual(stats['images/ingredients'].bytes, len(b'png-bytes'))
+
+    def test_hooks(self):
+        started, events = [], []
+        self.metrics.before_request(started.append)
+
+        @self.metrics.after_response
+        def record(event):
+            events.append((event.endpoint, event.status, event.attempt))
+
+        self.meal_db.filter_by_area('Canadian')
+        self.assertEqual(started, ['https://www.themealdb.com/api/json/v1/1/filter.php?a=Canadian'])
+        self.assertEqual(events, [('filter.php?a', 200, 0)])
+
+    def test_retries_and_cache(self):
+        with MealDB(1, metrics=self.metrics, cache=MemoryCache(), retry=RetryPolicy(max_retries=1, backoff=0.001),
+                    transport=httpx.MockTransport(handler)) as meal_db:
+            meal_db.meal_details_by_id('52772')
+            meal_db.meal_details_by_id('52772')
+            with self.assertRaises(httpx.HTTPStatusError):
+                meal_db.filter_by_area('Nowhere')
+
+        stats = self.metrics.snapshot()
+        self.assertEqual((stats['lookup.php?i'].cache_hits, stats['lookup.php?i'].cache_misses), (1, 1))
+        self.assertEqual(stats['lookup.php?i'].parses, 2)
+        self.assertEqual((stats['filter.php?a'].statuses, stats['filter.php?a'].retries), ({'500': 2}, 1))
+
+    def test_prometheus_exposition(self):
+        self.meal_db.filter_by_area('Canadian')
+        text = self.metrics.to_prometheus()
+        self.assertIn('# TYPE mealdb_request_duration_seconds histogram\n', text)
+        self.assertIn('mealdb_requests_total{endpoint="filter.php?a",status="200"} 1\n', text)
+        self.assertIn('mealdb_request_duration_seconds_bucket{endpoint="filter.php?a",le="60"} 1\n', text)
+        self.assertIn('mealdb_request_duration_seconds_bucket{endpoint="filter.php?a",le="+Inf"} 1\n', text)
+        self.assertIn(f'mealdb_response_bytes_total{{endpoint="filter.php?a"}} {len(BODY)}\n', text)
+        self.metrics.reset()
+        self.assertNotIn('filter.php', self.metrics.to_prometheus())
+
+
+class TestAsyncMetrics(unittest.IsolatedAsyncioTestCase):
+
+    async def test_records_requests(self):
+        metrics = Metrics()
+        async with AsyncMealDB(1, metrics=metrics, transport=httpx.MockTransport(handler)) as meal_db:
+            await meal_db.meal_details_by_id('52772')
+        self.assertEqual(metrics.snapshot()['lookup.php?i'].statuses, {'200': 1})
+        self.assertEqual(metrics.snapshot()['lookup.php?i'].parses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+import httpx
+
+from unittest.mock import patch
+from py_mealdb import MealDB
+from py_mealdb.cli import main
+from py_mealdb.mirror import load_manifest, manifest_path, mirror_images
+
+
+class ImageServer:
+    """MockTransport handler serving fake PNGs with ETags and counting requests."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = []
+
+    def __call__(self, request):
+        with self.lock:
+            self.requests.append(request)
+        path = request.url.path
+        if path.endswith('/list.php'):
+            return httpx.Response(200, json={'meals': [{'strIngredient': 'Garlic'}, {'strIngredient': 'Lime'}]})
+        name = path.rsplit('/', 1)[1]
+        if name.startswith('Broken'):
+            return httpx.Response(404)
+        etag = f'"{name}"'
+        if request.headers.get('if-none-match') == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=f'png:{name}'.encode(), headers={'ETag': etag})
+
+
+class TestMirror(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dest = os.path.join(self.tmp.name, 'images')
+        self.server = ImageServer()
+        self.meal_db = MealDB(1, transport=httpx.MockTransport(self.server))
+
+    def tearDown(self):
+        self.meal_db.close()
+        self.tmp.cleanup()
+
+    def test_mirror_all_ingredients(self):
+        seen = []
+        result = mirror_images(self.meal_db, self.dest, progress=lambda name, status: seen.append((name, status)))
+
+        self.assertEqual(result.downloaded, 4)
+        self.assertEqual(sorted(os.listdir(self.dest)), [
+            'Garlic-small.png', 'Garlic.png', 'Lime-small.png', 'Lime.png', 'manifest.json',
+        ])
+        manifest = load_manifest(self.dest)
+        self.assertEqual(manifest['Lime-small.png'], {
+            'ingredient': 'Lime',
+            'small': True,
+            'size': len(b'png:Lime-Small.png'),
+            'sha256': hashlib.sha256(b'png:Lime-Small.png').hexdigest(),
+            'etag': '"Lime-Small.png"',
+        })
+        self.assertEqual(result.bytes, sum(entry['size'] for entry in manifest.values()))
+        self.assertEqual(sorted(seen), [(name, 'downloaded') for name in sorted(manifest)])
+
+    def test_resume_skips_manifest_entries(self):
+        mirror_images(self.meal_db, self.dest, ingredients=['Garlic'])
+        os.remove(os.path.join(self.dest, 'Garlic-small.png'))
+        requests = len(self.server.requests)
+
+        result = mirror_images(self.meal_db, self.dest, ingredients=['Garlic', 'Lime'], small=False)
+        self.assertEqual((result.skipped, result.downloaded), (1, 1))
+
+        result = mirror_images(self.meal_db, self.dest, ingredients=['Garlic'])
+        self.assertEqual((result.skipped, result.downloaded), (1, 1))
+        self.assertEqual(len(self.server.requests), requests + 2)
+
+    def test_revalidate_uses_etags(self):
+        mirror_images(self.meal_db, self.dest, ingredients=['Garlic'], small=False)
+        result = mirror_images(self.meal_db, self.dest, ingredients=['Garlic'], small=False, revalidate=True)
+        self.assertEqual((result.unchanged, result.downloaded), (1, 0))
+        self.assertEqual(self.server.requests[-1].headers['if-none-match'], '"Garlic.png"')
+
+    def test_failures_are_reported_and_retried(self):
+        result = mirror_images(self.meal_db, self.dest, ingredients=['Garlic', 'Broken'], small=False)
+        self.assertEqual(list(result.errors), ['Broken.png'])
+        self.assertIsInstance(result.errors['Broken.png'], httpx.HTTPStatusError)
+        with open(manifest_path(self.dest), encoding='utf-8') as file:
+            self.assertEqual(list(json.load(file)['files']), ['Garlic.png'])
+
+    def test_cli_mirror_images(self):
+        transport = httpx.MockTransport(self.server)
+        with patch('py_mealdb.cli.MealDB', lambda api_key: MealDB(api_key, transport=transport)):
+            with patch('sys.stderr'):
+                self.assertEqual(main(['mirror-images', self.dest, '--ingredient', 'Lime', '--small-only']), 0)
+                self.assertEqual(main(['mirror-images', self.dest, '--ingredient', 'Broken']), 1)
+        self.assertEqual(list(load_manifest(self.dest)), ['Lime-small.png'])
+
+
+if __name__ == '__main__':
+    unittest.main()
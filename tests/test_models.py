@@ -0,0 +1,172 @@
+import json
+import sys
+import unittest
+
+from unittest.mock import patch
+
+from py_mealdb import models
+from py_mealdb.models import Meal, MealDetails, MealList, CategoryList, LazyItems, MealColumns
+
+RAW_MEAL = {
+    'idMeal': '52772',
+    'strMeal': 'Teriyaki Chicken Casserole',
+    'strDrinkAlternate': None,
+    'strCategory': 'Chicken',
+    'strArea': 'Japanese',
+    'strInstructions': 'Preheat oven to 350° F.',
+    'strMealThumb': 'https://www.themealdb.com/images/media/meals/wvpsxx1468256321.jpg',
+    'strTags': 'Meat,Casserole',
+    'strYoutube': 'https://www.youtube.com/watch?v=4aZr5hZXP_s',
+    'strIngredient1': 'soy sauce',
+    'strIngredient2': 'water ',
+    'strIngredient3': '',
+    'strIngredient4': None,
+    'strMeasure1': '3/4 cup',
+    'strMeasure2': None,
+    'strMeasure3': ' ',
+    'strSource': '',
+}
+
+
+class TestMeal(unittest.TestCase):
+
+    def test_from_dict_drops_empty_slots(self):
+        meal = Meal.from_dict(RAW_MEAL)
+        self.assertEqual(meal.id, '52772')
+        self.assertEqual(meal.category, 'Chicken')
+        self.assertEqual(meal.ingredients, ('soy sauce', 'water'))
+        self.assertEqual(meal.measures, ('3/4 cup', ''))
+        self.assertEqual(meal.tags, ('Meat', 'Casserole'))
+        self.assertIsNone(meal.source)
+
+    def test_uses_slots(self):
+        meal = Meal.from_dict(RAW_MEAL)
+        self.assertFalse(hasattr(meal, '__dict__'))
+
+    def test_repeated_strings_are_interned(self):
+        first = Meal.from_dict(dict(RAW_MEAL, strCategory=''.join(['Chi', 'cken'])))
+        second = Meal.from_dict(dict(RAW_MEAL, strCategory=''.join(['Chic', 'ken'])))
+        self.assertIs(first.category, second.category)
+        self.assertIs(first.ingredients[0], sys.intern('soy sauce'))
+
+    def test_get_ingredients_matches_meal_details(self):
+        details = MealDetails(items=[RAW_MEAL])
+        self.assertEqual(details.to_meals()[0].get_ingredients(), details.get_ingredients())
+
+
+class TestMealList(unittest.TestCase):
+
+    def test_from_response_null(self):
+        self.assertEqual(len(MealList.from_response({'meals': None})), 0)
+
+    def test_intersect_keeps_smallest_order(self):
+        big = MealList(items=[{'idMeal': str(i)} for i in range(10)])
+        small = MealList(items=[{'idMeal': '7'}, {'idMeal': '42'}, {'idMeal': '3'}])
+        self.assertEqual(MealList.intersect([big, small]).ids, ['7', '3'])
+        self.assertEqual(len(MealList.intersect([])), 0)
+
+
+class TestColumnarMealList(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [{'strMeal': f'Meal {i}', 'strMealThumb': f'https://example.com/{i}.jpg', 'idMeal': str(i)} for i in range(10)]
+        self.meals = MealList(items=self.rows).columnar()
+
+    def test_behaves_like_list_backed(self):
+        self.assertIsInstance(self.meals.items, MealColumns)
+        self.assertEqual(len(self.meals), 10)
+        self.assertEqual(self.meals[3], self.rows[3])
+        self.assertEqual(list(self.meals), self.rows)
+        self.assertEqual(self.meals.items[2:4].id_array.tolist(), [2, 3])
+        self.assertEqual(self.meals.names, [row['strMeal'] for row in self.rows])
+        self.assertEqual(self.meals, MealList(items=self.rows))
+        self.assertIs(self.meals.columnar(), self.meals)
+
+    def test_views_are_cached(self):
+        self.assertIs(self.meals.ids, self.meals.ids)
+        self.assertEqual(self.meals.ids, [str(i) for i in range(10)])
+
+    def test_from_columns(self):
+        meals = MealList.from_columns(['7', 42], ['A', 'B'], [None, 't'])
+        self.assertEqual(meals.ids, ['7', '42'])
+        self.assertEqual(meals.thumbnails, [None, 't'])
+        with self.assertRaises(ValueError):
+            MealList.from_columns(['1'], [], [])
+
+    def test_set_operations(self):
+        other = MealList.from_columns(['7', '42', '3'], ['A', 'B', 'C'], [None] * 3)
+        for numpy in (models.numpy, None):
+            with self.subTest(numpy=numpy is not None), patch.object(models, 'numpy', numpy):
+                common = MealList.intersect([self.meals, other])
+                self.assertIsInstance(common.items, MealColumns)
+                self.assertEqual(common.ids, ['7', '3'])
+                self.assertEqual(MealList.union([other, self.meals]).ids, ['7', '42', '3', '0', '1', '2', '4', '5', '6', '8', '9'])
+        self.assertEqual(self.meals.isin(['3', 99]), [True, False])
+        self.assertEqual(MealList.intersect([self.meals, MealList(items=self.rows[:2])]).ids, ['0', '1'])
+        self.assertEqual(MealList(items=self.rows).isin(['3', 99]), [True, False])
+
+
+
+class TestLazyModels(unittest.TestCase):
+
+    RAW = json.dumps({'meals': [
+        {'strMeal': 'Chicken "Curry"', 'strMealThumb': None, 'idMeal': '1'},
+        {'strMeal': 'Crème brûlée', 'strMealThumb': 'https://example.com/2.jpg', 'idMeal': '2'},
+    ]}, ensure_ascii=False).encode()
+
+    def test_columns_do_not_decode_items(self):
+        meals = MealList.from_bytes(self.RAW)
+        self.assertIsInstance(meals.items, LazyItems)
+        self.assertEqual(meals.ids, ['1', '2'])
+        self.assertEqual(meals.names, ['Chicken "Curry"', 'Crème brûlée'])
+        self.assertEqual(meals.thumbnails, [None, 'https://example.com/2.jpg'])
+        self.assertFalse(meals.items.decoded)
+
+    def test_items_decode_on_first_access(self):
+        meals = MealList.from_bytes(self.RAW)
+        self.assertEqual(meals[1]['idMeal'], '2')
+        self.assertTrue(meals.items.decoded)
+        self.assertEqual(len(meals), 2)
+        self.assertEqual([meal['idMeal'] for meal in meals], ['1', '2'])
+        self.assertEqual(meals.names, ['Chicken "Curry"', 'Crème brûlée'])
+
+    def test_matches_eager_models(self):
+        raw = json.dumps({'meals': [RAW_MEAL, dict(RAW_MEAL, idMeal='2', strCategory='Beef')]}).encode()
+        lazy = MealDetails.from_bytes(raw)
+        eager = MealDetails.from_response(json.loads(raw))
+        self.assertEqual(lazy.categories, eager.categories)
+        self.assertEqual(lazy.get_ingredients(1), eager.get_ingredients(1))
+
+    def test_null_and_other_keys(self):
+        self.assertEqual(len(MealDetails.from_bytes(b'{"meals":null}')), 0)
+        self.assertEqual(MealList.from_bytes(b'{"meals":null}').ids, [])
+        categories = CategoryList.from_bytes(b'{"categories":[{"strCategory":"Beef"}]}', key='categories')
+        self.assertEqual(categories.categories, ['Beef'])
+
+    def test_columns_fall_back_to_full_decode(self):
+        numbers = MealList.from_bytes(b'{"meals":[{"idMeal":"1"},{"idMeal":2},{"idMeal":"3"}]}')
+        self.assertEqual(numbers.ids, ['1', 2, '3'])
+        self.assertTrue(numbers.items.decoded)
+
+        missing = MealList.from_bytes(b'{"meals":[{"strMeal":"A"},{"idMeal":"2"},{"strMeal":"C"}]}')
+        with self.assertRaises(KeyError):
+            missing.names
+
+    def test_meal_columns_from_bytes(self):
+        columns = MealColumns.from_bytes(self.RAW)
+        self.assertEqual(list(columns.id_array), [1, 2])
+        self.assertEqual(columns.names, ('Chicken "Curry"', 'Crème brûlée'))
+        self.assertEqual(columns.thumbnails, (None, 'https://example.com/2.jpg'))
+
+        partial = MealColumns.from_bytes(b'{"meals":[{"idMeal":"7","strMeal":"A"}]}')
+        self.assertEqual(partial[0], {'strMeal': 'A', 'strMealThumb': None, 'idMeal': '7'})
+        self.assertEqual(len(MealColumns.from_bytes(b'{"meals":null}')), 0)
+
+    def test_columns_are_cached(self):
+        meals = MealList.from_bytes(self.RAW)
+        names = meals.names
+        meals.items.raw = b''
+        self.assertIs(meals.names, names)
+
+if __name__ == '__main__':
+    unittest.main()
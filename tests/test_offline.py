@@ -0,0 +1,110 @@
+import json
+import os
+import tempfile
+import unittest
+import httpx
+
+from py_mealdb import MealDB
+from py_mealdb.models import MealDetails, MealList, CategoryList, AreaList, IngredientList
+from py_mealdb.offline import OfflineMealDB, HybridMealDB
+
+MEALS = [
+    {
+        'idMeal': '52771', 'strMeal': 'Spicy Arrabiata Penne', 'strCategory': 'Vegetarian',
+        'strArea': 'Italian', 'strMealThumb': 'https://example.com/1.jpg',
+        'strIngredient1': 'penne rigate', 'strIngredient2': 'Garlic', 'strIngredient3': '',
+    },
+    {
+        'idMeal': '52802', 'strMeal': 'Fish pie', 'strCategory': 'Seafood',
+        'strArea': 'British', 'strMealThumb': 'https://example.com/2.jpg',
+        'strIngredient1': 'Garlic', 'strIngredient2': 'Salmon', 'strIngredient3': None,
+    },
+    {
+        'idMeal': '52959', 'strMeal': 'Baked salmon with fennel & tomatoes', 'strCategory': 'Seafood',
+        'strArea': 'Italian', 'strMealThumb': 'https://example.com/3.jpg',
+        'strIngredient1': 'Salmon', 'strIngredient2': 'salmon',
+    },
+]
+
+
+class TestOfflineMealDB(unittest.TestCase):
+
+    def setUp(self):
+        self.meal_db = OfflineMealDB(MEALS)
+
+    def test_from_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'catalog.jsonl')
+            with open(path, 'w', encoding='utf-8') as file:
+                for meal in MEALS + MEALS[:1]:
+                    file.write(json.dumps(meal) + '\n')
+            self.assertEqual(len(OfflineMealDB.from_snapshot(path)), 3)
+
+    def test_get_meal_by_name(self):
+        response = self.meal_db.get_meal_by_name('salmon')
+        self.assertIsInstance(response, MealDetails)
+        self.assertEqual(response.ids, ['52959'])
+        self.assertEqual(len(self.meal_db.get_meal_by_name('nothing')), 0)
+
+    def test_meal_details_by_id(self):
+        self.assertEqual(self.meal_db.meal_details_by_id('52802').names, ['Fish pie'])
+        self.assertEqual(len(self.meal_db.meal_details_by_id('1')), 0)
+        details = self.meal_db.meal_details_by_ids(['52959', '1', '52771', '52959'])
+        self.assertEqual(details.ids, ['52959', '52771'])
+        self.assertIsInstance(details.errors['1'], LookupError)
+
+    def test_filters(self):
+        by_ingredient = self.meal_db.filter_by_ingredient('garlic')
+        self.assertIsInstance(by_ingredient, MealList)
+        self.assertEqual(by_ingredient.ids, ['52771', '52802'])
+        self.assertEqual(self.meal_db.filter_by_ingredient('Salmon').ids, ['52802', '52959'])
+        self.assertEqual(self.meal_db.filter_by_category('Seafood').names, ['Fish pie', 'Baked salmon with fennel & tomatoes'])
+        self.assertEqual(self.meal_db.filter_by_area('Italian').thumbnails, ['https://example.com/1.jpg', 'https://example.com/3.jpg'])
+        self.assertEqual(len(self.meal_db.filter_by_area('Nowhere')), 0)
+
+    def test_find_meals(self):
+        self.assertEqual(self.meal_db.find_meals(ingredients=['garlic'], category='Seafood').ids, ['52802'])
+        self.assertEqual(self.meal_db.find_meals(ingredients=['Salmon'], area='Italian').ids, ['52959'])
+        self.assertEqual(len(self.meal_db.find_meals(ingredients=['Garlic', 'Salmon'], area='Italian')), 0)
+
+    def test_list_all(self):
+        response = self.meal_db.list_all()
+        self.assertIsInstance(response['categories'], CategoryList)
+        self.assertIsInstance(response['areas'], AreaList)
+        self.assertIsInstance(response['ingredients'], IngredientList)
+        self.assertEqual(response['categories'].categories, ['Seafood', 'Vegetarian'])
+        self.assertEqual(response['areas'].areas, ['British', 'Italian'])
+        self.assertEqual(response['ingredients'].ingredients, ['Garlic', 'Salmon', 'penne rigate'])
+        self.assertEqual(self.meal_db.list_all_meals('F').ids, ['52802'])
+
+    def test_iter_all_meals(self):
+        self.assertEqual([meal['idMeal'] for meal in self.meal_db.iter_all_meals()], ['52959', '52802', '52771'])
+        self.assertEqual([meal['idMeal'] for meal in self.meal_db.iter_all_meals(letters='sx')], ['52771'])
+
+    def test_single_random_meal(self):
+        self.assertIn(self.meal_db.single_random_meal().ids[0], self.meal_db.meals)
+
+
+class TestHybridMealDB(unittest.TestCase):
+
+    def test_routes_per_call(self):
+        calls = []
+
+        def handler(request):
+            calls.append(str(request.url))
+            return httpx.Response(200, json={'meals': [{'idMeal': '1', 'strMeal': 'Live', 'strMealThumb': 't'}]})
+
+        with MealDB(1, transport=httpx.MockTransport(handler)) as live:
+            meal_db = HybridMealDB(live, OfflineMealDB(MEALS))
+            self.assertEqual(meal_db.filter_by_area('Italian').ids, ['52771', '52959'])
+            self.assertEqual(calls, [])
+            self.assertEqual(meal_db.filter_by_area('Italian', offline=False).names, ['Live'])
+            self.assertEqual(len(calls), 1)
+
+            meal_db.prefer_offline = False
+            self.assertEqual(meal_db.meal_details_by_id('52771').names, ['Live'])
+            self.assertEqual(meal_db.meal_details_by_id('52771', offline=True).names, ['Spicy Arrabiata Penne'])
+
+
+if __name__ == '__main__':
+    unittest.main()
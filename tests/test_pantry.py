@@ -0,0 +1,94 @@
+import random
+import unittest
+
+from unittest.mock import patch
+
+from py_mealdb import pantry
+from py_mealdb.models import MealDetails
+from py_mealdb.offline import OfflineMealDB
+from py_mealdb.pantry import PantryIndex, PantryMatch
+
+
+def meal(id, name, *ingredients):
+    item = {'idMeal': id, 'strMeal': name}
+    for i, ingredient in enumerate(ingredients, 1):
+        item[f'strIngredient{i}'] = ingredient
+        item[f'strMeasure{i}'] = '1'
+    return item
+
+
+MEALS = [
+    meal('1', 'Chicken rice', 'Chicken', 'Rice', 'Salt'),
+    meal('2', 'Chicken curry', 'Chicken', 'Onion', 'Garlic', 'Curry Powder', 'Rice'),
+    meal('3', 'Garlic bread', 'Bread', 'garlic ', 'Butter'),
+    meal('4', 'Salted water', 'Salt', 'Water'),
+    meal('5', 'Crème brûlée', 'Crème Fraîche', 'Sugar', 'Eggs', ''),
+]
+
+
+class TestPantryIndex(unittest.TestCase):
+
+    def backends(self):
+        for numpy in (pantry.numpy, None):
+            with self.subTest(numpy=numpy is not None), patch.object(pantry, 'numpy', numpy):
+                yield PantryIndex.from_catalog(OfflineMealDB(MEALS), aliases={'spring onions': 'onion'})
+
+    def test_build(self):
+        index = PantryIndex.from_details(MealDetails(items=MEALS))
+        self.assertEqual(len(index), 5)
+        self.assertEqual(index.ingredients[:5], ['Chicken', 'Rice', 'Salt', 'Onion', 'Garlic'])
+        self.assertEqual(len(index.ingredients), 12)
+
+    def test_rank(self):
+        for index in self.backends():
+            results = index.rank(['chicken', 'RICE', 'garlic', 'unknown'])
+            self.assertEqual([m.id for m in results], ['1', '2', '3'])
+            self.assertEqual(results[0], PantryMatch('1', 'Chicken rice', 2 / 3, ('Chicken', 'Rice'), ('Salt',)))
+            self.assertEqual(results[1].missing, ('Onion', 'Curry Powder'))
+            self.assertEqual(results[2].have, ('Garlic',))
+            self.assertEqual([m.id for m in index.rank(['chicken', 'rice', 'garlic'], k=2)], ['1', '2'])
+
+    def test_staples(self):
+        for index in self.backends():
+            results = index.rank(['chicken', 'rice'], staples=['salt', 'water'])
+            # Staples are never missing, and a meal of staples only is not a match.
+            self.assertEqual(results[0], PantryMatch('1', 'Chicken rice', 1.0, ('Chicken', 'Rice'), ()))
+            self.assertEqual([m.id for m in results], ['1', '2'])
+            # A staple that is also in the pantry counts as matched.
+            self.assertEqual(index.rank(['salt'], staples=['salt'])[0].have, ('Salt',))
+
+    def test_aliases_and_normalization(self):
+        for index in self.backends():
+            self.assertEqual(index.rank(['Spring Onions'])[0].have, ('Onion',))
+            self.assertEqual(index.rank(['creme fraiche', 'sugar', 'eggs'])[0].score, 1.0)
+
+    def test_rank_many(self):
+        for index in self.backends():
+            results = index.rank_many([['bread'], [], ['water']], k=1)
+            self.assertEqual([[m.id for m in ranked] for ranked in results], [['3'], [], ['4']])
+
+    @unittest.skipIf(pantry.numpy is None, 'numpy is not installed')
+    def test_backends_agree_on_ties(self):
+        rng = random.Random(0)
+        for trial in range(100):
+            catalog = [
+                meal(str(i), f'Meal {i}', 'Chicken', *rng.sample(['X1', 'X2', 'X3', 'X4'], rng.randint(0, 2)))
+                for i in range(40)
+            ]
+            k = rng.randint(1, 10)
+            ranked = []
+            for numpy in (pantry.numpy, None):
+                with patch.object(pantry, 'numpy', numpy):
+                    index = PantryIndex.from_details(MealDetails(items=catalog))
+                    ranked.append([m.id for m in index.rank(['chicken', 'x1'], k)])
+            with self.subTest(trial=trial):
+                self.assertEqual(ranked[0], ranked[1])
+
+    def test_empty_catalog(self):
+        for numpy in (pantry.numpy, None):
+            with self.subTest(numpy=numpy is not None), patch.object(pantry, 'numpy', numpy):
+                self.assertEqual(PantryIndex([]).rank(['salt']), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
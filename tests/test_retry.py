@@ -0,0 +1,137 @@
+import io
+import time
+import unittest
+import httpx
+
+from unittest.mock import patch
+from py_mealdb import MealDB, AsyncMealDB
+from py_mealdb.retry import RateLimiter, RetryPolicy, retry_after
+
+
+def flaky(*responses):
+    """Return a handler replaying ``responses`` (Response factories or exceptions), then 200s."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        outcome = responses[len(requests) - 1] if len(requests) <= len(responses) else 200
+        if isinstance(outcome, type) and issubclass(outcome, Exception):
+            raise outcome('boom', request=request)
+        if isinstance(outcome, httpx.Response):
+            return outcome
+        return httpx.Response(outcome, json={'meals': [{'idMeal': '1', 'strMeal': 'Pie'}]})
+
+    return handler, requests
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_burst_then_waits(self):
+        limiter = RateLimiter(10, burst=3)
+        self.assertEqual([limiter.reserve() for _ in range(3)], [0.0] * 3)
+        self.assertAlmostEqual(limiter.reserve(), 0.1, delta=0.02)
+        self.assertAlmostEqual(limiter.reserve(), 0.2, delta=0.02)
+
+    def test_acquire_paces_requests(self):
+        limiter = RateLimiter(50, burst=1)
+        started = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after(httpx.Response(429, headers={'Retry-After': '7'})), 7.0)
+        self.assertEqual(retry_after(httpx.Response(429, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})), 0.0)
+        self.assertIsNone(retry_after(httpx.Response(429, headers={'Retry-After': 'soon'})))
+        self.assertIsNone(retry_after(httpx.Response(429)))
+
+    def test_delays(self):
+        policy = RetryPolicy(max_retries=2, backoff=1, max_backoff=3)
+        for attempt in (0, 1, 1):
+            self.assertLessEqual(policy.delay(attempt, 0, response=httpx.Response(503)), 2 ** attempt)
+        self.assertIsNone(policy.delay(2, 0, response=httpx.Response(503)))
+        self.assertIsNone(policy.delay(0, 0, response=httpx.Response(404)))
+        self.assertIsNone(policy.delay(0, 0, error=ValueError()))
+        self.assertIsNotNone(policy.delay(0, 0, error=httpx.ConnectTimeout('slow')))
+        self.assertEqual(policy.delay(0, 0, response=httpx.Response(429, headers={'Retry-After': '5'})), 5)
+        self.assertIsNone(RetryPolicy(max_wait=1).delay(0, 0, response=httpx.Response(429, headers={'Retry-After': '5'})))
+        self.assertIsNone(RetryPolicy(max_elapsed=10).delay(0, 9.5, response=httpx.Response(429, headers={'Retry-After': '1'})))
+
+        stats = policy.stats()
+        self.assertEqual((stats.retries, stats.throttled, stats.gave_up), (5, 1, 1))
+
+
+class TestClientRetries(unittest.TestCase):
+
+    def client(self, handler, **kwargs):
+        meal_db = MealDB(1, transport=httpx.MockTransport(handler), **kwargs)
+        self.addCleanup(meal_db.close)
+        return meal_db
+
+    def test_retries_transient_failures(self):
+        handler, requests = flaky(503, httpx.Response(429, headers={'Retry-After': '0'}), httpx.ConnectError)
+        policy = RetryPolicy(backoff=0.001)
+        meal_db = self.client(handler, retry=policy)
+        self.assertEqual(meal_db.meal_details_by_id('1').ids, ['1'])
+        self.assertEqual(len(requests), 4)
+        self.assertEqual((policy.stats().retries, policy.stats().throttled), (3, 1))
+
+    def test_gives_up(self):
+        handler, requests = flaky(503, 503, 503)
+        policy = RetryPolicy(max_retries=2, backoff=0.001)
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.client(handler, retry=policy).filter_by_area('Canadian')
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(policy.stats().gave_up, 1)
+
+        handler, requests = flaky(httpx.Response(429, headers={'Retry-After': '3600'}))
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.client(handler, retry=RetryPolicy()).filter_by_area('Canadian')
+        self.assertEqual(len(requests), 1)
+
+    def test_no_retry_by_default(self):
+        handler, requests = flaky(503)
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.client(handler).filter_by_area('Canadian')
+        self.assertEqual(len(requests), 1)
+
+    def test_image_downloads_are_retried(self):
+        handler, requests = flaky(502)
+        meal_db = self.client(handler, retry=RetryPolicy(backoff=0.001))
+        sink = io.BytesIO()
+        self.assertTrue(meal_db.get_ingredient_image('Lime', dest=sink))
+        self.assertEqual(len(requests), 2)
+        self.assertIn(b'Pie', sink.getvalue())
+
+    def test_rate_limiter_is_applied(self):
+        handler, requests = flaky()
+        limiter = RateLimiter(1000, burst=2)
+        with patch.object(limiter, 'acquire', wraps=limiter.acquire) as acquire:
+            meal_db = self.client(handler, rate_limiter=limiter, coalesce=False)
+            meal_db.filter_by_area('Canadian')
+            meal_db.filter_by_category('Seafood')
+        self.assertEqual(acquire.call_count, 2)
+
+
+class TestAsyncClientRetries(unittest.IsolatedAsyncioTestCase):
+
+    async def test_retries_and_rate_limit(self):
+        handler, requests = flaky(500, httpx.ReadTimeout)
+        limiter = RateLimiter(1000, burst=1)
+        async with AsyncMealDB(1, transport=httpx.MockTransport(handler), rate_limiter=limiter,
+                               retry=RetryPolicy(backoff=0.001)) as meal_db:
+            response = await meal_db.meal_details_by_id('1')
+        self.assertEqual(response.ids, ['1'])
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(meal_db.retry.stats().retries, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from py_mealdb import similarity
+from py_mealdb.models import MealDetails
+from py_mealdb.offline import OfflineMealDB
+from py_mealdb.similarity import SimilarityIndex, meal_features
+
+
+def meal(id, category, area, tags, *ingredients):
+    item = {'idMeal': id, 'strMeal': f'Meal {id}', 'strCategory': category, 'strArea': area, 'strTags': tags}
+    for i, ingredient in enumerate(ingredients, 1):
+        item[f'strIngredient{i}'] = ingredient
+    return item
+
+
+MEALS = [
+    meal('1', 'Chicken', 'Indian', 'Curry,Spicy', 'Chicken', 'Garam Masala', 'Onion', 'Salt'),
+    meal('2', 'Chicken', 'Indian', 'Curry', 'Chicken', 'Garam Masala', 'Tomato', 'Salt'),
+    meal('3', 'Dessert', 'French', None, 'Sugar', 'Eggs', 'Cream', 'Salt'),
+    meal('4', 'Dessert', 'British', 'Baking', 'Sugar', 'Eggs', 'Flour', 'Butter'),
+    meal('5', 'Beef', 'Indian', None, 'Beef', 'Garam Masala', 'Onion'),
+    meal('6', None, None, None),
+]
+
+
+@unittest.skipUnless(similarity.numpy is not None, 'requires numpy')
+class TestSimilarityIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SimilarityIndex.build(OfflineMealDB(MEALS), k=3)
+
+    def test_features(self):
+        details = MealDetails(items=MEALS)
+        self.assertEqual(
+            meal_features(details, 0, ('ingredient', 'area', 'tag')),
+            ['ingredient:chicken', 'ingredient:garam masala', 'ingredient:onion', 'ingredient:salt',
+             'area:indian', 'tag:curry', 'tag:spicy'],
+        )
+        self.assertEqual(meal_features(details, 5, ('ingredient', 'category', 'area', 'tag')), [])
+
+    def test_neighbours(self):
+        self.assertEqual(len(self.index), 6)
+        similar = self.index.similar('1')
+        self.assertEqual([id for id, _ in similar], ['2', '5', '3'])
+        self.assertTrue(all(a[1] >= b[1] for a, b in zip(similar, similar[1:])))
+        self.assertTrue(0 < similar[-1][1] < similar[0][1] <= 1)
+        self.assertEqual([id for id, _ in self.index.similar('3', limit=1)], ['4'])
+        self.assertEqual(self.index.similar('6'), [])
+        self.assertEqual(self.index.similar('unknown'), [])
+        self.assertIn(1, self.index)
+
+    def test_idf_downweights_common_ingredients(self):
+        index = SimilarityIndex.build(MealDetails(items=MEALS), k=5, features=('ingredient',))
+        # Meal 3 shares only salt with meal 1, but sugar and eggs with meal 4.
+        scores = dict(index.similar('3'))
+        self.assertGreater(scores['4'], scores['1'])
+        self.assertNotIn('5', scores)
+
+    def test_batches_match(self):
+        batched = SimilarityIndex.build(OfflineMealDB(MEALS), k=3, batch_size=2)
+        self.assertEqual(batched.neighbours, self.index.neighbours)
+
+    def test_ties_in_catalog_order(self):
+        meals = [meal(str(i), None, None, None, 'Salt') for i in range(200)]
+        index = SimilarityIndex.build(MealDetails(items=meals), k=5, batch_size=64)
+        self.assertEqual([id for id, _ in index.similar('0')], ['1', '2', '3', '4', '5'])
+        self.assertEqual([id for id, _ in index.similar('3')], ['0', '1', '2', '4', '5'])
+        self.assertEqual([id for id, _ in index.similar('199')], ['0', '1', '2', '3', '4'])
+
+    def test_weights(self):
+        index = SimilarityIndex.build(OfflineMealDB(MEALS), k=1, weights={'ingredient': 0, 'tag': 0, 'category': 0})
+        self.assertEqual(index.similar('5'), [('1', 1.0)])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'neighbours.json')
+            self.index.save(path)
+            loaded = SimilarityIndex.load(path)
+        self.assertEqual(loaded.k, 3)
+        self.assertEqual(loaded.neighbours, self.index.neighbours)
+
+    def test_invalid_feature(self):
+        with self.assertRaises(ValueError):
+            SimilarityIndex.build(OfflineMealDB(MEALS), features=('colour',))
+
+
+class TestSimilarityWithoutNumpy(unittest.TestCase):
+
+    def test_build_requires_numpy(self):
+        with patch.object(similarity, 'numpy', None), self.assertRaises(ImportError):
+            SimilarityIndex.build(OfflineMealDB(MEALS))
+
+    def test_load_without_numpy(self):
+        with tempfile.TemporaryDirectory() as tmp, patch.object(similarity, 'numpy', None):
+            path = os.path.join(tmp, 'neighbours.json')
+            SimilarityIndex({'1': [('2', 0.5)]}, k=1).save(path)
+            self.assertEqual(SimilarityIndex.load(path).similar('1'), [('2', 0.5)])
+
+
+if __name__ == '__main__':
+    unittest.main()